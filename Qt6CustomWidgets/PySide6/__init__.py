@@ -1,8 +1,37 @@
 __version__ = '1.1'
 
 
-from .buttons import ToggleButtonAnimated
-from .dataVisualization import GraphicWidget
-from .devTools import QtHandlers, DialogLogger, PlainTextEditHandler
-from .progressBars import ProgressBar
+from importlib import import_module
 
+
+# the public names by subpackage, imported at the first access (see __getattr__):
+# QtCharts is loaded only when a widget of dataVisualization is used
+_LAZY_NAMES = {
+	"ToggleButtonAnimated": ".buttons",
+	"GraphicWidget": ".dataVisualization",
+	"Dashboard": ".dataVisualization",
+	"QtHandlers": ".devTools",
+	"DialogLogger": ".devTools",
+	"PlainTextEditHandler": ".devTools",
+	"ProgressBar": ".progressBars",
+	"ProgressModel": ".progressBars",
+	"ProgressBarDelegate": ".progressBars",
+}
+_SUBPACKAGES = ("buttons", "dataVisualization", "devTools", "progressBars")
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+	"""Import a public name or a subpackage at its first access."""
+	if name in _SUBPACKAGES:
+		return import_module(f".{name}", __name__)
+	if name not in _LAZY_NAMES:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(import_module(_LAZY_NAMES[name], __name__), name)
+	globals()[name] = value  # the next accesses don't call __getattr__
+	return value
+
+
+def __dir__():
+	return sorted(set(globals()) | set(_LAZY_NAMES) | set(_SUBPACKAGES))
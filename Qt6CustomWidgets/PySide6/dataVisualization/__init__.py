@@ -1 +1,5 @@
-from .graphicWidget import GraphicWidget
\ No newline at end of file
+from .graphicWidget import GraphicWidget
+from .arrayTableModel import ArrayTableModel
+from .dashboard import Dashboard
+from .memmapSource import MemmapSource
+from .pyramidIndex import PyramidIndex
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+A table model over column arrays, to map the points of a series with a QVXYModelMapper
+without a copy of data in Python objects.
+"""
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class ArrayTableModel(QAbstractTableModel):
+	"""A read-only table model where each column is an array (numpy array, array('d'), ...).
+	The arrays are used as is: modify them in place and call `notify_changed`
+	(or use `set_values`) to refresh the views and the series mapped on the model.
+
+	Public Methods
+	--------------
+	column
+		Return the array of a column
+	set_values
+		Write values in a column and notify the changed rows
+	notify_changed
+		Emit dataChanged for a range of rows
+	set_columns
+		Replace all the arrays of the model
+	"""
+
+	def __init__(self, columns: list, headers: list = None, parent=None):
+		"""Initialize an ArrayTableModel
+
+		Parameters
+		---------
+		columns : List[Union[numpy.ndarray, array.array]]
+			The arrays of the columns, with the same size
+		OPTIONAL[headers] : List[str]
+			The headers of the columns
+			Default: None
+		OPTIONAL[parent] : QObject
+			The parent of the model
+			Default: None
+		"""
+		super(ArrayTableModel, self).__init__(parent)
+		self._columns = list(columns)
+		self._headers = list(headers) if headers is not None else None
+		self._rows = min((len(column) for column in self._columns), default=0)
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else self._rows
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._columns)
+
+	def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+		if role == Qt.DisplayRole or role == Qt.EditRole:
+			return float(self._columns[index.column()][index.row()])
+		return None
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+		if role != Qt.DisplayRole:
+			return None
+		if orientation == Qt.Horizontal and self._headers is not None:
+			return self._headers[section]
+		return str(section)
+
+	def column(self, column: int):
+		"""Return the array of a column.
+
+		Parameters
+		---------
+		column : int
+			The index of the column
+
+		Returns
+		-------
+		array : Union[numpy.ndarray, array.array]
+			The array of the column (not a copy)
+		"""
+		return self._columns[column]
+
+	def set_values(self, column: int, first_row: int, values):
+		"""Write values in a column, from the row first_row, and emit dataChanged for these rows only.
+
+		Parameters
+		---------
+		column : int
+			The index of the column
+		first_row : int
+			The first row to write
+		values : Sequence[float]
+			The new values
+
+		Returns
+		-------
+		None
+		"""
+		last_row = first_row + len(values) - 1
+		self._columns[column][first_row:last_row + 1] = values
+		self.notify_changed(first_row, last_row, column, column)
+
+	def notify_changed(self, first_row: int, last_row: int, first_column: int = 0, last_column: int = None):
+		"""Emit dataChanged for a range of rows, after a modification in place of the arrays.
+
+		Parameters
+		---------
+		first_row : int
+			The first row changed
+		last_row : int
+			The last row changed (included)
+		OPTIONAL[first_column] : int
+			The first column changed
+			Default: 0
+		OPTIONAL[last_column] : int
+			The last column changed (included)
+			Default: the last column
+
+		Returns
+		-------
+		None
+		"""
+		if last_column is None:
+			last_column = len(self._columns) - 1
+		self.dataChanged.emit(self.index(first_row, first_column), self.index(last_row, last_column), [Qt.DisplayRole])
+
+	def set_columns(self, columns: list, headers: list = None):
+		"""Replace all the arrays of the model (the model is reset).
+
+		Parameters
+		---------
+		columns : List[Union[numpy.ndarray, array.array]]
+			The arrays of the columns, with the same size
+		OPTIONAL[headers] : List[str]
+			The headers of the columns
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		self.beginResetModel()
+		self._columns = list(columns)
+		if headers is not None:
+			self._headers = list(headers)
+		self._rows = min((len(column) for column in self._columns), default=0)
+		self.endResetModel()
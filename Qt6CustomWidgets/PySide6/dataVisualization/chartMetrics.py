@@ -0,0 +1,195 @@
+"""
+The instrumentation of GraphicWidget: timings of the hot paths, the paint of the QChartView and a HUD.
+"""
+
+import time
+from functools import wraps
+
+from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import Qt
+
+
+def new_metrics() -> dict:
+	"""Return empty metrics.
+
+	Returns
+	-------
+	metrics : dict
+		"timings": Dict[str, Dict[str, float]], the calls, the total, the last and the maximum duration (ms) by name,
+		"points": Dict[str, int], the number of points (bars or slices) by series,
+		"fps": float, the paints of the chart by second during the last interval
+	"""
+	return {"timings": {}, "points": {}, "fps": 0.}
+
+
+def record_timing(metrics: dict, name: str, duration: float):
+	"""Add a duration to the timings of metrics.
+
+	Parameters
+	---------
+	metrics : dict
+		The metrics (see `new_metrics`)
+	name : str
+		The name of the timing
+	duration : float
+		The duration in milliseconds
+
+	Returns
+	-------
+	None
+	"""
+	timing = metrics["timings"].get(name)
+	if timing is None:
+		metrics["timings"][name] = {"calls": 1, "total_ms": duration, "last_ms": duration, "max_ms": duration}
+	else:
+		timing["calls"] += 1
+		timing["total_ms"] += duration
+		timing["last_ms"] = duration
+		timing["max_ms"] = max(timing["max_ms"], duration)
+
+
+def timed(method, metrics: dict, name: str):
+	"""Return a wrapper of method which records the duration of each call in metrics.
+
+	Parameters
+	---------
+	method : Callable
+		The method (bound) to time
+	metrics : dict
+		The metrics (see `new_metrics`)
+	name : str
+		The name of the timing
+
+	Returns
+	-------
+	wrapper : Callable
+		The wrapper of method
+	"""
+	@wraps(method)
+	def wrapper(*args, **kwargs):
+		start = time.perf_counter()
+		try:
+			return method(*args, **kwargs)
+		finally:
+			record_timing(metrics, name, (time.perf_counter() - start) * 1000)
+	return wrapper
+
+
+def format_metrics(metrics: dict) -> str:
+	"""Return the metrics in text, a line by timing.
+
+	Parameters
+	---------
+	metrics : dict
+		The metrics (see `new_metrics`)
+
+	Returns
+	-------
+	text : str
+		The metrics formatted
+	"""
+	points = sum(metrics["points"].values())
+	lines = [f"{metrics['fps']:.1f} fps, {points} points in {len(metrics['points'])} series"]
+	for name, timing in metrics["timings"].items():
+		lines.append(f"{name}: {timing['last_ms']:.2f} ms (max {timing['max_ms']:.2f} ms, {timing['calls']} calls)")
+	return "\n".join(lines)
+
+
+class PaintTimer:
+	"""Record the duration of the paint events of a widget (the QChartView of a GraphicWidget).
+	The paintEvent of the widget is replaced by a wrapper on the instance (as `timed`) which times the original paintEvent.
+
+	Public Attributes
+	-----------------
+	paints : int
+		The number of paints since the last reset
+	area : int
+		The area repainted (the sum of the rectangles of the paint events) in pixels, since the creation
+
+	Public Methods
+	--------------
+	install
+	remove
+	"""
+
+	def __init__(self, metrics: dict, name: str = "paint"):
+		"""Initialize a PaintTimer
+
+		Parameters
+		---------
+		metrics : dict
+			The metrics where the durations are recorded (see `new_metrics`)
+		OPTIONAL[name] : str
+			The name of the timing
+			Default: "paint"
+		"""
+		self.paints = 0
+		self.area = 0
+		self._metrics = metrics
+		self._name = name
+		self._widget = None
+
+	def install(self, widget):
+		"""Time the paint events of a widget (the former widget is no longer timed).
+
+		Parameters
+		---------
+		widget : QWidget
+			The widget which paints (for a QAbstractScrollArea, the area itself: it paints the events of its viewport)
+
+		Returns
+		-------
+		None
+		"""
+		self.remove()
+		paint_event = widget.paintEvent
+
+		def wrapper(event):
+			rect = event.rect()
+			self.area += rect.width() * rect.height()
+			start = time.perf_counter()
+			try:
+				paint_event(event)
+			finally:
+				record_timing(self._metrics, self._name, (time.perf_counter() - start) * 1000)
+				self.paints += 1
+		widget.paintEvent = wrapper
+		self._widget = widget
+
+	def remove(self):
+		"""Stop to time the paint events of the widget.
+
+		Returns
+		-------
+		None
+		"""
+		if self._widget is not None:
+			self._widget.__dict__.pop("paintEvent", None)
+			self._widget = None
+
+
+class MetricsHud(QLabel):
+	"""A translucent label over a widget which displays metrics (see `format_metrics`).
+	It's transparent for the mouse."""
+
+	def __init__(self, parent=None):
+		super(MetricsHud, self).__init__(parent)
+		self.setAttribute(Qt.WA_TransparentForMouseEvents)
+		self.setStyleSheet("background-color: rgba(0, 0, 0, 150); color: white; font-family: monospace; padding: 4px;")
+		self.move(4, 4)
+
+	def set_metrics(self, metrics: dict):
+		"""Display metrics.
+
+		Parameters
+		---------
+		metrics : dict
+			The metrics (see `new_metrics`)
+
+		Returns
+		-------
+		None
+		"""
+		self.setText(format_metrics(metrics))
+		self.adjustSize()
+		self.raise_()
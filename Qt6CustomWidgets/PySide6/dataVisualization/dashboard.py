@@ -0,0 +1,397 @@
+"""
+A scrollable dashboard of GraphicWidget sharing the same time column and the same time range.
+"""
+
+from PySide6.QtWidgets import QScrollArea, QWidget, QVBoxLayout
+from PySide6.QtCore import Qt, QPoint, QRect, Signal, Slot
+import numpy as np
+
+from .graphicWidget import GraphicWidget
+from .pointsData import float_array, bounds, to_msecs
+
+
+class Dashboard(QScrollArea):
+	"""A scroll area with a column of GraphicWidget which plot series over the same time column.
+	It's a subclass of QScrollArea.
+
+	The timestamps are stored once by the dashboard (in milliseconds since epoch) and shared
+	by all the series: each chart only receives the points decimated to its width.
+	The time axis of the charts are synchronized: a zoom or a pan in a chart sets the range
+	of the other charts in one batch. The charts outside of the viewport are updated
+	when they become visible.
+
+	Public Methods
+	--------------
+	add_chart
+		Add a GraphicWidget to the dashboard
+	chart
+		Return a chart of the dashboard by name
+	set_time
+		Set the time column shared by the series
+	time
+		Return the time column shared by the series
+	add_series
+		Add a series (values over the time column) to a chart
+	update_series
+		Replace the values of a series
+	set_range
+		Set the time range of all charts
+	range
+		Return the time range of the charts
+
+	Protected Attributes
+	--------------------
+	_time : numpy.ndarray
+		The time column in milliseconds since epoch
+	_range : Union[Tuple[float, float], None]
+		The time range of the charts in milliseconds since epoch
+	_charts : Dict[str, GraphicWidget]
+		The charts by name
+	_values : Dict[str, Dict[str, numpy.ndarray]]
+		The values of the series by chart and by name
+	_options : Dict[str, Dict[str, Tuple[str, dict]]]
+		The kind and the options of the series by chart and by name
+	_stale_series : Dict[str, Set[str]]
+		The series of each chart waiting to be updated
+	_stale_range : Set[str]
+		The charts waiting for the time range
+	_added : Dict[str, Set[str]]
+		The series already added in each chart
+	_syncing : bool
+		True while the dashboard sets the range of the charts
+
+	Protected Methods
+	-----------------
+	_is_visible
+		Method to know if a chart is in the viewport of the dashboard
+	_refresh
+		Slot to update the visible charts with their pending changes
+	_apply_chart
+		Method to apply the pending changes of a chart
+	_on_time_range_changed
+		Method called when the range of the time axis of a chart changed
+
+	Signals
+	-------
+	rangeChanged
+		A signal emitted when the time range of the charts changed.
+		Parameters:
+			minimum : float
+				The minimum of the range in milliseconds since epoch
+			maximum : float
+				The maximum of the range in milliseconds since epoch
+	"""
+	rangeChanged = Signal(float, float)
+
+	TIME_AXIS = "time"
+
+	def __init__(self, parent=None, datetime_fmt: str = "yyyy-MM-dd h:mm", downsample: str = "minmax"):
+		"""Initialize an instance of Dashboard
+
+		Parameters
+		---------
+		parent : QWidget
+			The parent widget of the instance of Dashboard
+		OPTIONAL[datetime_fmt] : str
+			The datetime format of the time axis
+			Default: "yyyy-MM-dd h:mm"
+		OPTIONAL[downsample] : str, "minmax" or "lttb"
+			The decimation method of the series, None to add all points to the series
+			(each chart keeps then a copy of the time column).
+			Default: "minmax"
+		"""
+		super(Dashboard, self).__init__(parent)
+		self.datetime_fmt = datetime_fmt
+		self.downsample = downsample
+		self._time = np.empty(0, dtype=np.float64)
+		self._range = None
+		self._charts = {}
+		self._values = {}
+		self._options = {}
+		self._stale_series = {}
+		self._stale_range = set()
+		self._added = {}
+		self._syncing = False
+
+		container = QWidget(self)
+		self._layout = QVBoxLayout(container)
+		self._layout.addStretch()
+		self.setWidget(container)
+		self.setWidgetResizable(True)
+		self.verticalScrollBar().valueChanged.connect(self._refresh)
+		self.horizontalScrollBar().valueChanged.connect(self._refresh)
+
+	def add_chart(self, name: str, title: str = None, height: int = 300) -> GraphicWidget:
+		"""Add a GraphicWidget at the end of the dashboard, with a time axis synchronized with the other charts.
+
+		Parameters
+		---------
+		name : str
+			The name of the chart
+		OPTIONAL[title] : str
+			The title of the chart
+			Default: name
+		OPTIONAL[height] : int
+			The minimum height of the chart
+			Default: 300
+
+		Returns
+		-------
+		chart : GraphicWidget
+			The chart added
+		"""
+		if name in self._charts:
+			raise ValueError(f"A chart named '{name}' already exists")
+		chart = GraphicWidget(title=name if title is None else title)
+		chart.setMinimumHeight(height)
+		axis = chart.add_axis(self.TIME_AXIS, Qt.Horizontal, self._range or (0, 0),
+			datetime_axis=True, datetime_fmt=self.datetime_fmt)
+		axis.rangeChanged.connect(lambda minimum, maximum, name=name: self._on_time_range_changed(name, minimum, maximum))
+		self._layout.insertWidget(self._layout.count() - 1, chart)
+		self._charts[name] = chart
+		self._values[name] = {}
+		self._options[name] = {}
+		self._stale_series[name] = set()
+		self._added[name] = set()
+		return chart
+
+	def chart(self, name: str) -> GraphicWidget:
+		"""Return the chart added with the name `name`.
+
+		Parameters
+		---------
+		name : str
+			The name of the chart
+
+		Returns
+		-------
+		chart : GraphicWidget
+			The chart
+		"""
+		return self._charts[name]
+
+	def set_time(self, time, reset_range: bool = True, tz=None):
+		"""Set the time column shared by all the series, the values of the series must be updated
+		with the same size (see `update_series`).
+
+		Parameters
+		---------
+		time : Iterable
+			The timestamps in milliseconds since epoch (numeric array), QDateTime, datetime or datetime64, sorted
+		OPTIONAL[reset_range] : bool
+			If True, the time range of the charts is set to the range of the time column.
+			Default: True
+		OPTIONAL[tz] : Union[str, tzinfo, None]
+			The timezone of naive datetime values (datetime, numpy.datetime64, ...), None for the local time
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		self._time = float_array(time, tz)
+		for name, values in self._values.items():
+			self._stale_series[name].update(values)
+		if reset_range and self._time.size > 0:
+			self.set_range(*bounds(self._time))
+		else:
+			self._refresh()
+
+	def time(self):
+		"""Return the time column shared by the series.
+
+		Returns
+		-------
+		time : numpy.ndarray
+			The timestamps in milliseconds since epoch
+		"""
+		return self._time
+
+	def add_series(self, chart_name: str, serie_name: str, values, kind: str = "line", **options):
+		"""Add a series to a chart, its points are the time column and values.
+		The series is added when the chart becomes visible.
+
+		Parameters
+		---------
+		chart_name : str
+			The name of the chart
+		serie_name : str
+			The name of the series
+		values : Iterable
+			The Y-coordinates of points, with the size of the time column
+		OPTIONAL[kind] : str, "line" or "scatter"
+			The kind of series
+			Default: "line"
+		OPTIONAL[**options]
+			The optional parameters of `GraphicWidget.add_line_series` or `GraphicWidget.add_scatter_series`
+			(the X axis and the datetime options are set by the dashboard)
+
+		Returns
+		-------
+		None
+		"""
+		if kind not in ("line", "scatter"):
+			raise ValueError(f"kind must be 'line' or 'scatter', not '{kind}'")
+		if serie_name in self._values[chart_name]:
+			raise ValueError(f"A series named '{serie_name}' already exists in the chart '{chart_name}'")
+		options.setdefault("downsample", self.downsample)
+		self._options[chart_name][serie_name] = (kind, options)
+		self.update_series(chart_name, serie_name, values)
+
+	def update_series(self, chart_name: str, serie_name: str, values):
+		"""Replace the values of a series, the chart is updated now if it's visible
+		else when it becomes visible.
+
+		Parameters
+		---------
+		chart_name : str
+			The name of the chart
+		serie_name : str
+			The name of the series
+		values : Iterable
+			The new Y-coordinates of points, with the size of the time column
+
+		Returns
+		-------
+		None
+		"""
+		if serie_name not in self._options[chart_name]:
+			raise KeyError(f"No series named '{serie_name}' in the chart '{chart_name}'")
+		values = float_array(values)
+		if values.size != self._time.size:
+			raise ValueError(f"The series '{serie_name}' has {values.size} values for {self._time.size} timestamps")
+		self._values[chart_name][serie_name] = values
+		self._stale_series[chart_name].add(serie_name)
+		self._refresh()
+
+	def set_range(self, minimum, maximum):
+		"""Set the time range of all charts. The visible charts are updated in one batch,
+		the other charts when they become visible.
+
+		Parameters
+		---------
+		minimum : Union[int, float, QDateTime, datetime]
+			The minimum of the range (milliseconds since epoch if it's a number)
+		maximum : Union[int, float, QDateTime, datetime]
+			The maximum of the range (milliseconds since epoch if it's a number)
+
+		Returns
+		-------
+		None
+		"""
+		time_range = (to_msecs(minimum), to_msecs(maximum))
+		if time_range == self._range:
+			return
+		self._range = time_range
+		self._stale_range.update(self._charts)
+		self._refresh()
+		self.rangeChanged.emit(*time_range)
+
+	def range(self):
+		"""Return the time range of the charts.
+
+		Returns
+		-------
+		range : Union[Tuple[float, float], None]
+			The minimum and the maximum in milliseconds since epoch, None if the range was never set
+		"""
+		return self._range
+
+	def _is_visible(self, chart: GraphicWidget) -> bool:
+		"""Return True if a part of the chart is in the viewport of the dashboard."""
+		if not chart.isVisible():
+			return False
+		viewport = self.viewport()
+		geometry = QRect(chart.mapTo(viewport, QPoint(0, 0)), chart.size())
+		return geometry.intersects(viewport.rect())
+
+	@Slot()
+	def _refresh(self, gesture: bool = False):
+		"""Apply the pending changes of the visible charts, with a single repaint of the dashboard.
+		During a zoom or pan gesture (`gesture`), the charts decimate their series again at the end of the gesture."""
+		charts = [name for name, chart in self._charts.items()
+			if (self._stale_series[name] or name in self._stale_range) and self._is_visible(chart)]
+		if not charts:
+			return
+		container = self.widget()
+		container.setUpdatesEnabled(False)
+		self._syncing = True
+		try:
+			for name in charts:
+				self._apply_chart(name, gesture)
+		finally:
+			self._syncing = False
+			container.setUpdatesEnabled(True)
+
+	def _apply_chart(self, name: str, gesture: bool = False):
+		"""Add or update the stale series of a chart and set its time range, in one batch of the chart.
+
+		Parameters
+		---------
+		name : str
+			The name of the chart
+		OPTIONAL[gesture] : bool
+			True if the time range follows a zoom or pan gesture (see `GraphicWidget.set_axis_range`)
+			Default: False
+
+		Returns
+		-------
+		None
+		"""
+		chart = self._charts[name]
+		stale, self._stale_series[name] = self._stale_series[name], set()
+		self._stale_range.discard(name)
+		with chart.batch():
+			for serie_name in stale:
+				values = self._values[name][serie_name]
+				if serie_name not in self._added[name]:
+					self._added[name].add(serie_name)
+					kind, options = self._options[name][serie_name]
+					add_series = chart.add_line_series if kind == "line" else chart.add_scatter_series
+					add_series(serie_name, self._time, values, datetime_axis=True, datetime_fmt=self.datetime_fmt,
+						x_axis=self.TIME_AXIS, **options)
+				else:
+					chart.update_series(serie_name, self._time, values)
+			if self._range is not None:
+				chart.set_axis_range(self.TIME_AXIS, *self._range, gesture=gesture)
+
+	def _on_time_range_changed(self, name: str, minimum, maximum):
+		"""Called when the range of the time axis of a chart changed (zoom, pan, ...):
+		the range is set to the other charts. During a gesture, they follow its debounce:
+		their series are decimated again once, at the end of the gesture."""
+		if self._syncing:
+			return
+		self._stale_range.update(other for other in self._charts if other != name)
+		self._range = (to_msecs(minimum), to_msecs(maximum))
+		self._refresh(self._charts[name].in_gesture())
+		self.rangeChanged.emit(*self._range)
+
+	def showEvent(self, event):
+		super(Dashboard, self).showEvent(event)
+		self._refresh()
+
+	def resizeEvent(self, event):
+		super(Dashboard, self).resizeEvent(event)
+		self._refresh()
+
+
+if __name__ == "__main__":
+	import sys
+	from PySide6.QtWidgets import QApplication
+	from PySide6.QtCore import QDateTime
+	from PySide6.QtCharts import QChartView
+
+	app = QApplication(sys.argv)
+	dashboard = Dashboard()
+	dashboard.resize(900, 700)
+
+	start = QDateTime.currentDateTime().toMSecsSinceEpoch()
+	time = start + np.arange(100_000, dtype=np.float64) * 1000
+	dashboard.set_time(time)
+	for i in range(20):
+		dashboard.add_chart(f"chart {i}")
+		dashboard.add_series(f"chart {i}", "signal", np.sin(np.arange(time.size) / (500 + 50 * i)) + np.random.normal(0, 0.1, time.size))
+		dashboard.chart(f"chart {i}").set_interactive(rubber_band=QChartView.HorizontalRubberBand)
+
+	dashboard.show()
+	sys.exit(app.exec())
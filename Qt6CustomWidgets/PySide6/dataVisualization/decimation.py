@@ -0,0 +1,128 @@
+"""
+Decimation algorithms to reduce the number of points of a XY series to the width of a plot
+while keeping its visual shape (peaks included).
+"""
+
+import numpy as np
+
+
+def min_max(x, y, n_bins: int):
+	"""Keep the points with the minimum and the maximum Y value of each bin of points.
+	The bins contain the same number of points, with x sorted it's a bin per pixel.
+
+	Parameters
+	---------
+	x : numpy.ndarray
+		The X-coordinates of points, sorted
+	y : numpy.ndarray
+		The Y-coordinates of points
+	n_bins : int
+		The number of bins, the result has at most 2 * n_bins + 2 points
+
+	Returns
+	-------
+	x : numpy.ndarray
+		The X-coordinates of points kept
+	y : numpy.ndarray
+		The Y-coordinates of points kept
+	"""
+	size = min(x.size, y.size)
+	if n_bins < 1 or size <= 2 * n_bins + 2:
+		return x[:size], y[:size]
+
+	bin_size = size // n_bins
+	full = bin_size * n_bins
+	bins = y[:full].reshape(n_bins, bin_size)
+	offsets = np.arange(n_bins) * bin_size
+	indexes = [offsets + bins.argmin(axis=1), offsets + bins.argmax(axis=1)]
+	if full < size:  # the last points in a smaller bin
+		rest = y[full:size]
+		indexes.append(np.array([full + rest.argmin(), full + rest.argmax()]))
+	indexes = np.unique(np.concatenate(indexes + [np.array([0, size - 1])]))
+	return x[indexes], y[indexes]
+
+
+def lttb(x, y, threshold: int):
+	"""Largest-Triangle-Three-Buckets: keep `threshold` points with the largest triangle area
+	with their neighbours buckets, which keeps the peaks of the series.
+
+	Parameters
+	---------
+	x : numpy.ndarray
+		The X-coordinates of points, sorted
+	y : numpy.ndarray
+		The Y-coordinates of points
+	threshold : int
+		The number of points kept
+
+	Returns
+	-------
+	x : numpy.ndarray
+		The X-coordinates of points kept
+	y : numpy.ndarray
+		The Y-coordinates of points kept
+	"""
+	size = min(x.size, y.size)
+	if threshold < 3 or size <= threshold:
+		return x[:size], y[:size]
+
+	edges = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+	indexes = np.empty(threshold, dtype=np.int64)
+	indexes[0], indexes[-1] = 0, size - 1
+	a = 0
+	for i in range(threshold - 2):
+		start, end = edges[i], edges[i + 1]
+		next_start, next_end = end, edges[i + 2] if i + 2 < threshold - 1 else size
+		if next_end <= next_start:
+			next_end = next_start + 1
+		avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+		areas = np.abs(
+			(x[a] - avg_x) * (y[start:end] - y[a])
+			- (x[a] - x[start:end]) * (avg_y - y[a]))
+		a = start + int(areas.argmax())
+		indexes[i + 1] = a
+	return x[indexes], y[indexes]
+
+
+METHODS = {"minmax": min_max, "lttb": lttb}
+
+
+def decimate(x, y, width: int, method: str):
+	"""Decimate points for a plot of `width` pixels.
+
+	Parameters
+	---------
+	x : numpy.ndarray
+		The X-coordinates of points, sorted
+	y : numpy.ndarray
+		The Y-coordinates of points
+	width : int
+		The width of the plot in pixels
+	method : str, "minmax" or "lttb"
+		The decimation algorithm to use
+
+	Returns
+	-------
+	x : numpy.ndarray
+		The X-coordinates of points kept
+	y : numpy.ndarray
+		The Y-coordinates of points kept
+	"""
+	if method == "minmax":
+		return min_max(x, y, width)
+	elif method == "lttb":
+		return lttb(x, y, 2 * width)
+	raise ValueError(f"method must be one of {list(METHODS)}, not '{method}'")
+
+
+if __name__ == "__main__":
+	# Spikes must be kept by the both algorithms
+	x = np.arange(1_000_000, dtype=np.float64)
+	y = np.sin(x / 5000)
+	spikes = [1234, 500_001, 999_000]
+	y[spikes] = [15., -12., 9.]
+	for method in METHODS:
+		x_kept, y_kept = decimate(x, y, 650, method)
+		assert x_kept.size <= 2 * 650 + 2, x_kept.size
+		assert all(np.any(x_kept == spike) for spike in spikes), method
+		print(f"{method}: {x.size} -> {x_kept.size} points, spikes kept")
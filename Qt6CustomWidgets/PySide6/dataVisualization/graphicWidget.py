@@ -2,15 +2,30 @@
 Ui pour le système de surveillance du radar UHF
 """
 
+import os
+import time
+import logging
+from contextlib import contextmanager
 from datetime import datetime
 
-from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Slot, Signal, QPoint, Qt, QDateTime,Property
-from PySide6.QtGui import QImage, QPainter
-from PySide6.QtCharts import QChart
+from PySide6.QtWidgets import QWidget, QToolTip
+from PySide6.QtCore import Slot, Signal, QPoint, Qt, QDateTime,Property, QRectF, QPointF, QSize, QSizeF, QMarginsF, QThreadPool, QTimer, QEvent
+from PySide6.QtGui import QImage, QPainter, QPdfWriter, QPageSize
+from PySide6.QtCharts import QChart, QChartView
 from PySide6 import QtCharts
+import numpy as np
 
 from .ui.ui_graphicWidget import Ui_GraphicWidget
+from .pointsData import float_array, bounds, to_msecs, sets_bounds, column_array, is_datetime_column
+from .pointsData import top_n as top_n_
+from .ringBuffer import RingBuffer
+from .decimation import decimate
+from .pointsWorker import PointsWorker
+from .arrayTableModel import ArrayTableModel
+from .memmapSource import MemmapSource
+from .pyramidIndex import PyramidIndex, PyramidWorker
+from .hoverIndex import nearest_sorted_in_radius, GridIndex
+from .chartMetrics import new_metrics, timed, format_metrics, PaintTimer, MetricsHud
 
 
 class GraphicWidget(QWidget, Ui_GraphicWidget):
@@ -34,8 +49,26 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		Add a series to the chart
 	set_theme
 		Set a new theme to the chart
+	begin_update
+		Start a batch of updates (repaint, legend and axis ranges are suspended)
+	end_update
+		End a batch of updates and apply them in one pass
+	batch
+		A context manager for a batch of updates
 	set_title
 		Set a new title to the graph
+	set_timezone
+		Set the timezone of the naive datetime values
+	set_retracted
+		Retract or expand the widget (the updates are queued while it's retracted)
+	set_interactive
+		Enable the zoom (rubber band, wheel) and the pan with the mouse
+	set_hover
+		Enable the lookup of the point under the cursor (signal and tooltip)
+	set_metrics
+		Enable the timings of the hot paths and the paint, with an optional HUD and logging
+	metrics
+		Return the last metrics (timings, points by series and fps)
 	add_line_series
 		Add a line series to the chart
 	add_scatter_series
@@ -46,15 +79,136 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		Add a percent bar series to the chart
 	add_pie_series
 		Add a pie series to the chart
+	add_axis
+		Create an axis registered with a name
+	axis
+		Return a registered axis by name
+	set_axis_range
+		Set the range of a registered axis
+	in_gesture
+		Return True during a zoom or pan gesture
+	add_model_series
+		Add a line or scatter series mapped on the columns of a model
+	add_dataframe
+		Add a line or scatter series for each column of a pandas DataFrame or an Arrow table
+	add_memmap_series
+		Add a line or scatter series which reads the visible window of a binary file
+	refresh_source
+		Display the rows appended to the file of a series added with `add_memmap_series`
+	build_index
+		Build the multi-resolution min/max index of a downsampled series in a QThreadPool
+	add_line_series_async
+		Add a line series, its points are prepared in a QThreadPool
+	add_scatter_series_async
+		Add a scatter series, its points are prepared in a QThreadPool
+	append_points
+		Append points to a series created with a capacity
+	update_series
+		Replace the points of a line or scatter series in place
+	update_bar_sets
+		Replace the values of the bar sets of a bar series in place
+	update_pie_series
+		Replace the values of the slices of a pie series in place
+	set_max_fps
+		Limit the rate of the updates of the chart
+	frame_counters
+		Return the counters of the updates (frames, coalesced and dropped)
+	reset_frame_counters
+		Reset the counters of the updates
 	clear_chart
 		Clear all series of chart
+	render_chart
+		Paints the chart with a QPainter at any size
+	to_image
+		Renders the chart in a QImage
 	save
-		Saves the QChartView
+		Saves the chart in an image, a SVG or a PDF file
 	
 	Protected Attributes
 	--------------------
 	_old_height : int
 		The former height of the widget before it was retracted
+	_tz : Union[str, tzinfo, None]
+		The timezone of the naive datetime values, None for the local time
+	_series : Dict[str, QAbstractSeries]
+		The series of the chart by name
+	_axes : Dict[str, QAbstractAxis]
+		The axis of the XY series by name
+	_batch_depth : int
+		The number of nested batches of updates
+	_pending_theme : bool
+		True if the theme must be applied at the end of the batch
+	_pending_ranges : Dict[QAbstractAxis, Tuple[float, float]]
+		The axis ranges recorded during a batch of updates
+	_silent_series : Dict[QXYSeries, List[Tuple]]
+		The series whose points were replaced without notification during a batch of updates,
+		with the ranges of their axes before the replace (see `_replace_buffer_points`)
+	_pending_legend : Union[bool, None]
+		The legend visibility recorded during a batch of updates
+	_last_request_id : int
+		The id of the last request of series prepared in a QThreadPool
+	_async_requests : Dict[str, Tuple[int, str, dict, PointsWorker]]
+		The series waiting for their points prepared in a QThreadPool, by name
+	_max_fps : Union[float, None]
+		The maximum rate of updates, None if not limited
+	_dirty : Dict[str, bool]
+		The series changed since the last frame, with their rescale flag
+	_dirty_changes : int
+		The number of changes since the last frame
+	_pending_points : Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+		The new points of the series without buffer or full data, waiting for the next frame
+	_pending_sets : Dict[str, Tuple[Callable, dict]]
+		The last update of the bar and pie series received while the widget is retracted, by name
+	_pending_adds : Dict[str, Tuple[Callable, dict]]
+		The setup of the series added while the widget is retracted and its arguments, by name
+	_frame_timer : QTimer
+		The single shot timer of the next frame
+	_frame_counters : Dict[str, int]
+		The counters of changes, frames, coalesced and dropped frames
+	_gesture : bool
+		True during a zoom or pan gesture with the mouse
+	_pan_origin : Union[QPointF, None]
+		The last position of the mouse during a pan
+	_requery : Set[str]
+		The downsampled series to decimate again at the end of the gesture
+	_requery_timer : QTimer
+		The single shot timer of the end of a gesture (the debounce)
+	_interactive : bool
+		True if the zoom and the pan with the mouse are enabled
+	_hover : Union[Tuple[int, bool], None]
+		The tolerance and the tooltip option of the hover, None if the hover is disabled
+	_hovered : Union[Tuple[str, float, float], None]
+		The last point hovered
+	_lookups : Dict[str, Tuple[numpy.ndarray, numpy.ndarray, Union[GridIndex, None]]]
+		The points (and their grid) used by the hover, by name
+	_points_data : Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+		The float64 points set in the series without buffer, full data or source, kept for the hover, by name
+	_model_series : Dict[str, Tuple[QAbstractItemModel, int, int]]
+		The model, the X and the Y column of the series added with `add_model_series`, by name
+	_buffers : Dict[str, RingBuffer]
+		The ring buffers of the series created with a capacity, by name
+	_full_data : Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]
+		The full resolution points (sorted by X) of the downsampled series, by name
+	_downsample : Dict[str, str]
+		The decimation method of the downsampled series, by name
+	_sources : Dict[str, MemmapSource]
+		The file data sources of the series added with `add_memmap_series`, by name
+	_indexes : Dict[str, PyramidIndex]
+		The multi-resolution indexes of the downsampled series, by name
+	_index_workers : Dict[str, PyramidWorker]
+		The workers building an index in a QThreadPool, by name
+	_metrics : Union[dict, None]
+		The metrics recorded, None if the instrumentation is disabled
+	_metrics_timer : Union[QTimer, None]
+		The timer which emits metricsUpdated
+	_metrics_started : float
+		The start of the current interval of the metrics (time.perf_counter)
+	_paint_timer : Union[PaintTimer, None]
+		The timer of the paint events of the QChartView
+	_metrics_hud : Union[MetricsHud, None]
+		The HUD of the metrics over the chart
+	_metrics_logger : Union[Tuple[logging.Logger, logging.Handler], None]
+		The logger of the metrics and its handler
 
 	Protected Methods
 	-----------------
@@ -66,12 +220,96 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		Method to test if two ranges are similar
 	_largest_range
 		Method to get a range which included all ranges passed in parameters.
+	_set_axis_range
+		Method to set the range of a QValueAxis or a QDateTimeAxis
+	_axis_range
+		Method to get the range of an axis in float, including the range recorded during a batch
+	_set_legend_visible
+		Method to set the visibility of the legend (recorded during a batch)
+	_axis_name
+		Method to get a free name for an axis created automatically
+	_axis_for
+		Method to get (or create) the axis of a series and extend its range
 	_setup_axis
 		Method to setup axis of a QXYSeries
 	_add_points_data
 		Methods to add points data to a QXYSeries
 	_setup_bar_series
 		Methods to setup bar set and axis of a QAbstractBarSeries
+	_aggregate_sets
+		Method to keep the top N categories of bar sets and aggregate the others
+	_pie_slices
+		Method to create the slices of a pie series (top N and aggregated slice)
+	_setup_buffer
+		Method to create the ring buffer of a series and add its points to the series
+	_attach_stream_axis
+		Method to attach a series created without data to the axis of the chart
+	_update_axis_range
+		Method to set the range of the axis attached to a series
+	_replace_buffer_points
+		Method to replace the points of a series and set the range of its axes with a single computation of its geometry
+	_notify_points
+		Method to notify a series of the replace of its points if the range of its axes didn't change
+	_setup_downsample
+		Method to keep the full data of a series and add a decimated set of points to the series
+	_plot_width
+		Method to get the width of the plot area in pixels
+	_push_points
+		Method to set the points of a series from its buffer or its full data (decimated if needed)
+	_index_points
+		Method to get the decimated points of a window from the index of a series
+	_on_index_ready
+		Method called when the index of a series is built
+	_on_index_error
+		Method called when the build of the index of a series failed
+	_refresh_downsampled
+		Slot to decimate again all the downsampled series
+	_on_x_range_changed
+		Method to decimate again a downsampled series for its new X range (after the current gesture)
+	_begin_gesture
+		Method to start a zoom or pan gesture
+	_end_gesture
+		Slot to decimate again the downsampled series at the end of a gesture
+	_zoom_at
+		Method to zoom the chart around a position
+	_update_event_filter
+		Method to install or remove the event filter of the QChartView
+	_lookup_data
+		Method to get the full resolution points of a series (and their grid) for the hover
+	_nearest_point
+		Method to find the nearest point of a position of the QChartView
+	_format_value
+		Method to format a value as displayed by an axis
+	_hover_at
+		Method to emit pointHovered and show the tooltip of the point under the cursor
+	_start_points_worker
+		Method to start the preparation of the points of a series in a QThreadPool
+	_on_points_ready
+		Slot to add a series when its points are prepared
+	_on_points_error
+		Slot to raise the error of a failed preparation of points
+	_add_xy_series
+		Method to create a line or scatter series with its optional parameters in a dict and add it to the chart
+	_series_changed
+		Method to apply a change of the data of a series, or to schedule it in the next frame
+	_apply_series_change
+		Method to set the points of a series after a change of its data
+	_flush_frame
+		Slot to apply all the pending changes with a single repaint
+	_defer_sets
+		Method to queue the update of a bar or pie series while the widget is retracted
+	_on_model_reset
+		Slot to read again the points of the series mapped on a model reset
+	_on_model_data_changed
+		Method to update the series mapped on a model after a change of its data
+	_extend_model_range
+		Method to extend the axis of a series mapped on a model to the values changed
+	_defer_add
+		Method to queue the setup of a series added while the widget is retracted
+	_setup_pending
+		Method to set up a series queued by `_defer_add`
+	_emit_metrics
+		Slot to update the fps and the points of the metrics and emit metricsUpdated
 
 	Desctiptors
 	-----------
@@ -90,8 +328,56 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		Parameters:
 			retracted : bool
 				A boolean to specify if the graphicWidget is retracted or not.
+	seriesReady
+		A signal emitted when a series added with an async method is in the chart.
+		Parameters:
+			serie_name : str
+				The name of the series
+	indexReady
+		A signal emitted when the index of a series started with `build_index` is built.
+		Parameters:
+			serie_name : str
+				The name of the series
+	seriesError
+		A signal emitted when the points of a series added with an async method couldn't be prepared
+		or when the index of a series started with `build_index` couldn't be built.
+		Parameters:
+			serie_name : str
+				The name of the series
+			error : Exception
+				The error raised by the worker
+	pointHovered
+		A signal emitted when the point under the cursor changed (see `set_hover`).
+		Parameters:
+			serie_name : str
+				The name of the series of the point
+			x : float
+				The X-coordinate of the point (milliseconds since epoch for a datetime axis)
+			y : float
+				The Y-coordinate of the point
+	metricsUpdated
+		A signal emitted at each interval of the metrics (see `set_metrics`).
+		Parameters:
+			metrics : dict
+				A copy of the metrics (see `metrics`)
 	"""
 	retracted = Signal(bool)
+	seriesReady = Signal(str)
+	indexReady = Signal(str)
+	seriesError = Signal(str, object)
+	pointHovered = Signal(str, float, float)
+	metricsUpdated = Signal(dict)
+
+	# the methods timed by `set_metrics`
+	_TIMED_METHODS = ("_add_points_data", "_setup_axis", "_setup_bar_series", "save")
+	# the maximum number of rows of a file data source read by a hover lookup
+	_HOVER_SOURCE_ROWS = 65536
+	# the maximum number of values of a bar set or a pie series changed one by one by an update,
+	# above the values are set again in one call (each change of a value lays out the series)
+	_MAX_INPLACE_CHANGES = 16
+	# the maximum number of rows of an ArrayTableModel replaced point by point by a dataChanged:
+	# QtCharts computes the geometry of the whole series for each point replaced, so above the columns are read again
+	_MODEL_REPLACE_ROWS = 1
 
 	def __init__(self, parent=None, title: str = "Untitled"):
 		"""Initialize an instance of GraphicWidget
@@ -107,6 +393,53 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		super(GraphicWidget, self).__init__(parent)
 		self.setupUi(self)
 		self.theme = QChart.ChartThemeLight
+		self._tz = None
+		self._series = {}
+		self._axes = {}
+		self._buffers = {}
+		self._full_data = {}
+		self._downsample = {}
+		self._sources = {}
+		self._indexes = {}
+		self._index_workers = {}
+		self._batch_depth = 0
+		self._pending_theme = False
+		self._pending_ranges = {}
+		self._silent_series = {}
+		self._pending_legend = None
+		self._last_request_id = 0
+		self._async_requests = {}
+		self._max_fps = None
+		self._dirty = {}
+		self._dirty_changes = 0
+		self._pending_points = {}
+		self._pending_sets = {}
+		self._pending_adds = {}
+		self._model_series = {}
+		self._frame_scheduled = None
+		self.reset_frame_counters()
+		self._frame_timer = QTimer(self)
+		self._frame_timer.setSingleShot(True)
+		self._frame_timer.timeout.connect(self._flush_frame)
+		self._interactive = False
+		self._hover = None
+		self._hovered = None
+		self._lookups = {}
+		self._points_data = {}
+		self._gesture = False
+		self._pan_origin = None
+		self._requery = set()
+		self._requery_timer = QTimer(self)
+		self._requery_timer.setSingleShot(True)
+		self._requery_timer.setInterval(150)
+		self._requery_timer.timeout.connect(self._end_gesture)
+		self._metrics = None
+		self._metrics_timer = None
+		self._metrics_started = 0.
+		self._paint_timer = None
+		self._metrics_hud = None
+		self._metrics_logger = None
+		self.chart = None
 		self.set_chart()
 		self.label.setText(title)
 		self._old_height = self.height()
@@ -158,8 +491,22 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		"""
 		if chart is None:
 			chart = QChart()
+		if self.chart is not None:  # the former chart no longer refreshes the downsampled series
+			self.chart.plotAreaChanged.disconnect(self._refresh_downsampled)
 		self.chart = chart
+		self._series = {series.name(): series for series in chart.series()}
+		self._axes = {}
+		self._buffers = {}
+		self._full_data = {}
+		self._downsample = {}
+		self._sources = {}
+		self._indexes = {}
+		self._index_workers = {}
+		self._lookups = {}
+		self._points_data = {}
+		self._pending_ranges = {}
 		self.chart.setTheme(self.theme)
+		self.chart.plotAreaChanged.connect(self._refresh_downsampled)
 		self.chartView.setChart(self.chart)
 
 	def add_series(self, series):
@@ -174,7 +521,9 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		-------
 		None
 		"""
-		self.chart.addSeries(series)
+		if series.chart() is not self.chart:  # a series added while the widget was retracted is already registered
+			self.chart.addSeries(series)
+		self._series[series.name()] = series
 
 	def set_theme(self, theme):
 		"""Set a theme to the chart
@@ -188,7 +537,85 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		None
 		"""
 		self.theme = theme
-		self.chart.setTheme(self.theme)
+		if self._batch_depth > 0:
+			self._pending_theme = True
+		else:
+			self.chart.setTheme(self.theme)
+
+	def begin_update(self):
+		"""Start a batch of updates: until `end_update`, the repaint of the chart view is suspended
+		and the theme, the legend visibility and the axis ranges are only recorded.
+		The calls can be nested, the updates are applied by the last `end_update`.
+
+		Returns
+		-------
+		None
+		"""
+		self._batch_depth += 1
+		if self._batch_depth == 1:
+			self.chartView.setUpdatesEnabled(False)
+
+	def end_update(self):
+		"""End a batch of updates started with `begin_update`,
+		the recorded updates are applied in one pass and the chart view is repainted.
+
+		Returns
+		-------
+		None
+		"""
+		if self._batch_depth == 0:
+			raise RuntimeError("end_update called without begin_update")
+		self._batch_depth -= 1
+		if self._batch_depth > 0:
+			return
+
+		if self._pending_theme:
+			self.chart.setTheme(self.theme)
+			self._pending_theme = False
+		pending_ranges, self._pending_ranges = self._pending_ranges, {}
+		for axis, (minimum, maximum) in pending_ranges.items():
+			self._set_axis_range(axis, minimum, maximum)
+		silent_series, self._silent_series = self._silent_series, {}
+		for series, axis_ranges in silent_series.items():
+			self._notify_points(series, axis_ranges)
+		if self._pending_legend is not None:
+			self.chart.legend().setVisible(self._pending_legend)
+			self._pending_legend = None
+		self.chartView.setUpdatesEnabled(True)
+		self.chartView.update()
+
+	@contextmanager
+	def batch(self):
+		"""A context manager to group updates of the chart, see `begin_update` and `end_update`.
+
+		Example
+		-------
+		>>> with graphic.batch():
+		...     graphic.add_line_series("a", x, y)
+		...     graphic.add_line_series("b", x, z)
+		"""
+		self.begin_update()
+		try:
+			yield self
+		finally:
+			self.end_update()
+
+	def _set_legend_visible(self, visible: bool):
+		"""Set the visibility of the legend, recorded until the end of a batch of updates.
+
+		Parameters
+		---------
+		visible : bool
+			Specify if the legend must be visible.
+
+		Returns
+		-------
+		None
+		"""
+		if self._batch_depth > 0:
+			self._pending_legend = visible
+		else:
+			self.chart.legend().setVisible(visible)
 
 	def set_title(self, title: str):
 		"""Set a new title for the GraphicWidget
@@ -204,6 +631,24 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		"""
 		self.title = title
 
+	def set_timezone(self, tz=None):
+		"""Set the timezone of the naive datetime values (datetime without tzinfo, numpy.datetime64,
+		pandas columns without timezone) of the next points added. The values with a timezone
+		(pandas columns with a timezone, Arrow timestamps with a timezone, aware datetime) keep their timezone.
+		The datetime axis display the dates in the local time.
+
+		Parameters
+		---------
+		OPTIONAL[tz] : Union[str, tzinfo, None]
+			A tzinfo, a name of the IANA database ("UTC", "Europe/Paris", ...) or None for the local time
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		self._tz = tz
+
 	def _create_x_axis(self, x_range: tuple = (0, 0), y_range: tuple = (0, 0),
 		x_axis_align: int = Qt.AlignBottom, y_axis_align: int = Qt.AlignLeft, labels_angle: int = 0,
 		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm"):
@@ -308,10 +753,10 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 			if isinstance(value, QDateTime):
 				return value.toMSecsSinceEpoch()
 			elif isinstance(value, datetime):
-				return value.timestamp() * 1000
+				return to_msecs(value, self._tz)
 			return value
 
-		axis_min, axis_max = convert_datetime_to_ms(axis.min()), convert_datetime_to_ms(axis.max())
+		axis_min, axis_max = self._axis_range(axis)
 		min_value, max_value = convert_datetime_to_ms(range_[0]), convert_datetime_to_ms(range_[1])
 
 		tolerance_value = tolerance * abs(axis_max - axis_min)
@@ -335,12 +780,216 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		new_max : Union[int, float]
 			The new max value of range
 		"""
-		new_min, new_max = min((range_[0] for range_ in other_ranges)), max((range_[1] for range_ in other_ranges))
+		ranges = (range_1,) + other_ranges
+		new_min, new_max = min((range_[0] for range_ in ranges)), max((range_[1] for range_ in ranges))
 		return new_min, new_max
 
+	def _set_axis_range(self, axis, minimum, maximum):
+		"""Set the range of an axis, the values of a QDateTimeAxis are in milliseconds since epoch.
+
+		Parameters
+		---------
+		axis : Union[QValueAxis, QDateTimeAxis]
+			The axis
+		minimum : Union[int, float, QDateTime, datetime]
+			The new minimum of axis
+		maximum : Union[int, float, QDateTime, datetime]
+			The new maximum of axis
+
+		Returns
+		-------
+		None
+		"""
+		minimum, maximum = to_msecs(minimum, self._tz), to_msecs(maximum, self._tz)
+		if self._batch_depth > 0:
+			self._pending_ranges[axis] = (minimum, maximum)
+		elif isinstance(axis, QtCharts.QDateTimeAxis):
+			axis.setRange(QDateTime.fromMSecsSinceEpoch(int(minimum)), QDateTime.fromMSecsSinceEpoch(int(maximum)))
+		else:
+			axis.setRange(minimum, maximum)
+
+	def _axis_range(self, axis):
+		"""Return the range of an axis in float (milliseconds since epoch for a QDateTimeAxis),
+		including the range recorded during a batch of updates.
+
+		Parameters
+		---------
+		axis : Union[QValueAxis, QDateTimeAxis]
+			The axis
+
+		Returns
+		-------
+		minimum : float
+			The minimum of axis
+		maximum : float
+			The maximum of axis
+		"""
+		if axis in self._pending_ranges:
+			return self._pending_ranges[axis]
+		return to_msecs(axis.min()), to_msecs(axis.max())
+
+	def add_axis(self, name: str, orientation: int = Qt.Horizontal, value_range: tuple = (0, 0), align: int = None,
+		labels_angle: int = 0, datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm"):
+		"""Create an axis and register it with a name. Series can be attached to this axis with its name.
+
+		Parameters
+		---------
+		name : str
+			The name of the axis
+		OPTIONAL[orientation] : Qt.Orientation
+			Qt.Horizontal for a X axis or Qt.Vertical for a Y axis
+			Default: Qt.Horizontal
+		OPTIONAL[value_range] : Tuple[Union[int, float, QDateTime], Union[int, float, QDateTime]]
+			The range of the axis
+			Default: (0, 0)
+		OPTIONAL[align] : int, a Qt alignment flag
+			The alignment of the axis, by default Qt.AlignBottom (Qt.AlignLeft) for the first X (Y) axis
+			and Qt.AlignTop (Qt.AlignRight) for the other axis.
+			Default: None
+		OPTIONAL[labels_angle] : int
+			Angle for the labels
+			Default: 0
+		OPTIONAL[datetime_axis] : bool
+			If True, the axis is a QDatetimeAxis else a QValueAxis
+			Default: False
+		OPTIONAL[datetime_fmt] : str
+			The datetime format, only use if datetime_axis is True.
+			Default: "yyyy-MM-dd h:mm"
+
+		Returns
+		-------
+		axis : Union[QValueAxis, QDatetimeAxis]
+			The axis created
+		"""
+		if name in self._axes:
+			raise ValueError(f"An axis named '{name}' already exists")
+		first = not any(axis.orientation() == orientation for axis in self._axes.values())
+		if orientation == Qt.Horizontal:
+			if align is None:
+				align = Qt.AlignBottom if first else Qt.AlignTop
+			axis = self._create_x_axis(x_axis_align=align, labels_angle=labels_angle,
+				datetime_axis=datetime_axis, datetime_fmt=datetime_fmt)
+		else:
+			if align is None:
+				align = Qt.AlignLeft if first else Qt.AlignRight
+			axis = self._create_y_axis(y_axis_align=align, labels_angle=labels_angle,
+				datetime_axis=datetime_axis, datetime_fmt=datetime_fmt)
+		self._set_axis_range(axis, *value_range)
+		self._axes[name] = axis
+		return axis
+
+	def axis(self, name: str):
+		"""Return the axis registered with the name `name`.
+
+		Parameters
+		---------
+		name : str
+			The name of the axis
+
+		Returns
+		-------
+		axis : QAbstractAxis
+			The axis
+		"""
+		return self._axes[name]
+
+	def set_axis_range(self, name: str, minimum, maximum, gesture: bool = False):
+		"""Set the range of the axis registered with the name `name`.
+
+		Parameters
+		---------
+		name : str
+			The name of the axis
+		minimum : Union[int, float, QDateTime, datetime]
+			The new minimum of axis (milliseconds since epoch for a QDateTimeAxis)
+		maximum : Union[int, float, QDateTime, datetime]
+			The new maximum of axis (milliseconds since epoch for a QDateTimeAxis)
+		OPTIONAL[gesture] : bool
+			True if the range follows a zoom or pan gesture (of a synchronized chart for example):
+			the downsampled series are decimated again once the gesture stopped for the debounce delay
+			(see `set_interactive`), as for a gesture in this chart.
+			Default: False
+
+		Returns
+		-------
+		None
+		"""
+		if gesture:
+			self._begin_gesture()
+		self._set_axis_range(self._axes[name], minimum, maximum)
+		if gesture:
+			self._requery_timer.start()
+
+	def in_gesture(self) -> bool:
+		"""Return True during a zoom or pan gesture, until the end of its debounce delay (see `set_interactive`)."""
+		return self._gesture
+
+	def _axis_name(self, orientation: int) -> str:
+		"""Return a free name for an axis created automatically ("x", "x2", ... or "y", "y2", ...)."""
+		prefix = "x" if orientation == Qt.Horizontal else "y"
+		name, number = prefix, 1
+		while name in self._axes:
+			number += 1
+			name = f"{prefix}{number}"
+		return name
+
+	def _axis_for(self, orientation: int, value_range: tuple, name: str = None, labels_angle: int = 0,
+		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm"):
+		"""Return the axis to use for a series of range `value_range` in this orientation.
+		If the axis already exists, its range is extended to include `value_range`.
+
+		Parameters
+		---------
+		orientation : Qt.Orientation
+			Qt.Horizontal for a X axis or Qt.Vertical for a Y axis
+		value_range : Union[Tuple[float, float], None]
+			The range of the series in this orientation, None if the series has no point
+		OPTIONAL[name] : str
+			The name of the axis, it's created if it doesn't exist.
+			If None, the first axis of this orientation with a similar range is used (or a new axis).
+			Default: None
+		OPTIONAL[labels_angle] : int
+			Angle for the labels if the axis is created
+			Default: 0
+		OPTIONAL[datetime_axis] : bool
+			If True and the axis is created, it's a QDatetimeAxis else a QValueAxis
+			Default: False
+		OPTIONAL[datetime_fmt] : str
+			The datetime format, only use if datetime_axis is True.
+			Default: "yyyy-MM-dd h:mm"
+
+		Returns
+		-------
+		axis : Union[QValueAxis, QDatetimeAxis]
+			The axis to attach to the series
+		"""
+		if name is None:
+			axes = [axis for axis in self._axes.values() if axis.orientation() == orientation]
+			if value_range is None:
+				axis = axes[0] if axes else None
+			else:
+				axis = next((axis for axis in axes if self._same_range(axis, value_range)), None)
+			name = self._axis_name(orientation)
+		else:
+			axis = self._axes.get(name)
+
+		if axis is None:
+			if value_range is not None and orientation == Qt.Vertical and value_range[0] == value_range[1]:
+				value_range = (0.5*value_range[0], 0.5*value_range[1])
+			if orientation == Qt.Horizontal and any(axis.orientation() == orientation for axis in self._axes.values()):
+				labels_angle = -20
+			axis = self.add_axis(name, orientation, value_range or (0, 0), labels_angle=labels_angle,
+				datetime_axis=datetime_axis and orientation == Qt.Horizontal, datetime_fmt=datetime_fmt)
+		elif value_range is not None:
+			self._set_axis_range(axis, *self._largest_range(self._axis_range(axis), value_range))
+		return axis
+
 	def _setup_axis(self, series, x, y, datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm",
-									legend: bool = True):
+									legend: bool = True, x_axis: str = None, y_axis: str = None,
+									x_range: tuple = None, y_range: tuple = None):
 		"""Setup axis for a QXYSeries.
+		The range of x and y is computed once, then the series is attached to the named axis
+		(or to the first registered axis with a similar range if no name is specified).
 
 		Parameters
 		---------
@@ -359,51 +1008,37 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		OPTIONAL[legend] : bool
 			Specify if the legend must be visible.
 			Default: True
+		OPTIONAL[x_axis] : str
+			The name of the X axis of the series
+			Default: None
+		OPTIONAL[y_axis] : str
+			The name of the Y axis of the series
+			Default: None
+		OPTIONAL[x_range] : Tuple[float, float]
+			The range of x if it's already computed
+			Default: None
+		OPTIONAL[y_range] : Tuple[float, float]
+			The range of y if it's already computed
+			Default: None
 
 		Returns
 		-------
 		None
 		"""
-		if len(self.chart.axes()) > 0 and len(x) > 0 and len(y) > 0:
-			x_range = (min(x), max(x))
-			y_range = (min(y), max(y))
-			for axis in self.chart.axes():
-				if axis.orientation() == Qt.Horizontal:
-					if self._same_range(axis, x_range):
-						axis.setRange(*self._largest_range((axis.min(), axis.max()), x_range))
-						series.attachAxis(axis)
-					else:
-						x_axis = self._create_x_axis(x_range, Qt.AlignTop, labels_angle=-20, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt, x_axis_align=Qt.AlignTop)
-						series.attachAxis(x_axis)
-
-				else:
-
-					if self._same_range(axis, y_range):
-						axis.setRange(*self._largest_range((axis.min(), axis.max()), y_range))
-						series.attachAxis(axis)
-					else:
-						mini = 0.5*y_range[0] if y_range[0] == y_range[1] else y_range[0]
-						maxi = 0.5*y_range[1] if y_range[0] == y_range[1] else y_range[1]
-						y_axis = self._create_y_axis((mini, maxi), y_axis_align=Qt.AlignRight)
-						series.attachAxis(y_axis)
-
-		elif len(x) > 0 and len(y) > 0:
-			x_range = (min(x), max(x))
-			y_range = (min(y), max(y))
-			x_angle_labels = 0 if len(str(x_range[1])) < 5 else -20
-			if datetime_axis:
-				x_axis = self._create_x_axis(x_range, Qt.AlignBottom, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt, labels_angle=x_angle_labels)
-				series.attachAxis(x_axis)
-				mini = 0.5*y_range[0] if y_range[0] == y_range[1] else y_range[0]
-				maxi = 0.5*y_range[1] if y_range[0] == y_range[1] else y_range[1]
-				y_axis = self._create_y_axis((mini, maxi), y_axis_align=Qt.AlignLeft)
-				series.attachAxis(y_axis)
-			else:
-				self.chart.createDefaultAxes()
-		self.chart.legend().setVisible(legend)
+		if len(x) > 0 and len(y) > 0:
+			x_min, x_max = bounds(x) if x_range is None else x_range
+			y_min, y_max = bounds(y) if y_range is None else y_range
+			x_angle_labels = 0 if len(str(x_max)) < 5 else -20
+			x_range = (to_msecs(x_min, self._tz), to_msecs(x_max, self._tz))
+			y_range = (to_msecs(y_min, self._tz), to_msecs(y_max, self._tz))
+			series.attachAxis(self._axis_for(Qt.Horizontal, x_range, x_axis, labels_angle=x_angle_labels,
+				datetime_axis=datetime_axis, datetime_fmt=datetime_fmt))
+			series.attachAxis(self._axis_for(Qt.Vertical, y_range, y_axis))
+		self._set_legend_visible(legend)
 
 	def _add_points_data(self, series, x: list, y: list):
-		"""Add points data to the series (a QXYSeries).
+		"""Add points data to the series (a QXYSeries), in a single call without creating a Python object per point.
+		The values are converted in float64 arrays (see `float_array`), datetime in milliseconds since epoch.
 
 		Parameters
 		---------
@@ -416,19 +1051,16 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 
 		Returns
 		-------
-		None
+		x : numpy.ndarray
+			The X-coordinates added (float64)
+		y : numpy.ndarray
+			The Y-coordinates added (float64)
 		"""
-		for X, Y in zip(x, y):
-			if isinstance(X, (QDateTime, datetime)):
-				if isinstance(X, datetime):
-					X = QDateTime(X)
-				series.append(X.toMSecsSinceEpoch(), float(Y))
-			elif isinstance(Y, (QDateTime, datetime)):
-				if isinstance(Y, datetime):
-					Y = QDateTime(Y)
-				series.append(float(X), Y.toMSecsSinceEpoch())
-			else:
-				series.append(float(X), float(Y))
+		x_array, y_array = float_array(x, self._tz), float_array(y, self._tz)
+		size = min(x_array.size, y_array.size)
+		x_array, y_array = x_array[:size], y_array[:size]
+		series.replaceNp(x_array, y_array)
+		return x_array, y_array
 
 	def _setup_bar_series(self, bar_series, sets: dict, xlabels: list = None, percent: bool = False, legend: bool = True):
 		"""Setup the bar set and axis for a bar or bar percent series.
@@ -454,25 +1086,20 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		None
 		"""
 		# min and max value to define the Y axis after
-		min_value = None
-		max_value = None
+		min_value, max_value = sets_bounds(sets)
 
 		# Create bar set
 		for label, values in sets.items():
 			bar_set = QtCharts.QBarSet(label)
-			bar_set.append(values)
+			bar_set.append(list(values))
 			bar_series.append(bar_set)
-			if min_value is None or min_value > min(values):
-				min_value = min(values)
-			if max_value is None or max_value < max(values):
-				max_value = max(values)
 
 		# X axis
 		x_axis = QtCharts.QBarCategoryAxis()
 		if xlabels is not None:
-			x_axis.append(xlabels)
+			x_axis.append(list(xlabels))
 		else:
-			x_axis.append[list(range(len(sets.values()[0])))]
+			x_axis.append([str(i) for i in range(len(next(iter(sets.values()))))])
 		self.chart.addAxis(x_axis, Qt.AlignBottom)
 
 		# Y Axis
@@ -485,187 +1112,2073 @@ class GraphicWidget(QWidget, Ui_GraphicWidget):
 		bar_series.attachAxis(x_axis)
 		bar_series.attachAxis(y_axis)
 
-		self.chart.legend().setVisible(legend)
+		self._set_legend_visible(legend)
 
-	def add_line_series(self, serie_name: str, x: list, y: list,
-		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm", legend: bool = True):
-		"""Add a line series to  the chart with x and y data.
+	def _setup_buffer(self, series, x, y, capacity: int):
+		"""Create the ring buffer of a series and add the points of the buffer to the series.
 
 		Parameters
 		---------
-		serie_name : str
-			The series name.
+		series : QXYSeries
+			The line or scatter series
 		x : Iterable
-			Data for X axis
+			The X-coordinates of points
 		y : Iterable
-			Data for Y axis
+			The Y-coordinates of points
+		capacity : int
+			The maximum number of points kept in the series
+
+		Returns
+		-------
+		x : numpy.ndarray
+			The X-coordinates in the buffer
+		y : numpy.ndarray
+			The Y-coordinates in the buffer
+		"""
+		buffer = RingBuffer(capacity)
+		buffer.extend(float_array(x, self._tz), float_array(y, self._tz))
+		self._buffers[series.name()] = buffer
+		return self._add_points_data(series, *buffer.arrays())
+
+	def _attach_stream_axis(self, series, datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm",
+		x_axis: str = None, y_axis: str = None):
+		"""Attach a series without data to its named axis or to the first X and Y axis of the chart,
+		these axis are created if they don't exist.
+
+		Parameters
+		---------
+		series : QXYSeries
+			The series to attach
 		OPTIONAL[datetime_axis] : bool
-			If True, the X axis is a QDatetimeAxis else a QValueAxis
+			If True and a X axis is created, it's a QDatetimeAxis else a QValueAxis
 			Default: False
 		OPTIONAL[datetime_fmt] : str
 			If datetime_axis is True, specify the datetime format.
 			Default: "yyyy-MM-dd h:mm"
-		OPTIONAL[legend] : bool
-			Specify if the legend must be visible.
-			Default: True
+		OPTIONAL[x_axis] : str
+			The name of the X axis of the series
+			Default: None
+		OPTIONAL[y_axis] : str
+			The name of the Y axis of the series
+			Default: None
 
 		Returns
 		-------
 		None
 		"""
-		line_series = QtCharts.QLineSeries(name=serie_name)
-		self._add_points_data(line_series, x, y)
-		self.add_series(line_series)
-		self._setup_axis(line_series, x, y, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt, legend=legend)
-		
+		series.attachAxis(self._axis_for(Qt.Horizontal, None, x_axis, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt))
+		series.attachAxis(self._axis_for(Qt.Vertical, None, y_axis))
 
-	def add_bar_series(self, serie_name: str, sets: dict, xlabels: list = None, legend: bool = True):
-		"""Add a bar series to the chart with the sets data.
+	def _update_axis_range(self, series, x, y, ranges: tuple = None):
+		"""Set the range of the axis attached to a series to the range of its points.
+		No axis is created and the axes already at this range are not updated.
 
 		Parameters
 		---------
-		serie_name : str
-			The series name.
-		sets : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
-			The sets to display in this bar series
-		OPTIONAL[xlabels] : List[str]
-			The labels to use for X axis.
-			Default: range(size_of_sets_values)
-		OPTIONAL[legend] : bool
-			Specify if the legend must be visible.
-			Default: True
+		series : QXYSeries
+			The series
+		x : numpy.ndarray
+			The X-coordinates of the points of series
+		y : numpy.ndarray
+			The Y-coordinates of the points of series
+		OPTIONAL[ranges] : Tuple[Tuple[float, float], Tuple[float, float]]
+			The range of x and the range of y if they are already known (`RingBuffer.bounds`),
+			None to reduce x and y.
+			Default: None
 
 		Returns
 		-------
 		None
 		"""
-		bar_series = QtCharts.QBarSeries(name=serie_name)
-		self.add_series(bar_series)
-		self._setup_bar_series(bar_series, sets, xlabels, percent=True, legend=legend)
-
-	def add_barPercent_series(self, serie_name: str, data: dict, categories: list, legend: bool = True):
-		"""Setup the bar set and axis for a bar or bar percent series.
+		if len(x) == 0 or len(y) == 0:
+			return
+		x_range, y_range = ranges if ranges is not None else (bounds(x), bounds(y))
+		for axis in series.attachedAxes():
+			value_range = x_range if axis.orientation() == Qt.Horizontal else y_range
+			if self._axis_range(axis) != (to_msecs(value_range[0], self._tz), to_msecs(value_range[1], self._tz)):
+				self._set_axis_range(axis, *value_range)
+
+	def _replace_buffer_points(self, series, x, y, ranges: tuple = None):
+		"""Replace the points of a series and set the range of its axes with a single computation of its geometry.
+		QtCharts computes the geometry of all the points of a series when they are replaced
+		and again when the range of an axis changes (each time the window of a ring buffer slides):
+		the points are replaced with the signals of the series blocked
+		and the series is notified only if the range of its axes doesn't change.
 
 		Parameters
 		---------
-		serie_name : str
-			The series name.
-		data : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
-			The sets to display in this bar series
-		categories : List[str]
-			The labels to use for X axis.
-		OPTIONAL[legend] : bool
-			Specify if the legend must be visible.
-			Default: True
+		series : QXYSeries
+			The series
+		x : numpy.ndarray
+			The new X-coordinates of the points of series
+		y : numpy.ndarray
+			The new Y-coordinates of the points of series
+		OPTIONAL[ranges] : Tuple[Tuple[float, float], Tuple[float, float]]
+			The range of x and the range of y to set to the axes, None to keep the ranges of the axes.
+			Default: None
 
 		Returns
 		-------
 		None
 		"""
-		bar_series = QtCharts.QPercentBarSeries(name=serie_name)
-		self.add_series(bar_series)
-		self._setup_bar_series(bar_series, data, categories, legend)
+		axis_ranges = [(axis.min(), axis.max()) for axis in series.attachedAxes()]
+		blocked = series.blockSignals(True)
+		try:
+			series.replaceNp(np.ascontiguousarray(x), np.ascontiguousarray(y))
+		finally:
+			series.blockSignals(blocked)
+		if ranges is not None:
+			self._update_axis_range(series, x, y, ranges)
+		if self._batch_depth > 0:  # the ranges are set by end_update
+			self._silent_series.setdefault(series, axis_ranges)
+		else:
+			self._notify_points(series, axis_ranges)
 
-	def add_pie_series(self, serie_name: str, data: dict, legend: bool = True):
-		"""Add a pie series to  the chart with data
+	def _notify_points(self, series, axis_ranges: list):
+		"""Emit `pointsReplaced` of a series replaced by `_replace_buffer_points`
+		if the range of its axes didn't change (a change of range already updated its geometry).
 
 		Parameters
 		---------
-		serie_name : str
-			The series name.
-		data : Dict[label, value], format: {"label1": 3, "label2": 6}
-			Data for pie series
-		OPTIONAL[legend] : bool
-			Specify if the legend must be visible.
-			Default: True
+		series : QXYSeries
+			The series
+		axis_ranges : List[Tuple]
+			The ranges of the axes of series before the replace of its points
 
 		Returns
 		-------
 		None
 		"""
-		pie_series = QtCharts.QPieSeries(name=serie_name)
-		for label, value in data.items():
-			pie_series.append(label, value)
-		self.add_series(pie_series)
-		self.chart.legend().setVisible(legend)
+		if [(axis.min(), axis.max()) for axis in series.attachedAxes()] == axis_ranges:
+			series.pointsReplaced.emit()
 
-	def add_scatter_series(self, serie_name: str, x: list = [], y: list = [], marker=QtCharts.QScatterSeries.MarkerShapeCircle,
-		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm", size: float = 10., legend: bool = True):
-		"""Add a scatter series to  the chart with x and y data.
+	def _setup_downsample(self, series, x, y, method: str):
+		"""Keep the full data of a series and add a decimated set of points to the series.
+		The points are sorted by X if necessary.
 
 		Parameters
 		---------
-		serie_name : str
-			The series name.
+		series : QXYSeries
+			The line or scatter series
+		x : Iterable
+			The X-coordinates of points
+		y : Iterable
+			The Y-coordinates of points
+		method : str, "minmax" or "lttb"
+			The decimation method
+
+		Returns
+		-------
+		x : numpy.ndarray
+			The X-coordinates of all points
+		y : numpy.ndarray
+			The Y-coordinates of all points
+		"""
+		x, y = float_array(x, self._tz), float_array(y, self._tz)
+		size = min(x.size, y.size)
+		x, y = x[:size], y[:size]
+		if size > 1 and np.any(x[1:] < x[:-1]):
+			order = np.argsort(x, kind="stable")
+			x, y = x[order], y[order]
+		name = series.name()
+		self._full_data[name] = (x, y)
+		self._downsample[name] = method
+		series.replaceNp(*decimate(x, y, self._plot_width(), method))
+		return x, y
+
+	def _setup_xy_series(self, series, x, y, datetime_axis: bool, datetime_fmt: str, legend: bool,
+		capacity: int = None, downsample: str = None, x_axis: str = None, y_axis: str = None,
+		x_range: tuple = None, y_range: tuple = None):
+		"""Add the points to a line or scatter series, add the series to the chart and setup its axis.
+
+		Parameters
+		---------
+		series : QXYSeries
+			The line or scatter series
 		x : Iterable
 			Data for X axis
 		y : Iterable
 			Data for Y axis
-		OPTIONAL[marker] : QScatterSeries.MarkerShape
-			The shape of markers to use
-			Default: QScatterSeries.MarkerShapeCircle
-		OPTIONAL[datetime_axis] : bool
+		datetime_axis : bool
 			If True, the X axis is a QDatetimeAxis else a QValueAxis
-			Default: False
-		OPTIONAL[datetime_fmt] : str
+		datetime_fmt : str
 			If datetime_axis is True, specify the datetime format.
-			Default: "yyyy-MM-dd h:mm"
-		OPTIONAL[size] : float
-			The size of markers
-			Default: 10.
-		OPTIONAL[legend] : bool
+		legend : bool
 			Specify if the legend must be visible.
-			Default: True
+		OPTIONAL[capacity] : int
+			The capacity of the ring buffer of the series, None for a series without buffer
+			Default: None
+		OPTIONAL[downsample] : str, "minmax" or "lttb"
+			The decimation method of the series, None to add all points to the series
+			Default: None
+		OPTIONAL[x_axis] : str
+			The name of the X axis of the series
+			Default: None
+		OPTIONAL[y_axis] : str
+			The name of the Y axis of the series
+			Default: None
+		OPTIONAL[x_range] : Tuple[float, float]
+			The range of x if it's already computed (not used for a series with a capacity)
+			Default: None
+		OPTIONAL[y_range] : Tuple[float, float]
+			The range of y if it's already computed (not used for a series with a capacity)
+			Default: None
 
 		Returns
 		-------
 		None
 		"""
-		scatter_series = QtCharts.QScatterSeries(name=serie_name)
-		scatter_series.setMarkerSize(size)
-		scatter_series.setMarkerShape(marker)
-		self._add_points_data(scatter_series, x, y)
-		self.add_series(scatter_series)
-		self._setup_axis(scatter_series, x, y, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt, legend=legend)
+		if self._defer_add(series, self._setup_xy_series, series=series, x=x, y=y, datetime_axis=datetime_axis,
+			datetime_fmt=datetime_fmt, legend=legend, capacity=capacity, downsample=downsample,
+			x_axis=x_axis, y_axis=y_axis, x_range=x_range, y_range=y_range):
+			return
+		if capacity is not None:
+			x_range = y_range = None
+			x, y = self._setup_buffer(series, x, y, capacity)
+			if downsample is not None:
+				self._downsample[series.name()] = downsample
+		elif downsample is not None:
+			x, y = self._setup_downsample(series, x, y, downsample)
+		else:
+			x, y = self._add_points_data(series, x, y)
+			if series.name() not in self._sources:
+				self._points_data[series.name()] = (x, y)
+		self.add_series(series)
+		self._setup_axis(series, x, y, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt, legend=legend,
+			x_axis=x_axis, y_axis=y_axis, x_range=x_range, y_range=y_range)
+		if capacity is not None and not series.attachedAxes():
+			self._attach_stream_axis(series, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt,
+				x_axis=x_axis, y_axis=y_axis)
+		if (downsample is not None and capacity is None) or series.name() in self._sources:
+			self._connect_downsample_axis(series)
+		elif downsample is not None:
+			self._push_points(series.name())
+
+	def _plot_width(self) -> int:
+		"""Return the width of the plot area in pixels (the width of the QChartView before the first layout)."""
+		width = int(self.chart.plotArea().width())
+		return width if width > 0 else self.chartView.width()
+
+	def _push_points(self, serie_name: str):
+		"""Set the points of a series from its ring buffer, its full data or its file data source.
+		The points of a downsampled series are restricted to the range of its X axis
+		and decimated to the width of the plot.
 
-	def clear_chart(self):
-		"""Clear all the chart"""
-		self.chart.removeAllSeries()
-		for axis in self.chart.axes():
-			self.chart.removeAxis(axis)
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
 
-	def save(self, path: str) -> str:
-		"""Save the current chart in the specified path.
+		Returns
+		-------
+		None
+		"""
+		series = self._series[serie_name]
+		x_axis = [axis for axis in series.attachedAxes() if axis.orientation() == Qt.Horizontal]
+		if serie_name in self._sources:
+			source = self._sources[serie_name]
+			x_range = self._axis_range(x_axis[0]) if x_axis else source.x_range()
+			if x_range is not None:
+				start, end = source.index(x_range[0]), source.index(x_range[1])
+				points = self._index_points(serie_name, start, end, source.x_at)
+				if points is None:
+					points = source.window(*x_range, self._plot_width(), self._downsample[serie_name])
+				series.replaceNp(*points)
+			return
+		if serie_name in self._buffers:
+			x, y = self._buffers[serie_name].arrays()
+		else:
+			x, y = self._full_data[serie_name]
+
+		method = self._downsample.get(serie_name)
+		if method is not None:
+			if x_axis and x.size > 0:
+				start, end = np.searchsorted(x, (to_msecs(x_axis[0].min()), to_msecs(x_axis[0].max())))
+				# a ring buffer has no index: its rows change at each append
+				points = None if serie_name in self._buffers else self._index_points(serie_name, start, end, x.__getitem__)
+				if points is not None:
+					series.replaceNp(*points)
+					return
+				# keep a point on each side so the line reaches the borders of the plot
+				start, end = max(0, start - 1), min(x.size, end + 1)
+				x, y = x[start:end], y[start:end]
+			x, y = decimate(x, y, self._plot_width(), method)
+		series.replaceNp(np.ascontiguousarray(x), np.ascontiguousarray(y))
+
+	def _index_points(self, serie_name: str, start: int, end: int, x_at):
+		"""Return the points of the rows from start to end (excluded) of a series, decimated with its index:
+		for each tile of about a pixel, the minimum and the maximum of the tile. It costs O(pixels).
 
 		Parameters
 		---------
-		path : str
-			The path where saves the graph
+		serie_name : str
+			The name of the series
+		start : int
+			The first row of the window
+		end : int
+			The last row of the window (excluded)
+		x_at : Callable[[numpy.ndarray], numpy.ndarray]
+			A function which returns the X values of rows
 
 		Returns
 		-------
-		path : str
-			The path where the graph is saved
+		points : Union[Tuple[numpy.ndarray, numpy.ndarray], None]
+			The X and Y coordinates of the points, None if the series has no index
+			or if the window is small enough to be decimated directly
 		"""
-		im = self.chartView.grab()
-		im.save(path)
-		return path
+		index = self._indexes.get(serie_name)
+		result = None if index is None else index.query(start, min(end, len(index)), self._plot_width())
+		if result is None:
+			return None
+		rows, size, minimum, maximum, _ = result
+		x, y = np.empty(2 * rows.size), np.empty(2 * rows.size)
+		x[0::2], x[1::2] = x_at(rows), x_at(rows + size // 2)
+		y[0::2], y[1::2] = minimum, maximum
+		return x, y
 
 	@Slot()
-	def on_toolButton_clicked(self):
-		"""Slot called when the signal 'clicked' of toolbutton is emited."""
-		if self.chartView.isHidden():
-			self.resize(self.width(), self._old_height)
-			self.toolButton.setArrowType(Qt.DownArrow)
-			self.chartView.show()
-			self.retracted.emit(False)
+	def _refresh_downsampled(self):
+		"""Decimate again the downsampled series, for example when the size of the plot changed."""
+		if self.isRetracted:
+			for serie_name in self._downsample:
+				self._dirty.setdefault(serie_name, False)
+			return
+		if self._gesture:
+			self._requery.update(self._downsample)
+			return
+		for serie_name in self._downsample:
+			self._push_points(serie_name)
+
+	def _connect_downsample_axis(self, series):
+		"""Decimate again a downsampled series when the range of its X axis changed.
 
-		else:
-			self._old_height = self.height()
-			self.resize(self.width(), 40)
-			self.toolButton.setArrowType(Qt.RightArrow)
-			self.chartView.hide()
-			self.retracted.emit(True)
+		Parameters
+		---------
+		series : QXYSeries
+			The downsampled series
+
+		Returns
+		-------
+		None
+		"""
+		name = series.name()
+		for axis in series.attachedAxes():
+			if axis.orientation() == Qt.Horizontal:
+				axis.rangeChanged.connect(lambda *_, name=name: self._on_x_range_changed(name))
+
+	def _on_x_range_changed(self, serie_name: str):
+		"""Called when the X range of a downsampled series changed: the points of the new range are set,
+		or only recorded during a zoom or a pan gesture (the points already loaded are moved by the chart).
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+
+		Returns
+		-------
+		None
+		"""
+		if self._gesture:
+			self._requery.add(serie_name)
+		elif serie_name in self._series:
+			self._push_points(serie_name)
+
+	def set_interactive(self, enabled: bool = True, debounce: int = 150, rubber_band=QChartView.RectangleRubberBand):
+		"""Enable the zoom and the pan with the mouse:
+		 * a rubber band zooms in the selected area (a right click zooms out)
+		 * the wheel zooms around the cursor
+		 * a drag with the middle button (or the left button with Shift) pans the chart
+		 * a double click resets the zoom
+		During a gesture, the chart only moves the points already loaded. The downsampled series are
+		decimated again for the new range and the width of the plot once the gesture stopped for `debounce` ms.
+
+		Parameters
+		---------
+		OPTIONAL[enabled] : bool
+			True to enable the interactions, False to disable them
+			Default: True
+		OPTIONAL[debounce] : int
+			The delay in milliseconds without event before the end of a gesture
+			Default: 150
+		OPTIONAL[rubber_band] : QChartView.RubberBand
+			The rubber band used to zoom, QChartView.HorizontalRubberBand to zoom only the X axis
+			(the wheel zooms the same axis)
+			Default: QChartView.RectangleRubberBand
+
+		Returns
+		-------
+		None
+		"""
+		self._interactive = enabled
+		self._requery_timer.setInterval(debounce)
+		if enabled:
+			self.chartView.setRubberBand(rubber_band)
+		else:
+			self.chartView.setRubberBand(QChartView.NoRubberBand)
+			self._requery_timer.stop()
+			self._end_gesture()
+		self._update_event_filter()
+
+	def set_hover(self, enabled: bool = True, tolerance: int = 15, tooltip: bool = True):
+		"""Enable the lookup of the point under the cursor: the nearest point of the line and scatter series
+		is searched in the full resolution data (not in the points decimated for the plot),
+		`pointHovered` is emitted and a tooltip shows its coordinates.
+		The points of a line series are found with a binary search on X (sorted),
+		the points of a scatter series with a grid built at the first lookup. A lookup costs O(log(n)).
+
+		Parameters
+		---------
+		OPTIONAL[enabled] : bool
+			True to enable the lookup, False to disable it
+			Default: True
+		OPTIONAL[tolerance] : int
+			The maximum distance in pixels between the cursor and the point
+			Default: 15
+		OPTIONAL[tooltip] : bool
+			If True, a tooltip shows the name of the series and the coordinates of the point
+			Default: True
+
+		Returns
+		-------
+		None
+		"""
+		self._hover = (tolerance, tooltip) if enabled else None
+		self._hovered = None
+		self.chartView.viewport().setMouseTracking(enabled)
+		if not enabled:
+			self._lookups.clear()
+			QToolTip.hideText()
+		self._update_event_filter()
+
+	def set_metrics(self, enabled: bool = True, interval: int = 1000, hud: bool = False, handler: logging.Handler = None):
+		"""Enable the instrumentation of the chart: the duration of `_add_points_data`, `_setup_axis`,
+		`_setup_bar_series`, `save` and of the paint of the QChartView, the number of points by series
+		and the paints by second. `metricsUpdated` is emitted every `interval` milliseconds.
+		The timed methods are wrapped on the instance only while the instrumentation is enabled:
+		when it's disabled, the chart runs its methods without any check or timer.
+
+		Parameters
+		---------
+		OPTIONAL[enabled] : bool
+			True to enable the instrumentation, False to disable it (the metrics are cleared)
+			Default: True
+		OPTIONAL[interval] : int
+			The interval between two metricsUpdated in milliseconds
+			Default: 1000
+		OPTIONAL[hud] : bool
+			If True, the metrics are displayed over the chart
+			Default: False
+		OPTIONAL[handler] : logging.Handler
+			A handler (a QtStreamHandler of devTools for example) to log the metrics at each interval,
+			with the logger "<module>.metrics"
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		if self._metrics is not None:  # remove the former instrumentation
+			for name in self._TIMED_METHODS:
+				self.__dict__.pop(name, None)
+			self._paint_timer.remove()
+			self._metrics_timer.stop()
+			if self._metrics_hud is not None:
+				self._metrics_hud.deleteLater()
+			if self._metrics_logger is not None:
+				self._metrics_logger[0].removeHandler(self._metrics_logger[1])
+			self._metrics = self._metrics_timer = self._paint_timer = self._metrics_hud = self._metrics_logger = None
+		if not enabled:
+			return
+
+		self._metrics = new_metrics()
+		for name in self._TIMED_METHODS:
+			setattr(self, name, timed(getattr(self, name), self._metrics, name.strip("_")))
+		self._paint_timer = PaintTimer(self._metrics)
+		self._paint_timer.install(self.chartView)
+		self._metrics_timer = QTimer(self)
+		self._metrics_timer.timeout.connect(self._emit_metrics)
+		self._metrics_timer.start(interval)
+		self._metrics_started = time.perf_counter()
+		if hud:
+			self._metrics_hud = MetricsHud(self.chartView)
+			self._metrics_hud.show()
+		if handler is not None:
+			logger = logging.getLogger(f"{__name__}.metrics")
+			logger.setLevel(logging.INFO)
+			logger.addHandler(handler)
+			self._metrics_logger = (logger, handler)
+
+	def metrics(self) -> dict:
+		"""Return the metrics of the last interval (see `set_metrics`).
+
+		Returns
+		-------
+		metrics : Union[dict, None]
+			"timings": Dict[str, Dict[str, float]], the calls, the total, the last and the maximum duration (ms) by name,
+			"points": Dict[str, int], the number of points (bars or slices) by series,
+			"fps": float, the paints of the chart by second during the last interval.
+			None if the instrumentation is disabled
+		"""
+		if self._metrics is None:
+			return None
+		return {"timings": {name: dict(timing) for name, timing in self._metrics["timings"].items()},
+			"points": dict(self._metrics["points"]), "fps": self._metrics["fps"]}
+
+	@Slot()
+	def _emit_metrics(self):
+		"""Update the fps and the points of the metrics, then emit metricsUpdated (and update the HUD and the log)."""
+		now = time.perf_counter()
+		self._metrics["fps"] = self._paint_timer.paints / max(1e-9, now - self._metrics_started)
+		self._paint_timer.paints, self._metrics_started = 0, now
+		self._metrics["points"] = {name: series.count() for name, series in self._series.items()}
+		metrics = self.metrics()
+		if self._metrics_hud is not None:
+			self._metrics_hud.set_metrics(metrics)
+		if self._metrics_logger is not None:
+			self._metrics_logger[0].info("%s\n%s", self.title, format_metrics(metrics))
+		self.metricsUpdated.emit(metrics)
+
+	def _update_event_filter(self):
+		"""Install the event filter on the QChartView if the interactions or the hover are enabled, else remove it."""
+		viewport = self.chartView.viewport()
+		viewport.removeEventFilter(self)
+		if self._interactive or self._hover is not None:
+			viewport.installEventFilter(self)
+
+	def _lookup_data(self, serie_name: str, series):
+		"""Return the full resolution points of a series for the hover lookup.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		series : QXYSeries
+			The series
+
+		Returns
+		-------
+		x : numpy.ndarray
+			The X-coordinates of points
+		y : numpy.ndarray
+			The Y-coordinates of points
+		grid : Union[GridIndex, None]
+			The grid of points for a scatter series or a series with unsorted X, else None
+		"""
+		lookup = self._lookups.get(serie_name)
+		if lookup is not None:
+			return lookup
+		if serie_name in self._full_data:
+			x, y = self._full_data[serie_name]
+		elif serie_name in self._buffers:
+			x, y = self._buffers[serie_name].arrays()
+		elif serie_name in self._points_data:
+			x, y = self._points_data[serie_name]
+		else:  # a series added with `add_series` or mapped on a model
+			points = series.points()
+			x = np.fromiter((point.x() for point in points), dtype=np.float64, count=len(points))
+			y = np.fromiter((point.y() for point in points), dtype=np.float64, count=len(points))
+		grid = None
+		if isinstance(series, QtCharts.QScatterSeries) or (x.size > 1 and np.any(x[1:] < x[:-1])):
+			grid = GridIndex(x, y)
+		self._lookups[serie_name] = (x, y, grid)
+		return x, y, grid
+
+	def _nearest_point(self, position):
+		"""Return the nearest point of a position of the QChartView, in the tolerance of the hover.
+
+		Parameters
+		---------
+		position : QPoint
+			The position in the QChartView
+
+		Returns
+		-------
+		point : Union[Tuple[str, float, float, float], None]
+			(name of the series, x, y, distance in pixels) or None if no point is near
+		"""
+		tolerance = self._hover[0]
+		chart_position = self.chart.mapFromScene(self.chartView.mapToScene(position))
+		plot = self.chart.plotArea()
+		if not plot.contains(chart_position):
+			return None
+		best = None
+		for serie_name, series in self._series.items():
+			if not isinstance(series, QtCharts.QXYSeries) or not series.isVisible():
+				continue
+			axes = {axis.orientation(): axis for axis in series.attachedAxes()}
+			if Qt.Horizontal not in axes or Qt.Vertical not in axes:
+				continue
+			value = self.chart.mapToValue(chart_position, series)
+			x_min, x_max = self._axis_range(axes[Qt.Horizontal])
+			y_min, y_max = self._axis_range(axes[Qt.Vertical])
+			radius_x = tolerance * (x_max - x_min) / plot.width()
+			radius_y = tolerance * (y_max - y_min) / plot.height()
+			if radius_x <= 0 or radius_y <= 0:
+				continue
+
+			if serie_name in self._sources:
+				source = self._sources[serie_name]
+				start, end = source.index(value.x() - radius_x), source.index(value.x() + radius_x)
+				if end - start > self._HOVER_SOURCE_ROWS:  # zoomed out: only the rows around the cursor are read
+					start = end = source.index(value.x())
+				x, y = source.read(start - 1, end + 1)
+				index = nearest_sorted_in_radius(x, y, value.x(), value.y(), radius_x, radius_y)
+			else:
+				x, y, grid = self._lookup_data(serie_name, series)
+				if grid is None:
+					index = nearest_sorted_in_radius(x, y, value.x(), value.y(), radius_x, radius_y)
+				else:
+					index = grid.nearest(value.x(), value.y(), radius_x, radius_y)
+			if index < 0:
+				continue
+			distance = tolerance * float(np.hypot((x[index] - value.x()) / radius_x, (y[index] - value.y()) / radius_y))
+			if best is None or distance < best[3]:
+				best = (serie_name, float(x[index]), float(y[index]), distance)
+		return best
+
+	def _format_value(self, axis, value: float) -> str:
+		"""Return a value as displayed by an axis (a date for a QDateTimeAxis)."""
+		if isinstance(axis, QtCharts.QDateTimeAxis):
+			return QDateTime.fromMSecsSinceEpoch(int(value)).toString(axis.format())
+		return f"{value:.6g}"
+
+	def _hover_at(self, event):
+		"""Emit `pointHovered` and show the tooltip of the nearest point of the cursor."""
+		position = event.position().toPoint()
+		point = self._nearest_point(position)
+		if point is None:
+			if self._hovered is not None:
+				self._hovered = None
+				QToolTip.hideText()
+			return
+		serie_name, x, y, _ = point
+		if (serie_name, x, y) == self._hovered:
+			return
+		self._hovered = (serie_name, x, y)
+		self.pointHovered.emit(serie_name, x, y)
+		if self._hover[1]:
+			axes = {axis.orientation(): axis for axis in self._series[serie_name].attachedAxes()}
+			text = (f"{serie_name}\nx: {self._format_value(axes[Qt.Horizontal], x)}"
+				f"\ny: {self._format_value(axes[Qt.Vertical], y)}")
+			QToolTip.showText(self.chartView.viewport().mapToGlobal(position), text, self.chartView)
+
+	def _begin_gesture(self):
+		"""Start (or continue) a zoom or pan gesture: the new ranges are recorded until the end of the gesture."""
+		self._gesture = True
+		self._requery_timer.stop()
+
+	@Slot()
+	def _end_gesture(self):
+		"""End a gesture: the downsampled series are decimated for their new range in one batch."""
+		self._gesture = False
+		requery, self._requery = self._requery, set()
+		if not requery:
+			return
+		with self.batch():
+			for serie_name in requery:
+				if serie_name in self._series:
+					self._push_points(serie_name)
+
+	def _zoom_at(self, position, factor: float):
+		"""Zoom the chart by factor around a position of the QChartView (the X axis only with a horizontal rubber band)."""
+		plot = self.chart.plotArea()
+		center = self.chart.mapFromScene(self.chartView.mapToScene(position))
+		rect = QRectF(plot)
+		rect.setWidth(plot.width() / factor)
+		rect.moveLeft(center.x() - (center.x() - plot.left()) / factor)
+		if self.chartView.rubberBand() != QChartView.HorizontalRubberBand:
+			rect.setHeight(plot.height() / factor)
+			rect.moveTop(center.y() - (center.y() - plot.top()) / factor)
+		self.chart.zoomIn(rect)
+
+	def eventFilter(self, watched, event):
+		"""Filter the mouse events of the QChartView when the interactions or the hover are enabled
+		(see `set_interactive` and `set_hover`)."""
+		if watched is not self.chartView.viewport():
+			return super(GraphicWidget, self).eventFilter(watched, event)
+		event_type = event.type()
+		if self._hover is not None:
+			if event_type == QEvent.MouseMove and self._pan_origin is None:
+				self._hover_at(event)
+			elif event_type == QEvent.Leave:
+				self._hovered = None
+				QToolTip.hideText()
+		if not self._interactive:
+			return super(GraphicWidget, self).eventFilter(watched, event)
+		if event_type == QEvent.Wheel:
+			self._begin_gesture()
+			self._zoom_at(event.position().toPoint(), 1.25 ** (event.angleDelta().y() / 120))
+			self._requery_timer.start()
+			return True
+		if event_type == QEvent.MouseButtonPress and (event.button() == Qt.MiddleButton
+			or (event.button() == Qt.LeftButton and event.modifiers() & Qt.ShiftModifier)):
+			self._begin_gesture()
+			self._pan_origin = event.position()
+			return True
+		if event_type == QEvent.MouseMove and self._pan_origin is not None:
+			delta = event.position() - self._pan_origin
+			self._pan_origin = event.position()
+			horizontal_only = self.chartView.rubberBand() == QChartView.HorizontalRubberBand
+			self.chart.scroll(-delta.x(), 0 if horizontal_only else delta.y())
+			return True
+		if event_type == QEvent.MouseButtonRelease and self._pan_origin is not None:
+			self._pan_origin = None
+			self._requery_timer.start()
+			return True
+		if event_type == QEvent.MouseButtonDblClick and event.button() == Qt.LeftButton:
+			self.chart.zoomReset()
+			return True
+		return super(GraphicWidget, self).eventFilter(watched, event)
+
+	def add_line_series(self, serie_name: str, x: list, y: list,
+		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm", legend: bool = True,
+		capacity: int = None, downsample: str = None, x_axis: str = None, y_axis: str = None):
+		"""Add a line series to  the chart with x and y data.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		x : Iterable
+			Data for X axis, a numeric numpy array (or buffer) uses the vectorized ingest
+		y : Iterable
+			Data for Y axis, a numeric numpy array (or buffer) uses the vectorized ingest
+		OPTIONAL[datetime_axis] : bool
+			If True, the X axis is a QDatetimeAxis else a QValueAxis
+			Default: False
+		OPTIONAL[datetime_fmt] : str
+			If datetime_axis is True, specify the datetime format.
+			Default: "yyyy-MM-dd h:mm"
+		OPTIONAL[legend] : bool
+			Specify if the legend must be visible.
+			Default: True
+		OPTIONAL[capacity] : int
+			If specified, the points are kept in a ring buffer of this capacity
+			and new points can be streamed with `append_points`.
+			Default: None
+		OPTIONAL[downsample] : str, "minmax" or "lttb"
+			If specified, all points are kept by the widget and the series only receives
+			the visible points decimated to the width of the plot (peaks are kept).
+			The points are decimated again when the plot is resized or the X range changed.
+			Default: None
+		OPTIONAL[x_axis] : str
+			The name of the X axis of the series, created if it doesn't exist (see `add_axis`).
+			If None, the series uses the first X axis with a similar range or a new axis.
+			Default: None
+		OPTIONAL[y_axis] : str
+			The name of the Y axis of the series, created if it doesn't exist (see `add_axis`).
+			If None, the series uses the first Y axis with a similar range or a new axis.
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		line_series = QtCharts.QLineSeries(name=serie_name)
+		self._setup_xy_series(line_series, x, y, datetime_axis, datetime_fmt, legend, capacity, downsample, x_axis, y_axis)
+		
+
+	def _aggregate_sets(self, sets: dict, xlabels: list, n: int, other_label: str = "Other"):
+		"""Keep the `n` categories of the bar sets with the largest total and aggregate the others.
+
+		Parameters
+		---------
+		sets : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
+			The bar sets, with the same number of values
+		xlabels : Union[List[str], None]
+			The labels of the categories, None for range(size_of_sets_values)
+		n : Union[int, None]
+			The number of categories kept, None to keep all categories
+		OPTIONAL[other_label] : str
+			The label of the aggregated category
+			Default: "Other"
+
+		Returns
+		-------
+		sets : Dict[label, values]
+			The aggregated bar sets
+		xlabels : List[str]
+			The labels of the categories kept
+		"""
+		if n is None or not sets:
+			return sets, xlabels
+		if xlabels is None:
+			xlabels = [str(i) for i in range(len(next(iter(sets.values()))))]
+		xlabels, values = top_n_(xlabels, list(sets.values()), n, other_label)
+		return dict(zip(sets.keys(), values.tolist())), xlabels
+
+	def add_bar_series(self, serie_name: str, sets: dict, xlabels: list = None, legend: bool = True,
+		top_n: int = None, other_label: str = "Other"):
+		"""Add a bar series to the chart with the sets data.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		sets : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
+			The sets to display in this bar series
+		OPTIONAL[xlabels] : List[str]
+			The labels to use for X axis.
+			Default: range(size_of_sets_values)
+		OPTIONAL[legend] : bool
+			Specify if the legend must be visible.
+			Default: True
+		OPTIONAL[top_n] : int
+			If specified, only the `top_n` categories with the largest total are displayed,
+			the other categories are aggregated in a category `other_label`.
+			Default: None
+		OPTIONAL[other_label] : str
+			The label of the aggregated category
+			Default: "Other"
+
+		Returns
+		-------
+		None
+		"""
+		sets, xlabels = self._aggregate_sets(sets, xlabels, top_n, other_label)
+		bar_series = QtCharts.QBarSeries(name=serie_name)
+		if self._defer_add(bar_series, self._setup_bar_series, bar_series=bar_series, sets=sets, xlabels=xlabels,
+			percent=False, legend=legend):
+			return
+		self.add_series(bar_series)
+		self._setup_bar_series(bar_series, sets, xlabels, percent=False, legend=legend)
+
+	def add_barPercent_series(self, serie_name: str, data: dict, categories: list, legend: bool = True,
+		top_n: int = None, other_label: str = "Other"):
+		"""Setup the bar set and axis for a bar or bar percent series.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		data : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
+			The sets to display in this bar series
+		categories : List[str]
+			The labels to use for X axis.
+		OPTIONAL[legend] : bool
+			Specify if the legend must be visible.
+			Default: True
+		OPTIONAL[top_n] : int
+			If specified, only the `top_n` categories with the largest total are displayed,
+			the other categories are aggregated in a category `other_label`.
+			Default: None
+		OPTIONAL[other_label] : str
+			The label of the aggregated category
+			Default: "Other"
+
+		Returns
+		-------
+		None
+		"""
+		data, categories = self._aggregate_sets(data, categories, top_n, other_label)
+		bar_series = QtCharts.QPercentBarSeries(name=serie_name)
+		if self._defer_add(bar_series, self._setup_bar_series, bar_series=bar_series, sets=data, xlabels=categories,
+			percent=True, legend=legend):
+			return
+		self.add_series(bar_series)
+		self._setup_bar_series(bar_series, data, categories, percent=True, legend=legend)
+
+	def add_pie_series(self, serie_name: str, data: dict, legend: bool = True,
+		top_n: int = None, other_label: str = "Other"):
+		"""Add a pie series to  the chart with data
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		data : Dict[label, value], format: {"label1": 3, "label2": 6}
+			Data for pie series
+		OPTIONAL[legend] : bool
+			Specify if the legend must be visible.
+			Default: True
+		OPTIONAL[top_n] : int
+			If specified, only the `top_n` largest slices are displayed,
+			the other values are aggregated in a slice `other_label`.
+			Default: None
+		OPTIONAL[other_label] : str
+			The label of the aggregated slice
+			Default: "Other"
+
+		Returns
+		-------
+		None
+		"""
+		# the slices are added before the series is on the chart: a slice added to a series of the chart lays out the whole pie
+		pie_series = QtCharts.QPieSeries(name=serie_name)
+		pie_series.append(self._pie_slices(data, top_n, other_label))
+		if self._defer_add(pie_series, self._set_legend_visible, visible=legend):
+			return
+		self.add_series(pie_series)
+		self._set_legend_visible(legend)
+
+	def _pie_slices(self, data: dict, top_n: int = None, other_label: str = "Other") -> list:
+		"""Return the slices of a pie series, with the `top_n` largest values and a slice `other_label`.
+
+		Parameters
+		---------
+		data : Dict[label, value], format: {"label1": 3, "label2": 6}
+			The data of the pie series
+		OPTIONAL[top_n] : int
+			The number of slices kept, None to keep all values
+			Default: None
+		OPTIONAL[other_label] : str
+			The label of the aggregated slice
+			Default: "Other"
+
+		Returns
+		-------
+		slices : List[QPieSlice]
+			The slices, in the order of data
+		"""
+		if top_n is not None:
+			labels, values = top_n_(list(data.keys()), list(data.values()), top_n, other_label)
+			data = dict(zip(labels, values.tolist()))
+		return [QtCharts.QPieSlice(str(label), float(value)) for label, value in data.items()]
+
+	def update_pie_series(self, serie_name: str, data: dict, top_n: int = None, other_label: str = "Other"):
+		"""Replace the values of the slices of a pie series, the slices are in the order of `data`.
+		If only a few values changed, the slices are updated in place,
+		else the slices are replaced in one call (a new label, a new order or many new values).
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the pie series
+		data : Dict[label, value], format: {"label1": 3, "label2": 6}
+			The new data of the pie series
+		OPTIONAL[top_n] : int
+			If specified, only the `top_n` largest slices are displayed,
+			the other values are aggregated in a slice `other_label`.
+			Default: None
+		OPTIONAL[other_label] : str
+			The label of the aggregated slice
+			Default: "Other"
+
+		Returns
+		-------
+		None
+		"""
+		series = self._series[serie_name]
+		if not isinstance(series, QtCharts.QPieSeries):
+			raise TypeError(f"'{serie_name}' is not a pie series")
+		if self.isRetracted:
+			self._defer_sets(self.update_pie_series, serie_name, data=data, top_n=top_n, other_label=other_label)
+			return
+		new_slices = self._pie_slices(data, top_n, other_label)
+		slices = series.slices()
+		if [pie_slice.label() for pie_slice in slices] != [pie_slice.label() for pie_slice in new_slices]:
+			changed = None  # new labels or a new order ("Other" stays the last slice): the series is built again
+		else:
+			changed = [(pie_slice, new_slice.value()) for pie_slice, new_slice in zip(slices, new_slices)
+				if pie_slice.value() != new_slice.value()]
+		if changed is None or len(changed) > self._MAX_INPLACE_CHANGES:
+			series.clear()
+			series.append(new_slices)
+		else:
+			for pie_slice, value in changed:
+				pie_slice.setValue(value)
+
+	def add_scatter_series(self, serie_name: str, x: list = [], y: list = [], marker=QtCharts.QScatterSeries.MarkerShapeCircle,
+		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm", size: float = 10., legend: bool = True,
+		capacity: int = None, downsample: str = None, x_axis: str = None, y_axis: str = None):
+		"""Add a scatter series to  the chart with x and y data.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		x : Iterable
+			Data for X axis, a numeric numpy array (or buffer) uses the vectorized ingest
+		y : Iterable
+			Data for Y axis, a numeric numpy array (or buffer) uses the vectorized ingest
+		OPTIONAL[marker] : QScatterSeries.MarkerShape
+			The shape of markers to use
+			Default: QScatterSeries.MarkerShapeCircle
+		OPTIONAL[datetime_axis] : bool
+			If True, the X axis is a QDatetimeAxis else a QValueAxis
+			Default: False
+		OPTIONAL[datetime_fmt] : str
+			If datetime_axis is True, specify the datetime format.
+			Default: "yyyy-MM-dd h:mm"
+		OPTIONAL[size] : float
+			The size of markers
+			Default: 10.
+		OPTIONAL[legend] : bool
+			Specify if the legend must be visible.
+			Default: True
+		OPTIONAL[capacity] : int
+			If specified, the points are kept in a ring buffer of this capacity
+			and new points can be streamed with `append_points`.
+			Default: None
+		OPTIONAL[downsample] : str, "minmax" or "lttb"
+			If specified, all points are kept by the widget and the series only receives
+			the visible points decimated to the width of the plot (peaks are kept).
+			The points are decimated again when the plot is resized or the X range changed.
+			Default: None
+		OPTIONAL[x_axis] : str
+			The name of the X axis of the series, created if it doesn't exist (see `add_axis`).
+			If None, the series uses the first X axis with a similar range or a new axis.
+			Default: None
+		OPTIONAL[y_axis] : str
+			The name of the Y axis of the series, created if it doesn't exist (see `add_axis`).
+			If None, the series uses the first Y axis with a similar range or a new axis.
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		scatter_series = QtCharts.QScatterSeries(name=serie_name)
+		scatter_series.setMarkerSize(size)
+		scatter_series.setMarkerShape(marker)
+		self._setup_xy_series(scatter_series, x, y, datetime_axis, datetime_fmt, legend, capacity, downsample, x_axis, y_axis)
+
+	def add_model_series(self, serie_name: str, model, x_column: int = 0, y_column: int = 1, kind: str = "line",
+		datetime_axis: bool = False, datetime_fmt: str = "yyyy-MM-dd h:mm", legend: bool = True,
+		x_axis: str = None, y_axis: str = None):
+		"""Add a line or scatter series which follows two columns of a model: the dataChanged signal of the model
+		updates the points changed. The series is mapped on the model with a QVXYModelMapper, except for an ArrayTableModel:
+		its arrays are read in one step, without a copy in Python objects (the series keeps its own copy of the points, in C++),
+		and a change of a single row replaces only its point.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		model : QAbstractItemModel
+			The model, an ArrayTableModel to avoid a copy of the arrays
+		OPTIONAL[x_column] : int
+			The column of the model for the X axis
+			Default: 0
+		OPTIONAL[y_column] : int
+			The column of the model for the Y axis
+			Default: 1
+		OPTIONAL[kind] : str, "line" or "scatter"
+			The kind of series
+			Default: "line"
+		OPTIONAL[datetime_axis] : bool
+			If True, the X axis is a QDatetimeAxis else a QValueAxis
+			Default: False
+		OPTIONAL[datetime_fmt] : str
+			If datetime_axis is True, specify the datetime format.
+			Default: "yyyy-MM-dd h:mm"
+		OPTIONAL[legend] : bool
+			Specify if the legend must be visible.
+			Default: True
+		OPTIONAL[x_axis] : str
+			The name of the X axis of the series
+			Default: None
+		OPTIONAL[y_axis] : str
+			The name of the Y axis of the series
+			Default: None
+
+		Returns
+		-------
+		mapper : Union[QVXYModelMapper, None]
+			The mapper between the model and the series, None for an ArrayTableModel
+			(the series reads the arrays of the model in one step at each change)
+		"""
+		if kind == "line":
+			series = QtCharts.QLineSeries(name=serie_name)
+		elif kind == "scatter":
+			series = QtCharts.QScatterSeries(name=serie_name)
+		else:
+			raise ValueError(f"kind must be 'line' or 'scatter', not '{kind}'")
+
+		if not any(model is other for other, _, _ in self._model_series.values()):
+			model.dataChanged.connect(self._on_model_data_changed)
+			model.modelReset.connect(self._on_model_reset)
+		self._model_series[serie_name] = (model, x_column, y_column)
+		if isinstance(model, ArrayTableModel):
+			# the columns are converted in float64 arrays in one step (no copy for float64 arrays),
+			# a QVXYModelMapper would read each cell with a call of `data`
+			self._setup_xy_series(series, model.column(x_column), model.column(y_column), datetime_axis, datetime_fmt,
+				legend, x_axis=x_axis, y_axis=y_axis)
+			return None
+
+		mapper = QtCharts.QVXYModelMapper(series)
+		mapper.setXColumn(x_column)
+		mapper.setYColumn(y_column)
+		mapper.setSeries(series)
+		mapper.setModel(model)
+		self.add_series(series)
+		self._attach_stream_axis(series, datetime_axis=datetime_axis, datetime_fmt=datetime_fmt,
+			x_axis=x_axis, y_axis=y_axis)
+		self._set_legend_visible(legend)
+		if model.rowCount() > 0:
+			self._extend_model_range(serie_name, 0, model.rowCount() - 1)
+		return mapper
+
+	@Slot()
+	def _on_model_reset(self):
+		"""Called when a model of series mapped by `add_model_series` is reset: the points are read again."""
+		model = self.sender()
+		for serie_name, (source, x_column, y_column) in list(self._model_series.items()):
+			if source is model and isinstance(model, ArrayTableModel):
+				self.update_series(serie_name, model.column(x_column), model.column(y_column))
+			elif source is model and model.rowCount() > 0:
+				self._lookups.pop(serie_name, None)
+				self._extend_model_range(serie_name, 0, model.rowCount() - 1, reset=True)
+
+	def _on_model_data_changed(self, top_left, bottom_right, roles=None):
+		"""Called when the data of a model of series mapped by `add_model_series` changed.
+		The series of an ArrayTableModel replace the point of the row changed (a change of a single row),
+		else they read their columns again (in one step) and their axis are set to the range of the points.
+		The axis of the other series are extended to the values changed (the mapper updates the points).
+
+		Parameters
+		---------
+		top_left : QModelIndex
+			The top left index changed
+		bottom_right : QModelIndex
+			The bottom right index changed
+		OPTIONAL[roles] : List[int]
+			The roles changed
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		model = top_left.model()
+		for serie_name, (source, x_column, y_column) in list(self._model_series.items()):
+			if source is not model or not any(top_left.column() <= column <= bottom_right.column() for column in (x_column, y_column)):
+				continue
+			if isinstance(model, ArrayTableModel):
+				first, last = top_left.row(), bottom_right.row()
+				if last - first >= self._MODEL_REPLACE_ROWS or not self._replace_model_points(serie_name, first, last):
+					self.update_series(serie_name, model.column(x_column), model.column(y_column))
+			else:
+				self._lookups.pop(serie_name, None)
+				self._extend_model_range(serie_name, top_left.row(), bottom_right.row())
+
+	def _replace_model_points(self, serie_name: str, first_row: int, last_row: int) -> bool:
+		"""Replace the points of rows of a series mapped on an ArrayTableModel, one by one,
+		and extend the range of its axis to the new values.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		first_row : int
+			The first row changed
+		last_row : int
+			The last row changed (included)
+
+		Returns
+		-------
+		replaced : bool
+			False if the points must be read again with `update_series`
+			(the widget is retracted, a change of the series is pending or the number of rows changed)
+		"""
+		series, points = self._series.get(serie_name), self._points_data.get(serie_name)
+		if (series is None or points is None or self.isRetracted or serie_name in self._pending_adds
+			or serie_name in self._pending_points or serie_name in self._dirty or series.count() != points[0].size):
+			return False
+		model, x_column, y_column = self._model_series[serie_name]
+		if model.rowCount() != series.count():
+			return False
+		x = float_array(model.column(x_column)[first_row:last_row + 1], self._tz)
+		y = float_array(model.column(y_column)[first_row:last_row + 1], self._tz)
+		points[0][first_row:last_row + 1], points[1][first_row:last_row + 1] = x, y  # the points of the hover
+		for row, (X, Y) in enumerate(zip(x.tolist(), y.tolist()), first_row):
+			series.replace(row, QPointF(X, Y))
+		self._lookups.pop(serie_name, None)
+		self._extend_model_range(serie_name, first_row, last_row)
+		return True
+
+	def _extend_model_range(self, serie_name: str, first_row: int, last_row: int, reset: bool = False):
+		"""Extend the range of the axis of a series mapped on a model
+		to the values of the rows from first_row to last_row, read with the `data` of the model.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		first_row : int
+			The first row changed
+		last_row : int
+			The last row changed (included)
+		OPTIONAL[reset] : bool
+			If True, the range of the axis is set to the range of the values instead of extended
+			Default: False
+
+		Returns
+		-------
+		None
+		"""
+		model, x_column, y_column = self._model_series[serie_name]
+		series = self._series.get(serie_name)
+		if series is None:
+			return
+		x, y = (float_array([model.data(model.index(row, column)) for row in range(first_row, last_row + 1)], self._tz)
+			for column in (x_column, y_column))
+		if x.size == 0 or y.size == 0:
+			return
+		for axis in series.attachedAxes():
+			minimum, maximum = bounds(x if axis.orientation() == Qt.Horizontal else y)
+			if not reset:
+				current = self._axis_range(axis)
+				minimum, maximum = min(minimum, current[0]), max(maximum, current[1])
+			self._set_axis_range(axis, minimum, maximum)
+
+	def add_dataframe(self, dataframe, x: str = None, y=None, kind: str = "line", **options):
+		"""Add one line or scatter series per column of a pandas DataFrame or of an Arrow table.
+		The columns are read from their NumPy or Arrow buffers, without a Python object per value:
+		a float64 column is used without copy and a datetime column (datetime64, timezone aware
+		or Arrow timestamp) is converted in milliseconds since epoch in one vectorized step.
+		pandas and pyarrow are not required by the widget, only the table passed.
+
+		Parameters
+		---------
+		dataframe : Union[pandas.DataFrame, pyarrow.Table]
+			The table of data
+		OPTIONAL[x] : str
+			The name of the column for the X axis, the index of the DataFrame if None
+			(required for an Arrow table)
+			Default: None
+		OPTIONAL[y] : Union[str, List[str]]
+			The name(s) of the column(s) to display, a series is created for each column with its name.
+			If None, all the columns except x.
+			Default: None
+		OPTIONAL[kind] : str, "line" or "scatter"
+			The kind of series
+			Default: "line"
+		OPTIONAL[**options]
+			The optional parameters of `add_line_series` or `add_scatter_series`.
+			If datetime_axis is not specified, it's True if the X column is a datetime column.
+
+		Returns
+		-------
+		None
+		"""
+		arrow = hasattr(dataframe, "schema") and hasattr(dataframe, "column_names")
+		columns = list(dataframe.column_names if arrow else dataframe.columns)
+		if x is None:
+			if arrow:
+				raise ValueError("x must be specified for an Arrow table")
+			x_column = dataframe.index
+		else:
+			x_column = dataframe.column(x) if arrow else dataframe[x]
+		if y is None:
+			y = [column for column in columns if column != x]
+		elif isinstance(y, str):
+			y = [y]
+
+		options.setdefault("datetime_axis", is_datetime_column(x_column))
+		x_values = column_array(x_column, self._tz)
+		x_range = bounds(x_values) if x_values.size > 0 else None
+		with self.batch():
+			for column in y:
+				y_values = column_array(dataframe.column(column) if arrow else dataframe[column], self._tz)
+				y_range = bounds(y_values) if y_values.size > 0 else None
+				self._add_xy_series(kind, str(column), x_values, y_values, options, x_range, y_range)
+
+	def add_memmap_series(self, serie_name: str, source, kind: str = "line", downsample: str = "minmax", **options):
+		"""Add a line or scatter series over a binary file, for files larger than the memory.
+		Only the rows in the range of the X axis are read, decimated to the width of the plot:
+		a zoom or a pan reads the new window from the file and the memory used doesn't depend on its size.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		source : Union[MemmapSource, numpy.memmap, str]
+			The data source, a numpy.memmap or the path of a raw float64 file (one value by row)
+			are used with the default layout of MemmapSource
+		OPTIONAL[kind] : str, "line" or "scatter"
+			The kind of series
+			Default: "line"
+		OPTIONAL[downsample] : str, "minmax" or "lttb"
+			The decimation method
+			Default: "minmax"
+		OPTIONAL[**options]
+			The other optional parameters of `add_line_series` or `add_scatter_series`
+			(capacity is not supported)
+
+		Returns
+		-------
+		source : MemmapSource
+			The data source of the series, closed by `clear_chart`
+		"""
+		if not isinstance(source, MemmapSource):
+			source = MemmapSource(source)
+		x_range = source.x_range()
+		if x_range is None:
+			x = y = np.empty(0, dtype=np.float64)
+		else:
+			x, y = source.window(*x_range, self._plot_width(), downsample)
+		options.pop("capacity", None)
+		options.pop("downsample", None)
+		self._sources[serie_name] = source
+		self._downsample[serie_name] = downsample
+		self._add_xy_series(kind, serie_name, x, y, options, x_range, bounds(y) if y.size > 0 else None)
+		return source
+
+	def refresh_source(self, serie_name: str, rescale: bool = True):
+		"""Display the rows appended to the file of a series added with `add_memmap_series`
+		(a recording in progress). The index of the series is completed with the new rows only.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		OPTIONAL[rescale] : bool
+			If True, the range of the X axis is set to the range of the file.
+			Default: True
+
+		Returns
+		-------
+		new_rows : int
+			The number of rows appended since the last refresh
+		"""
+		source = self._sources.get(serie_name)
+		if source is None:
+			raise KeyError(f"'{serie_name}' is not a series added with add_memmap_series")
+		new_rows = source.refresh()
+		index = self._indexes.get(serie_name)
+		if index is not None and serie_name not in self._index_workers:
+			for start in range(len(index), len(source), source.chunk_size):
+				index.append(source.read(start, start + source.chunk_size)[1])
+		if new_rows:
+			self._series_changed(serie_name, rescale)
+		return new_rows
+
+	def build_index(self, serie_name: str, path: str = None, base: int = 16):
+		"""Build the multi-resolution min/max index of a downsampled series in a QThreadPool.
+		When it's built (`indexReady` is emitted), a window of any size is decimated in O(pixels) with the index.
+		For a series added with `add_memmap_series`, the index is saved next to the file
+		and loaded again by the next call: only the rows appended to the file since are indexed.
+
+		The index of a downsampled series is built again by `update_series`,
+		the index of a series added with `add_memmap_series` is completed by `refresh_source`.
+		A series with a capacity can't be indexed: the oldest rows of its ring buffer are dropped at each append.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series, a series added with `add_memmap_series` or a downsampled series without capacity
+		OPTIONAL[path] : str
+			The file where the index is saved and loaded, by default "<file of the source>.pyramid.npz"
+			for a series added with `add_memmap_series`, else the index is not saved
+			Default: None
+		OPTIONAL[base] : int
+			The number of values in a tile of the level 0 of the index, a power of two
+			Default: 16
+
+		Returns
+		-------
+		None
+		"""
+		if serie_name in self._sources:
+			data = self._sources[serie_name]
+			if path is None:
+				path = data.path + ".pyramid.npz"
+		elif serie_name in self._full_data:
+			data = self._full_data[serie_name][1]
+		elif serie_name in self._buffers:
+			raise TypeError(f"'{serie_name}' has a capacity, the points of a ring buffer can't be indexed")
+		else:
+			raise KeyError(f"'{serie_name}' is not a downsampled series")
+
+		index = None
+		if path is not None and os.path.exists(path):
+			index = PyramidIndex.load(path)
+			if index.base != base or len(index) > len(data):  # an index of another file
+				index = None
+		worker = PyramidWorker(PyramidIndex(base) if index is None else index, data, path)
+		worker.signals.finished.connect(lambda index, name=serie_name, worker=worker: self._on_index_ready(name, worker, index))
+		worker.signals.error.connect(lambda error, name=serie_name, worker=worker: self._on_index_error(name, worker, error))
+		self._index_workers[serie_name] = worker
+		QThreadPool.globalInstance().start(worker)
+
+	def _on_index_ready(self, serie_name: str, worker: PyramidWorker, index: PyramidIndex):
+		"""Called in the GUI thread when the index of a series is built: the series is decimated with its index."""
+		if self._index_workers.get(serie_name) is not worker:  # an outdated index or the chart was cleared
+			return
+		del self._index_workers[serie_name]
+		source = self._sources.get(serie_name)
+		if source is not None:  # the rows appended to the file during the build
+			for start in range(len(index), len(source), source.chunk_size):
+				index.append(source.read(start, start + source.chunk_size)[1])
+		self._indexes[serie_name] = index
+		self._push_points(serie_name)
+		self.indexReady.emit(serie_name)
+
+	def _on_index_error(self, serie_name: str, worker: PyramidWorker, error: Exception):
+		"""Called in the GUI thread when the build of an index failed: the series is decimated without index
+		and `seriesError` is emitted with the error."""
+		if self._index_workers.get(serie_name) is not worker:  # an outdated index or the chart was cleared
+			return
+		del self._index_workers[serie_name]
+		if self._indexes.pop(serie_name, None) is not None and serie_name in self._series:
+			self._push_points(serie_name)
+		self.seriesError.emit(serie_name, error)
+
+	def add_line_series_async(self, serie_name: str, x, y, **options):
+		"""Add a line series to the chart, the points data are converted
+		(datetime in milliseconds since epoch) and their ranges computed in a QThreadPool.
+		The series is added in the GUI thread and `seriesReady` is emitted when it's done.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		x : Iterable
+			Data for X axis
+		y : Iterable
+			Data for Y axis
+		OPTIONAL[**options]
+			The optional parameters of `add_line_series`
+
+		Returns
+		-------
+		None
+		"""
+		self._start_points_worker("line", serie_name, x, y, options)
+
+	def add_scatter_series_async(self, serie_name: str, x, y, **options):
+		"""Add a scatter series to the chart, the points data are converted
+		(datetime in milliseconds since epoch) and their ranges computed in a QThreadPool.
+		The series is added in the GUI thread and `seriesReady` is emitted when it's done.
+
+		Parameters
+		---------
+		serie_name : str
+			The series name.
+		x : Iterable
+			Data for X axis
+		y : Iterable
+			Data for Y axis
+		OPTIONAL[**options]
+			The optional parameters of `add_scatter_series`
+
+		Returns
+		-------
+		None
+		"""
+		self._start_points_worker("scatter", serie_name, x, y, options)
+
+	def _start_points_worker(self, kind: str, serie_name: str, x, y, options: dict):
+		"""Start a PointsWorker in the global QThreadPool to prepare the points of a series.
+		If the series is requested again before the end of the worker, the former result is ignored.
+
+		Parameters
+		---------
+		kind : str, "line" or "scatter"
+			The kind of series
+		serie_name : str
+			The series name.
+		x : Iterable
+			Data for X axis
+		y : Iterable
+			Data for Y axis
+		options : dict
+			The optional parameters of `add_line_series` or `add_scatter_series`
+
+		Returns
+		-------
+		None
+		"""
+		self._last_request_id += 1
+		worker = PointsWorker(self._last_request_id, x, y, self._tz)
+		worker.signals.finished.connect(self._on_points_ready)
+		worker.signals.error.connect(self._on_points_error)
+		self._async_requests[serie_name] = (self._last_request_id, kind, options, worker)
+		QThreadPool.globalInstance().start(worker)
+
+	@Slot(object)
+	def _on_points_ready(self, result: tuple):
+		"""Slot called in the GUI thread when a PointsWorker has prepared the points of a series."""
+		request_id, x, y, x_range, y_range = result
+		serie_name = next((name for name, request in self._async_requests.items() if request[0] == request_id), None)
+		if serie_name is None:  # an outdated request or the chart was cleared
+			return
+		_, kind, options, _ = self._async_requests.pop(serie_name)
+		self._add_xy_series(kind, serie_name, x, y, options, x_range, y_range)
+		self.seriesReady.emit(serie_name)
+
+	def _add_xy_series(self, kind: str, serie_name: str, x, y, options: dict, x_range: tuple = None, y_range: tuple = None):
+		"""Create a line or scatter series with the optional parameters of `add_line_series`
+		or `add_scatter_series` in a dict and add it to the chart.
+
+		Parameters
+		---------
+		kind : str, "line" or "scatter"
+			The kind of series
+		serie_name : str
+			The series name.
+		x : Iterable
+			Data for X axis
+		y : Iterable
+			Data for Y axis
+		options : dict
+			The optional parameters of `add_line_series` or `add_scatter_series`
+		OPTIONAL[x_range] : Tuple[float, float]
+			The range of x if it's already computed
+			Default: None
+		OPTIONAL[y_range] : Tuple[float, float]
+			The range of y if it's already computed
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		if kind == "line":
+			series = QtCharts.QLineSeries(name=serie_name)
+		elif kind == "scatter":
+			series = QtCharts.QScatterSeries(name=serie_name)
+			series.setMarkerSize(options.get("size", 10.))
+			series.setMarkerShape(options.get("marker", QtCharts.QScatterSeries.MarkerShapeCircle))
+		else:
+			raise ValueError(f"kind must be 'line' or 'scatter', not '{kind}'")
+		self._setup_xy_series(series, x, y, options.get("datetime_axis", False),
+			options.get("datetime_fmt", "yyyy-MM-dd h:mm"), options.get("legend", True),
+			options.get("capacity"), options.get("downsample"), options.get("x_axis"), options.get("y_axis"),
+			x_range=x_range, y_range=y_range)
+
+	@Slot(int, object)
+	def _on_points_error(self, request_id: int, error: Exception):
+		"""Slot called in the GUI thread when a PointsWorker failed, `seriesError` is emitted with the error."""
+		serie_name = next((name for name, request in self._async_requests.items() if request[0] == request_id), None)
+		if serie_name is None:  # an outdated request or the chart was cleared
+			return
+		del self._async_requests[serie_name]
+		self.seriesError.emit(serie_name, error)
+
+	def append_points(self, serie_name: str, x, y):
+		"""Append points to a line or scatter series created with a capacity.
+		The oldest points are dropped when the capacity is reached
+		and the range of the axis attached to the series is updated, no axis is created.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		x : Union[Iterable, int, float, QDateTime, datetime]
+			The X-coordinate(s) of new points
+		y : Union[Iterable, int, float]
+			The Y-coordinate(s) of new points
+
+		Returns
+		-------
+		None
+		"""
+		if serie_name in self._pending_adds:  # the buffer is created by the setup of the series
+			self._setup_pending(serie_name)
+		buffer = self._buffers.get(serie_name)
+		if buffer is None:
+			raise KeyError(f"'{serie_name}' is not a series created with a capacity")
+		buffer.extend(float_array(x, self._tz), float_array(y, self._tz))
+		self._series_changed(serie_name, rescale=True)
+
+	def update_series(self, serie_name: str, x, y, rescale: bool = True):
+		"""Replace the points of a line or scatter series in place.
+		The series keeps its axis, its legend marker and its options (capacity, downsampling).
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		x : Iterable
+			The new X-coordinates of points
+		y : Iterable
+			The new Y-coordinates of points
+		OPTIONAL[rescale] : bool
+			If True, the range of the axis attached to the series is set to the range of the new points.
+			Default: True
+
+		Returns
+		-------
+		None
+		"""
+		series = self._series[serie_name]
+		if not isinstance(series, QtCharts.QXYSeries):
+			raise TypeError(f"'{serie_name}' is not a line or scatter series")
+		x, y = float_array(x, self._tz), float_array(y, self._tz)
+		size = min(x.size, y.size)
+		x, y = x[:size], y[:size]
+
+		if serie_name in self._pending_adds:  # the series is set up with the new points when the widget is expanded
+			self._frame_counters["changes"] += 1
+			self._frame_counters["coalesced"] += 1
+			self._pending_adds[serie_name][1].update(x=x, y=y, x_range=None, y_range=None)
+			return
+		if serie_name in self._buffers:
+			buffer = self._buffers[serie_name]
+			buffer.clear()
+			buffer.extend(x, y)
+			x, y = buffer.arrays()
+		elif serie_name in self._full_data:
+			if size > 1 and np.any(x[1:] < x[:-1]):
+				order = np.argsort(x, kind="stable")
+				x, y = x[order], y[order]
+			self._full_data[serie_name] = (x, y)
+			index = self._indexes.pop(serie_name, None)  # the index of the former values
+			worker = self._index_workers.pop(serie_name, None)
+			if index is not None or worker is not None:  # the index is built again for the new values
+				self.build_index(serie_name, base=(index or worker.index).base)
+		else:
+			self._pending_points[serie_name] = (x, y)
+		self._series_changed(serie_name, rescale)
+
+	def set_max_fps(self, fps: float = None):
+		"""Limit the rate of the updates of the chart by `append_points` and `update_series`.
+		With a maximum rate, the data changes only mark the series as dirty and a timer applies
+		all the pending changes with a single repaint, at most `fps` times per second.
+
+		Parameters
+		---------
+		OPTIONAL[fps] : float
+			The maximum number of updates per second (30 or 60 for example),
+			None to apply each change immediately.
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		self._max_fps = fps
+		if fps is None:
+			self._frame_timer.stop()
+			self._flush_frame()
+		else:
+			self._frame_timer.setInterval(max(1, round(1000 / fps)))
+
+	def frame_counters(self) -> dict:
+		"""Return the counters of the updates limited by `set_max_fps`.
+
+		Returns
+		-------
+		counters : Dict[str, int]
+			"changes": the data changes received,
+			"frames": the updates applied (one repaint each),
+			"coalesced": the changes applied with another change in the same frame (repaints saved),
+			"dropped": the frames missed because the timer was late (busy event loop)
+		"""
+		return dict(self._frame_counters)
+
+	def reset_frame_counters(self):
+		"""Reset the counters returned by `frame_counters`"""
+		self._frame_counters = {"changes": 0, "frames": 0, "coalesced": 0, "dropped": 0}
+
+	def _series_changed(self, serie_name: str, rescale: bool):
+		"""Apply the change of the data of a series, or mark the series as dirty if the rate is limited
+		or if the widget is retracted (the dirty series are applied when the widget is expanded).
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		rescale : bool
+			If True, the range of the axis attached to the series is set to the range of its points.
+
+		Returns
+		-------
+		None
+		"""
+		self._frame_counters["changes"] += 1
+		self._lookups.pop(serie_name, None)
+		retracted = self.isRetracted
+		if self._max_fps is None and not retracted:
+			self._frame_counters["frames"] += 1
+			self._apply_series_change(serie_name, rescale)
+			return
+		self._dirty[serie_name] = self._dirty.get(serie_name, False) or rescale
+		self._dirty_changes += 1
+		if not retracted and not self._frame_timer.isActive():
+			self._frame_scheduled = time.perf_counter()
+			self._frame_timer.start()
+
+	def _apply_series_change(self, serie_name: str, rescale: bool):
+		"""Set the points of a series after a change of its data and update its axis.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the series
+		rescale : bool
+			If True, the range of the axis attached to the series is set to the range of its points.
+
+		Returns
+		-------
+		None
+		"""
+		series = self._series.get(serie_name)
+		if series is None:  # removed since the change
+			return
+		if serie_name in self._sources:
+			x_range = self._sources[serie_name].x_range()
+			if rescale and x_range is not None:
+				for axis in series.attachedAxes():
+					if axis.orientation() == Qt.Horizontal:
+						self._set_axis_range(axis, *x_range)
+			self._push_points(serie_name)
+			return
+		ranges = None
+		if serie_name in self._pending_points:
+			x, y = self._pending_points.pop(serie_name)
+			series.replaceNp(x, y)
+			self._points_data[serie_name] = (x, y)
+		elif serie_name in self._buffers:
+			x, y = self._buffers[serie_name].arrays()
+			ranges = self._buffers[serie_name].bounds()  # kept by the buffer, the window is not reduced
+			if serie_name not in self._downsample:  # the push of a downsampled series needs the new X range
+				self._replace_buffer_points(series, x, y, ranges if rescale else None)
+				return
+		else:
+			x, y = self._full_data[serie_name]
+
+		if rescale:
+			self._update_axis_range(series, x, y, ranges)
+		if serie_name in self._buffers or serie_name in self._full_data:
+			self._push_points(serie_name)
+
+	@Slot()
+	def _flush_frame(self):
+		"""Slot called by the frame timer: apply all the pending changes with a single repaint.
+		Nothing is done while the widget is retracted, the changes are kept for the expand."""
+		if not self._dirty or self.isRetracted:
+			return
+		if self._frame_scheduled is not None and self._max_fps is not None:
+			late = time.perf_counter() - self._frame_scheduled - self._frame_timer.interval() / 1000
+			self._frame_counters["dropped"] += max(0, int(late * self._max_fps))
+		self._frame_scheduled = None
+
+		dirty, self._dirty = self._dirty, {}
+		self._frame_counters["frames"] += 1
+		self._frame_counters["coalesced"] += self._dirty_changes - 1
+		self._dirty_changes = 0
+		with self.batch():
+			for serie_name, rescale in dirty.items():
+				self._apply_series_change(serie_name, rescale)
+
+	def update_bar_sets(self, serie_name: str, sets: dict, rescale: bool = True, xlabels: list = None,
+		top_n: int = None, other_label: str = "Other"):
+		"""Replace the values of the bar sets of a bar series in place.
+		The bar sets with a label in `sets` are updated, the new labels are added as new bar sets
+		and the bar sets with a label not in `sets` are removed.
+
+		Parameters
+		---------
+		serie_name : str
+			The name of the bar series
+		sets : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
+			The new values of the sets
+		OPTIONAL[rescale] : bool
+			If True, the range of the Y axis is set to the range of the new values
+			(except for a percent bar series).
+			Default: True
+		OPTIONAL[xlabels] : List[str]
+			The new labels of the categories, None to keep the current labels
+			(required with top_n if the categories changed).
+			Default: None
+		OPTIONAL[top_n] : int
+			If specified, only the `top_n` categories with the largest total are displayed,
+			the other categories are aggregated in a category `other_label`.
+			Default: None
+		OPTIONAL[other_label] : str
+			The label of the aggregated category
+			Default: "Other"
+
+		Returns
+		-------
+		None
+		"""
+		series = self._series[serie_name]
+		if not isinstance(series, QtCharts.QAbstractBarSeries):
+			raise TypeError(f"'{serie_name}' is not a bar series")
+		if self.isRetracted:
+			self._defer_sets(self.update_bar_sets, serie_name, sets=sets, rescale=rescale, xlabels=xlabels,
+				top_n=top_n, other_label=other_label)
+			return
+		category_axis = next((axis for axis in series.attachedAxes() if isinstance(axis, QtCharts.QBarCategoryAxis)), None)
+		if top_n is not None and xlabels is None and category_axis is not None:
+			xlabels = category_axis.categories()
+		sets, xlabels = self._aggregate_sets(sets, xlabels, top_n, other_label)
+		if xlabels is not None and category_axis is not None and category_axis.categories() != list(xlabels):
+			category_axis.setCategories(list(xlabels))
+
+		bar_sets = {bar_set.label(): bar_set for bar_set in series.barSets()}
+		for label, bar_set in bar_sets.items():
+			if label not in sets:
+				series.remove(bar_set)
+		for label, values in sets.items():
+			bar_set = bar_sets.get(label)
+			if bar_set is None:
+				bar_set = QtCharts.QBarSet(label)
+				bar_set.append(list(values))
+				series.append(bar_set)
+				continue
+			values = np.asarray(values, dtype=np.float64)
+			count = bar_set.count()
+			if count == values.size:
+				current = np.fromiter((bar_set.at(i) for i in range(count)), dtype=np.float64, count=count)
+				changed = np.flatnonzero(current != values)
+				if changed.size <= self._MAX_INPLACE_CHANGES:  # a few values: replaced one by one
+					for i in changed.tolist():
+						bar_set.replace(i, float(values[i]))
+					continue
+			bar_set.remove(0, count)  # the values are set again in one call
+			bar_set.append(values.tolist())
+
+		if rescale and sets and not isinstance(series, QtCharts.QPercentBarSeries):
+			min_value, max_value = sets_bounds(sets)
+			for axis in series.attachedAxes():
+				if axis.orientation() == Qt.Vertical and isinstance(axis, QtCharts.QValueAxis):
+					self._set_axis_range(axis, min_value, max_value)
+
+	def _defer_sets(self, method, serie_name: str, **arguments):
+		"""Queue the update of a bar or pie series while the widget is retracted.
+		Only the last update of each series is kept, it's applied when the widget is expanded.
+
+		Parameters
+		---------
+		method : Callable
+			The update method (`update_bar_sets` or `update_pie_series`)
+		serie_name : str
+			The name of the series
+		**arguments
+			The other arguments of the update method
+
+		Returns
+		-------
+		None
+		"""
+		self._frame_counters["changes"] += 1
+		if serie_name in self._pending_sets:
+			self._frame_counters["coalesced"] += 1
+		self._pending_sets[serie_name] = (method, arguments)
+
+	def _defer_add(self, new_series, setup, **arguments) -> bool:
+		"""Queue the setup of a series added while the widget is retracted (conversion of the points,
+		points set in the series, axis, ...). The series is registered now, so it can be updated,
+		and it's set up when the widget is expanded, before the queued updates.
+
+		Parameters
+		---------
+		new_series : QAbstractSeries
+			The series added
+		setup : Callable
+			The method which sets up the series (after it's added to the chart)
+		**arguments
+			The arguments of setup
+
+		Returns
+		-------
+		deferred : bool
+			True if the setup is queued, False if the widget isn't retracted
+		"""
+		if not self.isRetracted or new_series.chart() is not None:  # not retracted, or set up by `_setup_pending`
+			return False
+		self._frame_counters["changes"] += 1
+		self._series[new_series.name()] = new_series
+		self._pending_adds[new_series.name()] = (setup, arguments)
+		return True
+
+	def _setup_pending(self, serie_name: str):
+		"""Add to the chart and set up a series queued by `_defer_add`."""
+		setup, arguments = self._pending_adds.pop(serie_name)
+		self.add_series(self._series[serie_name])
+		setup(**arguments)
+
+	def clear_chart(self):
+		"""Clear all the chart"""
+		self.chart.removeAllSeries()
+		self._series.clear()
+		self._async_requests.clear()
+		self._frame_timer.stop()
+		self._frame_scheduled = None
+		self._dirty.clear()
+		self._dirty_changes = 0
+		self._requery_timer.stop()
+		self._requery.clear()
+		self._gesture = self._pan_origin is not None  # a wheel gesture ends with the timer, a pan with the release
+		self._pending_points.clear()
+		self._pending_sets.clear()
+		self._pending_adds.clear()
+		for model in {id(model): model for model, _, _ in self._model_series.values()}.values():
+			model.dataChanged.disconnect(self._on_model_data_changed)
+			model.modelReset.disconnect(self._on_model_reset)
+		self._model_series.clear()
+		self._axes.clear()
+		self._pending_ranges.clear()
+		self._silent_series.clear()
+		self._buffers.clear()
+		self._full_data.clear()
+		self._downsample.clear()
+		for source in self._sources.values():  # the series are removed, their files are unmapped
+			source.close()
+		self._sources.clear()
+		self._indexes.clear()
+		self._index_workers.clear()
+		self._lookups.clear()
+		self._points_data.clear()
+		self._hovered = None
+		for axis in self.chart.axes():
+			self.chart.removeAxis(axis)
+
+	def render_chart(self, painter: QPainter, target: QRectF, size: QSizeF = None):
+		"""Paint the chart with a painter, without grab the widget (the widget can be hidden).
+		The chart is laid out at `size`, painted in `target` and laid out again at its previous size.
+
+		Parameters
+		---------
+		painter : QPainter
+			The painter to use (on a QImage, a QSvgGenerator, a QPdfWriter, ...)
+		target : QRectF
+			The rectangle where the chart is painted
+		OPTIONAL[size] : QSizeF
+			The size used to lay out the chart (fonts, markers and lines keep their size in this space).
+			Default: the size of target
+
+		Returns
+		-------
+		None
+		"""
+		if size is None:
+			size = target.size()
+		geometry = self.chart.geometry()
+		self.chart.resize(size)
+		self.chart.scene().render(painter, target, QRectF(self.chart.pos(), size))
+		self.chart.setGeometry(geometry)
+
+	def to_image(self, width: int, height: int, dpi: int = 96) -> QImage:
+		"""Render the chart in a QImage.
+
+		Parameters
+		---------
+		width : int
+			The width of the image in pixels
+		height : int
+			The height of the image in pixels
+		OPTIONAL[dpi] : int
+			The resolution of the image, the chart is laid out at the size of the image at 96 dpi
+			so a higher resolution gives a sharper image with the same layout.
+			Default: 96
+
+		Returns
+		-------
+		image : QImage
+			The image of the chart
+		"""
+		image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+		image.fill(Qt.white)
+		dots_per_meter = round(dpi / 0.0254)
+		image.setDotsPerMeterX(dots_per_meter)
+		image.setDotsPerMeterY(dots_per_meter)
+
+		painter = QPainter(image)
+		painter.setRenderHint(QPainter.Antialiasing)
+		self.render_chart(painter, QRectF(0, 0, width, height), QSizeF(width, height) * (96 / dpi))
+		painter.end()
+		return image
+
+	def save(self, path: str, width: int = None, height: int = None, dpi: int = 96) -> str:
+		"""Save the current chart in the specified path.
+		The chart is rendered directly (the widget doesn't need to be shown):
+		in a SVG file if path ends with ".svg", in a PDF file if it ends with ".pdf", else in an image.
+
+		Parameters
+		---------
+		path : str
+			The path where saves the graph
+		OPTIONAL[width] : int
+			The width of the graph in pixels (at `dpi`)
+			Default: the width of the QChartView
+		OPTIONAL[height] : int
+			The height of the graph in pixels (at `dpi`)
+			Default: the height of the QChartView
+		OPTIONAL[dpi] : int
+			The resolution of the graph
+			Default: 96
+
+		Returns
+		-------
+		path : str
+			The path where the graph is saved
+		"""
+		width = self.chartView.width() if width is None else width
+		height = self.chartView.height() if height is None else height
+		target = QRectF(0, 0, width, height)
+		layout_size = QSizeF(width, height) * (96 / dpi)
+		suffix = path.lower().rsplit(".", 1)[-1]
+
+		if suffix == "svg":
+			from PySide6.QtSvg import QSvgGenerator
+			generator = QSvgGenerator()
+			generator.setFileName(path)
+			generator.setSize(QSize(width, height))
+			generator.setViewBox(target)
+			generator.setResolution(dpi)
+			generator.setTitle(self.title)
+			painter = QPainter(generator)
+			self.render_chart(painter, target, layout_size)
+			painter.end()
+
+		elif suffix == "pdf":
+			writer = QPdfWriter(path)
+			writer.setResolution(dpi)
+			writer.setPageSize(QPageSize(QSizeF(width / dpi * 72, height / dpi * 72), QPageSize.Point))
+			writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+			writer.setTitle(self.title)
+			painter = QPainter(writer)
+			self.render_chart(painter, QRectF(painter.viewport()), layout_size)
+			painter.end()
+
+		elif not self.to_image(width, height, dpi).save(path):
+			raise OSError(f"The graph can't be saved in '{path}'")
+		return path
+
+	def set_retracted(self, retracted: bool):
+		"""Retract (hide the chart) or expand the widget.
+		While the widget is retracted, the chart is in a batch of updates (no layout and no repaint)
+		and the changes of data (`append_points`, `update_series`, `update_bar_sets`, `update_pie_series`)
+		are only queued. The series added (by `add_line_series`, `add_scatter_series`, `add_bar_series`,
+		`add_barPercent_series`, `add_pie_series`, `add_dataframe`, `add_memmap_series` and the async methods)
+		are registered but their setup (conversion of the points, points set in the series, axis) is queued too,
+		an update of a queued series replaces its points. Everything is applied in one update when the widget is expanded.
+		The series of `add_model_series` follow their model and are set up immediately.
+
+		Parameters
+		---------
+		retracted : bool
+			True to retract the widget, False to expand it
+
+		Returns
+		-------
+		None
+		"""
+		if retracted == self.isRetracted:
+			return
+		if retracted:
+			self._old_height = self.height()
+			self._frame_timer.stop()
+			self.begin_update()
+			self.resize(self.width(), 40)
+			self.toolButton.setArrowType(Qt.RightArrow)
+			self.chartView.hide()
+		else:
+			self.resize(self.width(), self._old_height)
+			self.toolButton.setArrowType(Qt.DownArrow)
+			self.chartView.show()
+			for serie_name in list(self._pending_adds):
+				self._setup_pending(serie_name)
+			pending_sets, self._pending_sets = self._pending_sets, {}
+			for serie_name, (method, arguments) in pending_sets.items():
+				if serie_name in self._series:
+					method(serie_name, **arguments)
+			self._frame_scheduled = None
+			self._flush_frame()
+			self.end_update()
+		self.retracted.emit(retracted)
+
+	@Slot()
+	def on_toolButton_clicked(self):
+		"""Slot called when the signal 'clicked' of toolbutton is emited."""
+		self.set_retracted(not self.isRetracted)
 
 
 if __name__ == "__main__":
@@ -702,8 +3215,7 @@ if __name__ == "__main__":
 	# line
 	line_graph.set_title("Line chart example")
 	import numpy as np
-	from PySide6.QtCore import QDateTime, QDate, QTime
-	x = np.array([QDateTime(QDate(2021, j, i), QTime(12, 0)).toMSecsSinceEpoch() for j in range(3, 6) for i in range(1, 31)])
+	x = np.datetime64("2021-03-01T12:00") + np.arange(90) * np.timedelta64(1, "D")
 	line_graph.add_line_series('series 1', x=x, y=[i**2 + 100 for i in range(90)], datetime_axis=True)
 	
 	line_graph.show()
@@ -0,0 +1,149 @@
+"""
+Lookups of the nearest point of a series under the cursor, without a hit test of each point.
+"""
+
+from math import ceil, sqrt
+
+import numpy as np
+
+
+def nearest_sorted_in_radius(x, y, px: float, py: float, radius_x: float, radius_y: float) -> int:
+	"""Return the index of the nearest point of (px, py) in the ellipse of radius (radius_x, radius_y) (x sorted):
+	the points of the X window [px - radius_x, px + radius_x] are found with a binary search,
+	the distance is normalized by the radius as in `GridIndex.nearest`.
+
+	Parameters
+	---------
+	x : numpy.ndarray
+		The X-coordinates of points, sorted
+	y : numpy.ndarray
+		The Y-coordinates of points
+	px : float
+		The X-coordinate of the position
+	py : float
+		The Y-coordinate of the position
+	radius_x : float
+		The radius on the X axis, greater than 0
+	radius_y : float
+		The radius on the Y axis, greater than 0
+
+	Returns
+	-------
+	index : int
+		The index of the nearest point, -1 if no point is in the radius
+	"""
+	start = int(np.searchsorted(x, px - radius_x, side="left"))
+	end = int(np.searchsorted(x, px + radius_x, side="right"))
+	if start >= end:
+		return -1
+	distances = ((x[start:end] - px) / radius_x) ** 2 + ((y[start:end] - py) / radius_y) ** 2
+	distances[np.isnan(distances)] = np.inf  # the gaps of a line (NaN values)
+	best = int(distances.argmin())
+	return start + best if distances[best] <= 1 else -1
+
+
+class GridIndex:
+	"""A uniform grid over the points of a scatter series: the points are sorted by cell
+	so the points of a row of cells are contiguous. A lookup only reads the cells
+	around the position, about `cell_points` points by cell.
+
+	Public Methods
+	--------------
+	nearest
+		Return the index of the nearest point of a position, in a radius
+	"""
+
+	def __init__(self, x, y, cell_points: int = 4):
+		"""Build the grid of points (O(n log(n))).
+
+		Parameters
+		---------
+		x : numpy.ndarray
+			The X-coordinates of points
+		y : numpy.ndarray
+			The Y-coordinates of points
+		OPTIONAL[cell_points] : int
+			The mean number of points by cell
+			Default: 4
+		"""
+		size = min(x.size, y.size)
+		self._x, self._y = x[:size], y[:size]
+		finite = np.isfinite(self._x) & np.isfinite(self._y)
+		indexes = np.flatnonzero(finite)
+		self._cells = max(1, ceil(sqrt(indexes.size / cell_points)))
+		if indexes.size == 0:
+			self._origin, self._cell_size = (0., 0.), (1., 1.)
+			self._order, self._starts = indexes, np.zeros(self._cells ** 2 + 1, dtype=np.int64)
+			return
+		x_min, x_max = self._x[indexes].min(), self._x[indexes].max()
+		y_min, y_max = self._y[indexes].min(), self._y[indexes].max()
+		self._origin = (x_min, y_min)
+		self._cell_size = ((x_max - x_min) / self._cells or 1., (y_max - y_min) / self._cells or 1.)
+		columns, rows = self._cell(self._x[indexes], self._y[indexes])
+		keys = rows * self._cells + columns
+		order = np.argsort(keys, kind="stable")
+		self._order = indexes[order]
+		self._starts = np.searchsorted(keys[order], np.arange(self._cells ** 2 + 1))
+
+	def _cell(self, x, y):
+		"""Return the column and the row of the cells of positions."""
+		columns = np.clip(((x - self._origin[0]) / self._cell_size[0]).astype(np.int64), 0, self._cells - 1)
+		rows = np.clip(((y - self._origin[1]) / self._cell_size[1]).astype(np.int64), 0, self._cells - 1)
+		return columns, rows
+
+	def nearest(self, x: float, y: float, radius_x: float, radius_y: float) -> int:
+		"""Return the index of the nearest point of (x, y) in the ellipse of radius (radius_x, radius_y),
+		the distance is normalized by the radius (a radius of N pixels in data units gives a distance in pixels).
+
+		Parameters
+		---------
+		x : float
+			The X-coordinate of the position
+		y : float
+			The Y-coordinate of the position
+		radius_x : float
+			The radius on the X axis, greater than 0
+		radius_y : float
+			The radius on the Y axis, greater than 0
+
+		Returns
+		-------
+		index : int
+			The index of the nearest point, -1 if no point is in the radius
+		"""
+		(first_column, last_column), (first_row, last_row) = self._cell(
+			np.array([x - radius_x, x + radius_x]), np.array([y - radius_y, y + radius_y]))
+		candidates = [self._order[self._starts[row * self._cells + first_column]:self._starts[row * self._cells + last_column + 1]]
+			for row in range(first_row, last_row + 1)]
+		candidates = np.concatenate(candidates) if candidates else self._order[:0]
+		if candidates.size == 0:
+			return -1
+		distances = ((self._x[candidates] - x) / radius_x) ** 2 + ((self._y[candidates] - y) / radius_y) ** 2
+		best = int(distances.argmin())
+		return int(candidates[best]) if distances[best] <= 1 else -1
+
+
+if __name__ == "__main__":
+	import time
+
+	rng = np.random.default_rng(0)
+	x, y = rng.normal(size=1_000_000), rng.normal(size=1_000_000)
+	start = time.perf_counter()
+	grid = GridIndex(x, y)
+	print(f"grid of {x.size} points: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+	positions = rng.normal(size=(1000, 2))
+	start = time.perf_counter()
+	found = [grid.nearest(px, py, 0.01, 0.01) for px, py in positions]
+	print(f"lookup: {(time.perf_counter() - start) * 1000 / len(positions):.3f} ms")
+	for (px, py), index in zip(positions[:50], found):
+		distances = ((x - px) / 0.01) ** 2 + ((y - py) / 0.01) ** 2
+		expected = int(distances.argmin()) if distances.min() <= 1 else -1
+		assert index == expected, (index, expected)
+
+	order = np.argsort(x)
+	x_sorted, y_sorted = x[order], y[order]
+	start = time.perf_counter()
+	for px, py in positions:
+		nearest_sorted_in_radius(x_sorted, y_sorted, px, py, 0.01, 0.01)
+	print(f"binary search: {(time.perf_counter() - start) * 1000 / len(positions):.4f} ms")
@@ -0,0 +1,293 @@
+"""
+A data source over a binary file of points, read by windows to plot files larger than the memory.
+"""
+
+import os
+from math import ceil
+
+import numpy as np
+
+from .decimation import decimate
+
+
+class MemmapSource:
+	"""The points of a binary file (a numpy.memmap or a raw file with a dtype and a layout).
+	The file is a sequence of records of `columns` values, the X values are a column sorted
+	or implicit (x_start + i * x_step).
+
+	The file is mapped in memory with a numpy.memmap (read only): only the pages of the rows read are loaded,
+	by chunks of `chunk_size` rows decimated one after the other, so the memory used doesn't depend on the size of the file.
+
+	Public Attributes
+	-----------------
+	path : str
+		The path of the file
+	dtype : numpy.dtype
+		The type of the values in the file
+	columns : int
+		The number of values by record
+	chunk_size : int
+		The maximum number of rows read at once
+
+	Public Methods
+	--------------
+	refresh
+		Update the number of rows after data were appended to the file
+	x_range
+		Return the first and the last X value
+	x_at
+		Return the X values of rows
+	index
+		Return the index of the first row with a X value greater or equal to a value
+	read
+		Read the points of a range of rows
+	window
+		Read the points of a X range, decimated to a width in pixels
+	close
+		Release the map of the file
+	"""
+
+	def __init__(self, source, dtype="float64", columns: int = 1, y_column: int = 0, x_column: int = None,
+		x_start: float = 0., x_step: float = 1., offset: int = 0, chunk_size: int = 1 << 20):
+		"""Initialize a MemmapSource
+
+		Parameters
+		---------
+		source : Union[str, numpy.memmap]
+			The path of a raw binary file or a numpy.memmap (its dtype, shape and offset are used)
+		OPTIONAL[dtype] : numpy.dtype
+			The type of the values in a raw file
+			Default: "float64"
+		OPTIONAL[columns] : int
+			The number of values by record in a raw file
+			Default: 1
+		OPTIONAL[y_column] : int
+			The column of the Y values
+			Default: 0
+		OPTIONAL[x_column] : int
+			The column of the X values (sorted), None for implicit X values: x_start + i * x_step
+			Default: None
+		OPTIONAL[x_start] : float
+			The X value of the first row if x_column is None
+			Default: 0.
+		OPTIONAL[x_step] : float
+			The step between the X values of two rows if x_column is None, greater than 0
+			Default: 1.
+		OPTIONAL[offset] : int
+			The size of the header of a raw file in bytes
+			Default: 0
+		OPTIONAL[chunk_size] : int
+			The maximum number of rows read at once
+			Default: 1048576
+		"""
+		if isinstance(source, np.memmap):
+			self.path = source.filename
+			self.dtype = source.dtype
+			self.columns = source.shape[1] if source.ndim == 2 else 1
+			offset = source.offset
+		else:
+			self.path = os.fspath(source)
+			self.dtype = np.dtype(dtype)
+			self.columns = columns
+		self.y_column = y_column
+		self.x_column = x_column
+		self.x_start = x_start
+		self.x_step = x_step
+		self.offset = offset
+		self.chunk_size = chunk_size
+		self._record_size = self.dtype.itemsize * self.columns
+		self._rows = 0
+		self._records = None  # the map of the rows, (rows, columns)
+		self._closed = False
+		self._map((os.path.getsize(self.path) - offset) // self._record_size)
+
+	def __len__(self):
+		return self._rows
+
+	def _map(self, rows: int):
+		"""Map the first `rows` rows of the file (no map for an empty file)."""
+		self._rows = max(0, rows)
+		self._records = None if self._rows == 0 else np.memmap(
+			self.path, dtype=self.dtype, mode="r", offset=self.offset, shape=(self._rows, self.columns))
+
+	def _mapped(self) -> np.memmap:
+		"""Return the map of the rows, raise a ValueError if the source is closed."""
+		if self._closed:
+			raise ValueError(f"the source of '{self.path}' is closed")
+		return self._records
+
+	def refresh(self) -> int:
+		"""Update the number of rows, after data were appended to the file (a recording in progress).
+
+		Returns
+		-------
+		new_rows : int
+			The number of rows added since the last refresh
+		"""
+		rows = (os.path.getsize(self.path) - self.offset) // self._record_size
+		new_rows = rows - self._rows
+		if new_rows != 0 and not self._closed:  # the map is extended to the new rows
+			self._map(rows)
+		return new_rows
+
+	def _value(self, row: int, column: int) -> float:
+		"""Read a single value of the file."""
+		return float(self._mapped()[row, column])
+
+	def _x(self, row: int) -> float:
+		"""Return the X value of a row."""
+		if self.x_column is None:
+			return self.x_start + row * self.x_step
+		return self._value(row, self.x_column)
+
+	def x_range(self):
+		"""Return the first and the last X value (the X values are sorted).
+
+		Returns
+		-------
+		range : Union[Tuple[float, float], None]
+			The range of X, None if the file is empty
+		"""
+		if self._rows == 0:
+			return None
+		return self._x(0), self._x(self._rows - 1)
+
+	def x_at(self, rows):
+		"""Return the X values of rows (only the pages of these rows are read).
+
+		Parameters
+		---------
+		rows : numpy.ndarray
+			The indexes of the rows
+
+		Returns
+		-------
+		x : numpy.ndarray
+			The X values (float64)
+		"""
+		if self.x_column is None:
+			return self.x_start + np.asarray(rows, dtype=np.float64) * self.x_step
+		return np.array(self._mapped()[np.asarray(rows, dtype=np.intp), self.x_column], dtype=np.float64)
+
+	def index(self, value: float) -> int:
+		"""Return the index of the first row with a X value greater or equal to value
+		(a binary search which reads about log2(rows) values).
+
+		Parameters
+		---------
+		value : float
+			The X value
+
+		Returns
+		-------
+		index : int
+			The index of the row, between 0 and len(self)
+		"""
+		if self.x_column is None:
+			return int(min(self._rows, max(0, ceil((value - self.x_start) / self.x_step))))
+		low, high = 0, self._rows
+		while low < high:
+			middle = (low + high) // 2
+			if self._x(middle) < value:
+				low = middle + 1
+			else:
+				high = middle
+		return low
+
+	def read(self, start: int, end: int):
+		"""Read the points of the rows from start to end (excluded).
+
+		Parameters
+		---------
+		start : int
+			The first row
+		end : int
+			The last row (excluded)
+
+		Returns
+		-------
+		x : numpy.ndarray
+			The X-coordinates of points (float64)
+		y : numpy.ndarray
+			The Y-coordinates of points (float64)
+		"""
+		start, end = max(0, start), min(self._rows, end)
+		records = self._mapped()
+		if records is None or end <= start:
+			return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+		records = records[start:end]
+		# copies: the points don't keep a reference on the map
+		y = np.array(records[:, self.y_column], dtype=np.float64)
+		if self.x_column is None:
+			x = self.x_start + np.arange(start, end, dtype=np.float64) * self.x_step
+		else:
+			x = np.array(records[:, self.x_column], dtype=np.float64)
+		return x, y
+
+	def window(self, x_min: float, x_max: float, width: int, method: str = "minmax"):
+		"""Read the points between x_min and x_max, decimated to `width` pixels.
+		The rows are read by chunks of whole bins of the decimation, so the result is the same
+		as a decimation of all the points of the window, with at most `chunk_size` rows in memory.
+
+		Parameters
+		---------
+		x_min : float
+			The minimum X value of the window
+		x_max : float
+			The maximum X value of the window
+		width : int
+			The width of the plot in pixels
+		OPTIONAL[method] : str, "minmax" or "lttb"
+			The decimation method
+			Default: "minmax"
+
+		Returns
+		-------
+		x : numpy.ndarray
+			The X-coordinates of the points kept
+		y : numpy.ndarray
+			The Y-coordinates of the points kept
+		"""
+		# keep a point on each side so the line reaches the borders of the plot
+		start = max(0, self.index(x_min) - 1)
+		end = min(self._rows, self.index(x_max) + 1)
+		count = end - start
+		if count <= 2 * width + 2:
+			return self.read(start, end)
+
+		bin_size = ceil(count / width)
+		chunk = max(1, self.chunk_size // bin_size) * bin_size
+		parts_x, parts_y = [], []
+		for chunk_start in range(start, end, chunk):
+			x, y = self.read(chunk_start, min(end, chunk_start + chunk))
+			x, y = decimate(x, y, ceil(x.size / bin_size), method)
+			parts_x.append(x)
+			parts_y.append(y)
+		return np.concatenate(parts_x), np.concatenate(parts_y)
+
+	def close(self):
+		"""Release the map of the file (the file is unmapped when the arrays read from the map are released).
+		The source can't be read after."""
+		self._closed = True
+		self._records = None
+
+
+if __name__ == "__main__":
+	import tempfile
+	import tracemalloc
+
+	# A file of 50 millions points (400 MB): the memory allocated doesn't depend on its size
+	# (the pages of the map are loaded on demand and the system can evict them)
+	rows = 50_000_000
+	with tempfile.NamedTemporaryFile(suffix=".f64", delete=False) as file:
+		for start in range(0, rows, 1 << 18):
+			np.sin(np.arange(start, min(rows, start + (1 << 18)), dtype=np.float64) / 1e5).tofile(file)
+	source = MemmapSource(file.name)
+	tracemalloc.start()
+	x, y = source.window(*source.x_range(), 800)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	print(f"{len(source)} rows -> {x.size} points, y in [{y.min():.3f}, {y.max():.3f}], "
+		f"peak allocated {peak / 2 ** 20:.1f} MiB")
+	source.close()
+	os.remove(file.name)
@@ -0,0 +1,340 @@
+"""
+Helpers to prepare points data for the QXYSeries of GraphicWidget.
+"""
+
+from datetime import datetime, timedelta, timezone, tzinfo
+
+import numpy as np
+from PySide6.QtCore import QDateTime
+
+
+# milliseconds by unit of numpy.datetime64
+_MSECS_BY_UNIT = {
+	"W": 604_800_000., "D": 86_400_000., "h": 3_600_000., "m": 60_000., "s": 1_000.,
+	"ms": 1., "us": 1e-3, "ns": 1e-6, "ps": 1e-9, "fs": 1e-12, "as": 1e-15,
+}
+_EPOCH = datetime(1970, 1, 1)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def numeric_array(values, tz=None):
+	"""Return values as a contiguous float64 array if it's a numeric array.
+
+	Numpy arrays and objects which support the buffer protocol (array.array, memoryview, ...)
+	are accepted. No copy is done if values is already a contiguous float64 buffer.
+	A datetime64 array is converted in milliseconds since epoch (see `datetime64_to_msecs`).
+
+	Parameters
+	---------
+	values : Any
+		The values to convert
+	OPTIONAL[tz] : Union[str, tzinfo, None]
+		The timezone of a datetime64 array, None for the local time
+		Default: None
+
+	Returns
+	-------
+	array : Union[numpy.ndarray, None]
+		A contiguous float64 array or None if values is not a numeric array
+	"""
+	if not isinstance(values, np.ndarray):
+		if isinstance(values, (str, bytes, np.generic)):
+			return None
+		try:
+			values = np.asarray(memoryview(values))
+		except TypeError:
+			return None
+	if values.ndim != 1:
+		return None
+	if values.dtype.kind == "M":
+		return datetime64_to_msecs(values, tz)
+	if values.dtype.kind not in "biuf":
+		return None
+	return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _timezone(tz):
+	"""Return the tzinfo of tz (a tzinfo, a name of the IANA database or None for the local time)."""
+	if tz is None or isinstance(tz, tzinfo):
+		return tz
+	if tz.upper() == "UTC":
+		return timezone.utc
+	from zoneinfo import ZoneInfo
+	return ZoneInfo(tz)
+
+
+def _utc_offset(tz, hour: float) -> float:
+	"""Return the UTC offset in milliseconds of the wall time `hour` (hours since 1970-01-01 00:00) in tz."""
+	wall_time = _EPOCH + timedelta(hours=float(hour))
+	if tz is None:
+		return (hour * 3600. - wall_time.timestamp()) * 1000
+	return tz.utcoffset(wall_time).total_seconds() * 1000
+
+
+def localize(msecs, tz=None):
+	"""Convert wall times of a timezone (naive datetime counted in milliseconds as if they were UTC)
+	in milliseconds since epoch. The UTC offset is computed once by week of the values,
+	and by hour only in the weeks with a change of offset (daylight saving time): O(weeks) calls to the timezone.
+
+	Parameters
+	---------
+	msecs : numpy.ndarray
+		The wall times in milliseconds (float64), modified in place
+	OPTIONAL[tz] : Union[str, tzinfo, None]
+		The timezone of the wall times: a tzinfo, a name of the IANA database ("UTC", "Europe/Paris", ...)
+		or None for the local time (as `datetime.timestamp`)
+		Default: None
+
+	Returns
+	-------
+	msecs : numpy.ndarray
+		The milliseconds since epoch
+	"""
+	tz = _timezone(tz)
+	if tz is timezone.utc:
+		return msecs
+	finite = np.isfinite(msecs)
+	hours = np.floor(msecs[finite] / 3_600_000.)
+	if hours.size == 0:
+		return msecs
+	first = hours.min()
+	weeks = ((hours - first) / 168).astype(np.int64)
+	grid = np.array([_utc_offset(tz, first + 168 * week) for week in range(int(weeks.max()) + 2)])
+	offsets = grid[weeks]
+	changed = offsets != grid[weeks + 1]
+	if changed.any():
+		unique, inverse = np.unique(hours[changed], return_inverse=True)
+		offsets[changed] = np.array([_utc_offset(tz, hour) for hour in unique])[inverse]
+	msecs[finite] -= offsets
+	return msecs
+
+
+def datetime64_to_msecs(values, tz=None):
+	"""Convert a datetime64 array in milliseconds since epoch, in one vectorized step. NaT values are NaN.
+
+	Parameters
+	---------
+	values : numpy.ndarray
+		A datetime64 array (any unit)
+	OPTIONAL[tz] : Union[str, tzinfo, None]
+		The timezone of the values (a datetime64 has no timezone), None for the local time
+		Default: None
+
+	Returns
+	-------
+	array : numpy.ndarray
+		A contiguous float64 array
+	"""
+	unit, count = np.datetime_data(values.dtype)
+	if unit not in _MSECS_BY_UNIT:  # months and years have no fixed duration
+		values = values.astype("datetime64[ms]")
+		unit, count = "ms", 1
+	array = values.view(np.int64).astype(np.float64)
+	array *= _MSECS_BY_UNIT[unit] * count
+	nat = np.isnat(values)
+	if nat.any():
+		array[nat] = np.nan
+	return localize(array, tz)
+
+
+def column_array(column, tz=None):
+	"""Return a column of a pandas DataFrame or of an Arrow table as a contiguous float64 array,
+	from its buffers (no Python object per element). Datetime columns are converted in milliseconds since epoch.
+
+	Parameters
+	---------
+	column : Union[pandas.Series, pandas.Index, pyarrow.Array, pyarrow.ChunkedArray, numpy.ndarray, Iterable]
+		The column
+	OPTIONAL[tz] : Union[str, tzinfo, None]
+		The timezone of a datetime column without timezone, None for the local time
+		(a column with a timezone uses its timezone)
+		Default: None
+
+	Returns
+	-------
+	array : numpy.ndarray
+		A contiguous float64 array (a view of the column if it's already a float64 buffer)
+	"""
+	if hasattr(column, "type") and hasattr(column, "to_numpy"):  # pyarrow Array or ChunkedArray
+		if getattr(column.type, "tz", None):  # the values are in UTC
+			tz = "UTC"
+		column = column.to_numpy(zero_copy_only=False) if hasattr(column, "offset") else column.to_numpy()
+	elif hasattr(column, "dtype") and hasattr(column, "to_numpy"):  # pandas Series or Index
+		if getattr(column.dtype, "tz", None) is not None:
+			column, tz = column.to_numpy(dtype="datetime64[ns]"), "UTC"
+		elif isinstance(column.dtype, np.dtype):
+			column = column.to_numpy()
+		else:  # extension dtype (nullable integers, ...): NA values are NaN
+			column = column.to_numpy(dtype=np.float64, na_value=np.nan)
+	return float_array(column, tz)
+
+
+def is_datetime_column(column) -> bool:
+	"""Return True if column is a datetime column (numpy datetime64, pandas datetime or Arrow timestamp/date).
+
+	Parameters
+	---------
+	column : Union[pandas.Series, pandas.Index, pyarrow.Array, pyarrow.ChunkedArray, numpy.ndarray, Iterable]
+		The column
+
+	Returns
+	-------
+	is_datetime : bool
+		True if the values of column are datetime
+	"""
+	if hasattr(column, "type") and hasattr(column, "to_numpy"):
+		return str(column.type).startswith(("timestamp", "date"))
+	dtype = getattr(column, "dtype", None)
+	return dtype is not None and (getattr(dtype, "tz", None) is not None or getattr(dtype, "kind", None) == "M")
+
+
+def bounds(values):
+	"""Return the minimum and the maximum of values.
+
+	Parameters
+	---------
+	values : Iterable
+		The values, a numpy array is reduced without iterate on Python objects.
+
+	Returns
+	-------
+	minimum : Union[int, float, QDateTime, datetime]
+		The minimum value
+	maximum : Union[int, float, QDateTime, datetime]
+		The maximum value
+	"""
+	if isinstance(values, np.ndarray):
+		if values.dtype.kind == "f":  # NaN values (missing values) are ignored
+			return np.nanmin(values), np.nanmax(values)
+		return values.min(), values.max()
+	return min(values), max(values)
+
+
+def to_msecs(value, tz=None) -> float:
+	"""Convert a QDateTime or a datetime in milliseconds since epoch, other values are converted in float.
+
+	Parameters
+	---------
+	value : Union[int, float, QDateTime, datetime]
+		The value to convert
+	OPTIONAL[tz] : Union[str, tzinfo, None]
+		The timezone of a naive datetime, None for the local time
+		Default: None
+
+	Returns
+	-------
+	value : float
+		The converted value
+	"""
+	if isinstance(value, datetime):
+		if value.tzinfo is None and tz is not None:
+			value = value.replace(tzinfo=_timezone(tz))
+		return value.timestamp() * 1000
+	if isinstance(value, QDateTime):
+		return float(value.toMSecsSinceEpoch())
+	return float(value)
+
+
+def float_array(values, tz=None):
+	"""Return values as a contiguous float64 array, datetime values are converted in milliseconds since epoch.
+	The type of the values is detected once, with the first value:
+	 * numeric arrays and datetime64 arrays are converted in one vectorized step
+	 * pandas and Arrow columns (Series, DatetimeIndex, ...) are read from their buffers (see `column_array`)
+	 * a list of datetime with `datetime.timestamp` (the naive datetime of a timezone tz are shifted by `localize`)
+	 * a list of QDateTime with `QDateTime.toMSecsSinceEpoch`
+	 * a list of numbers by numpy
+
+	Parameters
+	---------
+	values : Union[Iterable, int, float, QDateTime, datetime, numpy.datetime64]
+		The values to convert, a scalar is converted in an array of size 1
+	OPTIONAL[tz] : Union[str, tzinfo, None]
+		The timezone of the naive datetime values (datetime, datetime64, pandas column without timezone):
+		a tzinfo, a name of the IANA database ("UTC", "Europe/Paris", ...) or None for the local time.
+		Default: None
+
+	Returns
+	-------
+	array : numpy.ndarray
+		A contiguous float64 array
+	"""
+	array = numeric_array(values, tz)
+	if array is not None:
+		return array
+	if hasattr(values, "to_numpy") and (hasattr(values, "dtype") or hasattr(values, "type")):
+		return column_array(values, tz)
+	if isinstance(values, (QDateTime, datetime, np.datetime64)) or np.isscalar(values):
+		values = (values,)
+	if not isinstance(values, (list, tuple)):
+		values = list(values)
+	if len(values) == 0:
+		return np.empty(0, dtype=np.float64)
+
+	first = values[0]
+	try:
+		if isinstance(first, datetime):
+			if first.tzinfo is None and tz is not None:  # wall times, then the offsets of tz by week
+				wall_times = np.fromiter(((value - _EPOCH) / _MILLISECOND for value in values), dtype=np.float64, count=len(values))
+				return localize(wall_times, tz)
+			return np.fromiter((value.timestamp() for value in values), dtype=np.float64, count=len(values)) * 1000
+		if isinstance(first, QDateTime):
+			return np.fromiter((value.toMSecsSinceEpoch() for value in values), dtype=np.float64, count=len(values))
+		if isinstance(first, np.datetime64):
+			return datetime64_to_msecs(np.array(values), tz)
+		return np.array(values, dtype=np.float64)
+	except (TypeError, ValueError, AttributeError):  # mixed types
+		return np.fromiter((to_msecs(value, tz) for value in values), dtype=np.float64, count=len(values))
+
+
+def sets_bounds(sets: dict):
+	"""Return the minimum and the maximum of all values of the bar sets, in one vectorized pass.
+
+	Parameters
+	---------
+	sets : Dict[label, values], format: {"label for the set": [3, 2, 1,...]}
+		The bar sets
+
+	Returns
+	-------
+	minimum : float
+		The minimum value of the sets
+	maximum : float
+		The maximum value of the sets
+	"""
+	values = np.concatenate([np.asarray(values, dtype=np.float64).ravel() for values in sets.values()])
+	return float(values.min()), float(values.max())
+
+
+def top_n(labels: list, values, n: int, other_label: str = "Other"):
+	"""Keep the `n` categories with the largest values (the sum of the sets for 2D values)
+	and aggregate the other categories in a category `other_label`. The order of categories is kept.
+
+	Parameters
+	---------
+	labels : List[str]
+		The labels of the categories
+	values : Union[Sequence[float], Sequence[Sequence[float]]]
+		The values by category, or the values of several sets (one row per set)
+	n : int
+		The number of categories kept
+	OPTIONAL[other_label] : str
+		The label of the aggregated category
+		Default: "Other"
+
+	Returns
+	-------
+	labels : List[str]
+		The labels of the categories kept, and other_label if categories are aggregated
+	values : numpy.ndarray
+		The values of the categories kept, and the aggregated values
+	"""
+	values = np.asarray(values, dtype=np.float64)
+	totals = values if values.ndim == 1 else values.sum(axis=0)
+	if n is None or totals.size <= n:
+		return list(labels), values
+
+	keep = np.sort(np.argpartition(-totals, n - 1)[:n]) if n > 0 else np.array([], dtype=np.int64)
+	others = np.ones(totals.size, dtype=bool)
+	others[keep] = False
+	kept = np.concatenate([values[..., keep], values[..., others].sum(axis=-1)[..., np.newaxis]], axis=-1)
+	return [labels[i] for i in keep] + [other_label], kept
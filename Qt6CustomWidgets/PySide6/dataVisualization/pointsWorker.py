@@ -0,0 +1,70 @@
+"""
+A QRunnable to prepare points data of a GraphicWidget series in a QThreadPool.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from .pointsData import float_array, bounds
+
+
+class PointsWorkerSignals(QObject):
+	"""The signals of a PointsWorker (a QRunnable can't emit signals).
+
+	Signals
+	-------
+	finished
+		Emitted with the prepared data: (request id, x, y, x range, y range)
+	error
+		Emitted with the request id and the exception if the preparation failed
+	"""
+	finished = Signal(object)
+	error = Signal(int, object)
+
+
+class PointsWorker(QRunnable):
+	"""Convert points data in float64 arrays (datetime in milliseconds since epoch)
+	and compute their ranges, outside of the GUI thread.
+
+	Public Attributes
+	-----------------
+	request_id : int
+		The id of the request, sent with the result
+	signals : PointsWorkerSignals
+		The signals to get the result
+	"""
+
+	def __init__(self, request_id: int, x, y, tz=None):
+		"""Initialize a PointsWorker
+
+		Parameters
+		---------
+		request_id : int
+			The id of the request, sent with the result
+		x : Iterable
+			The X-coordinates of points
+		y : Iterable
+			The Y-coordinates of points
+		OPTIONAL[tz] : Union[str, tzinfo, None]
+			The timezone of the naive datetime values, None for the local time
+			Default: None
+		"""
+		super(PointsWorker, self).__init__()
+		self.request_id = request_id
+		self.signals = PointsWorkerSignals()
+		self._x = x
+		self._y = y
+		self._tz = tz
+
+	def run(self):
+		try:
+			x, y = float_array(self._x, self._tz), float_array(self._y, self._tz)
+			size = min(x.size, y.size)
+			x, y = x[:size], y[:size]
+			x_range = bounds(x) if size > 0 else None
+			y_range = bounds(y) if size > 0 else None
+		except Exception as error:
+			self.signals.error.emit(self.request_id, error)
+		else:
+			self.signals.finished.emit((self.request_id, x, y, x_range, y_range))
+		finally:
+			self._x = self._y = None
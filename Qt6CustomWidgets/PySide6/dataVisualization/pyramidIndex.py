@@ -0,0 +1,303 @@
+"""
+A multi-resolution min/max/mean index of the Y values of a series, to decimate any window in O(pixels).
+"""
+
+from math import ceil
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class _Level:
+	"""The tiles of a level of a PyramidIndex, in arrays which grow by doubling their capacity."""
+
+	def __init__(self, capacity: int = 64):
+		self.size = 0
+		self.minimum = np.empty(capacity, dtype=np.float64)
+		self.maximum = np.empty(capacity, dtype=np.float64)
+		self.mean = np.empty(capacity, dtype=np.float64)
+
+	def extend(self, minimum, maximum, mean):
+		end = self.size + minimum.size
+		if end > self.minimum.size:
+			capacity = max(end, 2 * self.minimum.size)
+			for name in ("minimum", "maximum", "mean"):
+				array = np.empty(capacity, dtype=np.float64)
+				array[:self.size] = getattr(self, name)[:self.size]
+				setattr(self, name, array)
+		self.minimum[self.size:end] = minimum
+		self.maximum[self.size:end] = maximum
+		self.mean[self.size:end] = mean
+		self.size = end
+
+	def arrays(self):
+		return self.minimum[:self.size], self.maximum[:self.size], self.mean[:self.size]
+
+
+class PyramidIndex:
+	"""A pyramid of min/max/mean tiles of the Y values of a series.
+	The tiles of the level 0 contain `base` values, the tiles of the level k contain base * 2**k values
+	(a tile of the level k + 1 is computed from two tiles of the level k).
+
+	A window of any size is answered with the level which has about one tile per pixel,
+	so the decimation costs O(pixels) instead of O(points). The values are appended incrementally:
+	only the new tiles are computed. The index can be saved in a .npz file and loaded again.
+
+	Public Attributes
+	-----------------
+	base : int
+		The number of values in a tile of the level 0, a power of two
+
+	Public Methods
+	--------------
+	append
+		Append Y values to the index
+	levels
+		Return the number of levels
+	tile_size
+		Return the number of values in a tile of a level
+	tiles
+		Return the min, max and mean tiles of a level
+	query
+		Return the tiles of a range of values, at the resolution of a width in pixels
+	save
+		Save the index in a .npz file
+	load
+		Load an index saved with `save` (class method)
+	"""
+
+	def __init__(self, base: int = 16):
+		"""Initialize an empty PyramidIndex
+
+		Parameters
+		---------
+		OPTIONAL[base] : int
+			The number of values in a tile of the level 0, a power of two
+			Default: 16
+		"""
+		if base < 1 or base & (base - 1):
+			raise ValueError(f"base must be a power of two, not {base}")
+		self.base = base
+		self._size = 0
+		self._tail = np.empty(0, dtype=np.float64)
+		self._levels = []
+
+	def __len__(self):
+		return self._size
+
+	def levels(self) -> int:
+		"""Return the number of levels of the index."""
+		return len(self._levels)
+
+	def tile_size(self, level: int) -> int:
+		"""Return the number of values in a tile of the level `level`."""
+		return self.base << level
+
+	def tiles(self, level: int):
+		"""Return the tiles of a level.
+
+		Parameters
+		---------
+		level : int
+			The level
+
+		Returns
+		-------
+		minimum : numpy.ndarray
+			The minimum of each tile
+		maximum : numpy.ndarray
+			The maximum of each tile
+		mean : numpy.ndarray
+			The mean of each tile
+		"""
+		return self._levels[level].arrays()
+
+	def append(self, values):
+		"""Append Y values to the index, only the new tiles of each level are computed.
+
+		Parameters
+		---------
+		values : numpy.ndarray
+			The new Y values
+
+		Returns
+		-------
+		None
+		"""
+		values = np.asarray(values, dtype=np.float64)
+		self._size += values.size
+		if self._tail.size > 0:
+			values = np.concatenate([self._tail, values])
+		full = values.size // self.base * self.base
+		self._tail = values[full:].copy()
+		if full == 0:
+			return
+		tiles = values[:full].reshape(-1, self.base)
+		self._extend(0, tiles.min(axis=1), tiles.max(axis=1), tiles.mean(axis=1))
+
+	def _extend(self, level: int, minimum, maximum, mean):
+		"""Add tiles to a level and compute the new tiles of the upper levels."""
+		if level == len(self._levels):
+			self._levels.append(_Level())
+		current = self._levels[level]
+		current.extend(minimum, maximum, mean)
+		# the tiles not yet paired in the upper level
+		done = 2 * (self._levels[level + 1].size if level + 1 < len(self._levels) else 0)
+		pairs = (current.size - done) // 2
+		if pairs == 0:
+			return
+		minimum, maximum, mean = (array[done:done + 2 * pairs].reshape(-1, 2) for array in current.arrays())
+		self._extend(level + 1, minimum.min(axis=1), maximum.max(axis=1), mean.mean(axis=1))
+
+	def query(self, start: int, end: int, width: int):
+		"""Return the tiles of the values from start to end (excluded), with at least `width` tiles
+		(the level with the largest tiles is used). The partial tiles at the borders are not included.
+
+		Parameters
+		---------
+		start : int
+			The index of the first value
+		end : int
+			The index of the last value (excluded)
+		width : int
+			The width of the plot in pixels
+
+		Returns
+		-------
+		result : Union[Tuple[numpy.ndarray, int, numpy.ndarray, numpy.ndarray, numpy.ndarray], None]
+			(index of the first value of each tile, tile size, minimum, maximum, mean)
+			or None if the window is too small for the tiles of the level 0 (decimate the values directly)
+		"""
+		count = end - start
+		if not self._levels or width < 1 or count < self.base * width:
+			return None
+		level = min(len(self._levels) - 1, int(np.log2(count / (self.base * width))))
+		size = self.tile_size(level)
+		first, last = ceil(start / size), min(end // size, self._levels[level].size)
+		minimum, maximum, mean = (array[first:last] for array in self.tiles(level))
+		return np.arange(first, last, dtype=np.int64) * size, size, minimum, maximum, mean
+
+	def save(self, path: str):
+		"""Save the index in a .npz file.
+
+		Parameters
+		---------
+		path : str
+			The path of the file
+
+		Returns
+		-------
+		None
+		"""
+		arrays = {"base": self.base, "size": self._size, "tail": self._tail}
+		for level, tiles in enumerate(self._levels):
+			for name, array in zip(("minimum", "maximum", "mean"), tiles.arrays()):
+				arrays[f"{name}_{level}"] = array
+		with open(path, "wb") as file:
+			np.savez(file, **arrays)
+
+	@classmethod
+	def load(cls, path: str):
+		"""Load an index saved with `save`.
+
+		Parameters
+		---------
+		path : str
+			The path of the file
+
+		Returns
+		-------
+		index : PyramidIndex
+			The index loaded
+		"""
+		with np.load(path) as arrays:
+			index = cls(int(arrays["base"]))
+			index._size = int(arrays["size"])
+			index._tail = arrays["tail"]
+			level = 0
+			while f"minimum_{level}" in arrays:
+				tiles = _Level(0)
+				tiles.extend(arrays[f"minimum_{level}"], arrays[f"maximum_{level}"], arrays[f"mean_{level}"])
+				index._levels.append(tiles)
+				level += 1
+		return index
+
+
+class PyramidWorkerSignals(QObject):
+	"""The signals of a PyramidWorker (a QRunnable can't emit signals).
+
+	Signals
+	-------
+	finished
+		Emitted with the index built
+	error
+		Emitted with the exception if the build failed
+	"""
+	finished = Signal(object)
+	error = Signal(object)
+
+
+class PyramidWorker(QRunnable):
+	"""Build (or complete) a PyramidIndex in a QThreadPool, from an array or from a MemmapSource
+	read by chunks.
+
+	Public Attributes
+	-----------------
+	index : PyramidIndex
+		The index to build, the values after len(index) are appended
+	signals : PyramidWorkerSignals
+		The signals to get the result
+	"""
+
+	def __init__(self, index: PyramidIndex, data, path: str = None):
+		"""Initialize a PyramidWorker
+
+		Parameters
+		---------
+		index : PyramidIndex
+			The index to build, the values after len(index) are appended
+		data : Union[numpy.ndarray, MemmapSource]
+			The Y values or the data source
+		OPTIONAL[path] : str
+			If specified, the index is saved in this file when it's built
+			Default: None
+		"""
+		super(PyramidWorker, self).__init__()
+		self.index = index
+		self.signals = PyramidWorkerSignals()
+		self._data = data
+		self._path = path
+
+	def run(self):
+		try:
+			if isinstance(self._data, np.ndarray):
+				self.index.append(self._data[len(self.index):])
+			else:
+				source, chunk = self._data, self._data.chunk_size
+				for start in range(len(self.index), len(source), chunk):
+					self.index.append(source.read(start, start + chunk)[1])
+			if self._path is not None:
+				self.index.save(self._path)
+		except Exception as error:
+			self.signals.error.emit(error)
+		else:
+			self.signals.finished.emit(self.index)
+		finally:
+			self._data = None
+
+
+if __name__ == "__main__":
+	import time
+
+	y = np.sin(np.arange(10_000_000, dtype=np.float64) / 1e4)
+	y[1_234_567] = 42.
+	start = time.perf_counter()
+	index = PyramidIndex()
+	for chunk in range(0, y.size, 1_000_000):
+		index.append(y[chunk:chunk + 1_000_000])
+	print(f"build: {time.perf_counter() - start:.3f} s, {index.levels()} levels")
+
+	start = time.perf_counter()
+	rows, size, minimum, maximum, mean = index.query(0, y.size, 800)
+	print(f"query: {(time.perf_counter() - start) * 1000:.3f} ms, {rows.size} tiles of {size} values, max {maximum.max()}")
+	assert maximum.max() == 42. and minimum.min() == y.min()
@@ -0,0 +1,139 @@
+"""
+A fixed-capacity buffer of points used to stream data in a GraphicWidget.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+	"""A ring buffer of (x, y) points with a fixed capacity.
+	When the buffer is full, the oldest points are dropped.
+
+	Each point is written twice (at index i and i + capacity), so the window
+	of points is always a contiguous view of the storage: reading it doesn't copy.
+
+	The minimum and the maximum of the points are kept by blocks of about sqrt(capacity) points:
+	an extend reduces only the blocks written, so `bounds` costs O(sqrt(capacity)) and not O(capacity).
+
+	Public Attributes
+	-----------------
+	capacity : int
+		The maximum number of points in the buffer
+
+	Public Methods
+	--------------
+	extend
+		Add points at the end of the buffer
+	clear
+		Remove all points
+	arrays
+		Return the X and Y window of points
+	bounds
+		Return the range of the X and Y-coordinates of points
+	"""
+
+	def __init__(self, capacity: int):
+		"""Initialize a RingBuffer
+
+		Parameters
+		---------
+		capacity : int, greater than 0
+			The maximum number of points in the buffer
+		"""
+		if capacity < 1:
+			raise ValueError(f"capacity must be greater than 0, not {capacity}")
+		self.capacity = capacity
+		self._x = np.zeros(2 * capacity, dtype=np.float64)
+		self._y = np.zeros(2 * capacity, dtype=np.float64)
+		self._start = 0
+		self._size = 0
+		self._block = max(1, int(np.sqrt(capacity)))
+		blocks = -(-capacity // self._block)
+		self._x_blocks = np.full((2, blocks), np.nan)  # minimum and maximum of each block
+		self._y_blocks = np.full((2, blocks), np.nan)
+
+	def __len__(self):
+		return self._size
+
+	def extend(self, x, y):
+		"""Add points at the end of the buffer, the oldest points are dropped if the buffer is full.
+
+		Parameters
+		---------
+		x : numpy.ndarray
+			The X-coordinates of points (float64)
+		y : numpy.ndarray
+			The Y-coordinates of points (float64), same size as x
+
+		Returns
+		-------
+		None
+		"""
+		size = min(x.size, y.size)
+		if size > self.capacity:
+			x, y = x[size - self.capacity:size], y[size - self.capacity:size]
+			size = self.capacity
+		if size == 0:
+			return
+
+		end = (self._start + self._size) % self.capacity
+		first = min(size, self.capacity - end)  # points written before to wrap
+		for storage, values in ((self._x, x), (self._y, y)):
+			storage[end:end + first] = values[:first]
+			storage[end + self.capacity:end + self.capacity + first] = values[:first]
+			storage[:size - first] = values[first:size]
+			storage[self.capacity:self.capacity + size - first] = values[first:size]
+
+		overflow = max(0, self._size + size - self.capacity)
+		self._start = (self._start + overflow) % self.capacity
+		self._size = min(self.capacity, self._size + size)
+		self._reduce_blocks(end, end + first)
+		self._reduce_blocks(0, size - first)
+
+	def clear(self):
+		"""Remove all points of the buffer"""
+		self._start = 0
+		self._size = 0
+		self._x_blocks.fill(np.nan)
+		self._y_blocks.fill(np.nan)
+
+	def _reduce_blocks(self, start: int, end: int):
+		"""Compute the minimum and the maximum of the blocks which contain the indexes from start to end (excluded).
+		Only the stored points are reduced: the buffer is filled from the index 0 until it's full."""
+		if end <= start:
+			return
+		first, last = start // self._block, (end - 1) // self._block + 1
+		stop = min(last * self._block, self._size)
+		offsets = np.arange(0, stop - first * self._block, self._block)
+		for storage, blocks in ((self._x, self._x_blocks), (self._y, self._y_blocks)):
+			values = storage[first * self._block:stop]
+			blocks[0, first:last] = np.fmin.reduceat(values, offsets)  # NaN values are ignored
+			blocks[1, first:last] = np.fmax.reduceat(values, offsets)
+
+	def arrays(self):
+		"""Return the points of the buffer, from the oldest to the newest.
+
+		Returns
+		-------
+		x : numpy.ndarray
+			A contiguous view on the X-coordinates
+		y : numpy.ndarray
+			A contiguous view on the Y-coordinates
+		"""
+		end = self._start + self._size
+		return self._x[self._start:end], self._y[self._start:end]
+
+	def bounds(self):
+		"""Return the minimum and the maximum of the X and Y-coordinates of points, NaN values are ignored.
+
+		Returns
+		-------
+		x_range : Tuple[float, float]
+			The minimum and the maximum of the X-coordinates (NaN if the buffer is empty)
+		y_range : Tuple[float, float]
+			The minimum and the maximum of the Y-coordinates (NaN if the buffer is empty)
+		"""
+		return tuple(
+			(float(np.fmin.reduce(blocks[0])), float(np.fmax.reduce(blocks[1])))
+			for blocks in (self._x_blocks, self._y_blocks)
+		)
@@ -1 +1,25 @@
-from .progressBar import ProgressBar
\ No newline at end of file
+from importlib import import_module
+
+from .progressBar import ProgressBar
+
+
+# imported at the first access (see __getattr__): ProgressModel loads numpy
+_LAZY_NAMES = {
+	"ProgressModel": ".progressModel",
+	"ProgressBarDelegate": ".progressBarDelegate",
+}
+
+__all__ = ["ProgressBar", *_LAZY_NAMES]
+
+
+def __getattr__(name: str):
+	"""Import ProgressModel or ProgressBarDelegate at its first access."""
+	if name not in _LAZY_NAMES:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(import_module(_LAZY_NAMES[name], __name__), name)
+	globals()[name] = value  # the next accesses don't call __getattr__
+	return value
+
+
+def __dir__():
+	return sorted(set(globals()) | set(_LAZY_NAMES))
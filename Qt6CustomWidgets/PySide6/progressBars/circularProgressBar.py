@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Property, Slot, QRect
+from PySide6.QtCore import Qt, Property, Slot, QRect
 from PySide6.QtGui import QColor, QBrush, QPaintEvent, QPen, QPainter
 
 
@@ -22,7 +22,6 @@ class CircularProgress(QWidget):
 		self.update()
 	
 	def paintEvent(self, e: QPaintEvent):
-		print("pain event")
 		width = self.width - self.progress_width
 		height = self.height - self.progress_width
 		margin = self.progress_width / 2
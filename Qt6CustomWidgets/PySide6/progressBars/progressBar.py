@@ -3,21 +3,25 @@ A custom progress bar with a custom color.
 """
 
 from math import sqrt
+from threading import Lock
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import (
-	Qt, QSize, QPoint, QPointF, QRectF,
+	Qt, QSize, QPoint, QPointF, QRect, QRectF, QTimer, QEvent,
 	QEasingCurve, QPropertyAnimation, QSequentialAnimationGroup,
 	Signal, Slot, Property)
-from PySide6.QtGui import QColor, QBrush, QPaintEvent, QPen, QPainter
+from PySide6.QtGui import QColor, QBrush, QPaintEvent, QPen, QPainter, QPixmap, QFont, QFontMetricsF, QStaticText
 
 
 class ProgressBar(QWidget):
 
 	valueChanged = Signal(int)
+	# emitted by `report` (from any thread) to start the sampling timer in the GUI thread
+	_reportRequested = Signal()
 
 	def __init__(self, orientation=Qt.Horizontal, minimum: int = 0, maximum: int = 100, borderwidth: int = 3,
 		bar_color="#ffffff", color_loaded="#0ca678", pen_color="#212529", text_color='#000000',
-		rounding: float = 0., showPercent: bool = True, showValue: bool = False, parent=None):
+		rounding: float = 0., showPercent: bool = True, showValue: bool = False, report_rate: float = 30.,
+		parent=None):
 		super(ProgressBar, self).__init__(parent)
 		self._penColor = QColor(pen_color)
 		self._textColor = QColor(text_color)
@@ -34,6 +38,25 @@ class ProgressBar(QWidget):
 		self._showPercent = showPercent
 		self._showValue = showValue
 
+		# the rendering caches: the bar rect, the bar without the loaded part, the font and its metrics,
+		# the texts laid out, the layout of the current texts and the bounds of the text drawn (left, top, right, bottom)
+		self._barRectCache = None
+		self._background = None
+		self._textFont = None
+		self._fontMetrics = None
+		self._textCache = {}
+		self._layout = (None, [], None)
+		self._textBounds = None
+
+		# the increments reported by any thread, added to the value by a timer of the GUI thread
+		self._reported = 0
+		self._reportScheduled = False
+		self._reportLock = Lock()
+		self._reportTimer = QTimer(self)
+		self._reportTimer.timeout.connect(self._sampleReports)
+		self._reportRequested.connect(self._reportTimer.start)
+		self.setReportRate(report_rate)
+
 	@Property(int)
 	def minimum(self):
 		return self._minimum
@@ -43,6 +66,7 @@ class ProgressBar(QWidget):
 		if value < self.maximum:
 			self._minimum = value
 			self.value = self._value
+			self.update()
 
 	@Property(int)
 	def maximum(self):
@@ -53,6 +77,7 @@ class ProgressBar(QWidget):
 		if value >= self.minimum:
 			self._maximum = value
 			self.value = self._value
+			self.update()
 
 	@Property(int)
 	def value(self):
@@ -60,14 +85,15 @@ class ProgressBar(QWidget):
 
 	@value.setter
 	def value(self, value: int):
-		if self.minimum <= value <= self.maximum:
-			self._value = value
-		elif self.minimum > value:
-			self._value = self.minimum
-		else:
-			self._value = self.maximum
+		if self.minimum > value:
+			value = self.minimum
+		elif value > self.maximum:
+			value = self.maximum
+		if value == self._value:  # nothing to emit or repaint
+			return
+		old_value, self._value = self._value, value
 		self.valueChanged.emit(self._value)
-		self.update()
+		self._updateLoaded(old_value)
 
 	@Property(float)
 	def percent(self):
@@ -84,6 +110,7 @@ class ProgressBar(QWidget):
 	@penColor.setter
 	def penColor(self, color: QColor):
 		self._penColor = QColor(color)
+		self._invalidate()
 
 	@Property(QColor)
 	def barColor(self):
@@ -92,6 +119,7 @@ class ProgressBar(QWidget):
 	@barColor.setter
 	def barColor(self, color: QColor):
 		self._barColor = QColor(color)
+		self._invalidate()
 
 	@Property(QColor)
 	def loadedColor(self):
@@ -100,6 +128,7 @@ class ProgressBar(QWidget):
 	@loadedColor.setter
 	def loadedColor(self, color: QColor):
 		self._loadedColor = QColor(color)
+		self.update()
 
 	@Property(QColor)
 	def textColor(self):
@@ -108,6 +137,7 @@ class ProgressBar(QWidget):
 	@textColor.setter
 	def textColor(self, color: QColor):
 		self._textColor = QColor(color)
+		self.update()
 
 	@Property(int)
 	def borderWidth(self):
@@ -116,6 +146,7 @@ class ProgressBar(QWidget):
 	@borderWidth.setter
 	def borderWidth(self, value: int):
 		self._borderWidth = value
+		self._invalidate()
 
 	@Property(float)
 	def roundingCorner(self):
@@ -124,6 +155,7 @@ class ProgressBar(QWidget):
 	@roundingCorner.setter
 	def roundingCorner(self, value: float):
 		self._rounding = value
+		self._invalidate()
 
 	@Property(bool)
 	def showPercent(self):
@@ -166,6 +198,32 @@ class ProgressBar(QWidget):
 	def discreaseValue(self, value: int):
 		self.value -= value
 
+	def report(self, delta: int = 1):
+		"""Add delta to the value, from any thread (a worker of a download for example).
+		The increments are summed under a lock and added to the value by a timer of the GUI thread
+		(see `setReportRate`): thousands of reports by second cost a single update by tick."""
+		with self._reportLock:
+			self._reported += delta
+			if self._reportScheduled:
+				return
+			self._reportScheduled = True
+		self._reportRequested.emit()  # queued to the GUI thread if called from another thread
+
+	def setReportRate(self, rate: float):
+		"""Set the number of times by second the increments of `report` are added to the value."""
+		self._reportTimer.setInterval(max(1, round(1000 / rate)))
+
+	@Slot()
+	def _sampleReports(self):
+		"""Add the increments reported since the last tick to the value, the timer stops when there is none."""
+		with self._reportLock:
+			delta, self._reported = self._reported, 0
+			if delta == 0:
+				self._reportScheduled = False
+				self._reportTimer.stop()
+				return
+		self.value = self._value + delta
+
 	@Slot(bool)
 	def setShowPercent(self, show_percent: bool):
 		self.showPercent = show_percent
@@ -174,14 +232,127 @@ class ProgressBar(QWidget):
 	def setShowValue(self, show_value: bool):
 		self.showValue = show_value
 
+	def _barRect(self) -> QRectF:
+		if self._barRectCache is None:
+			contRect = self.contentsRect()
+			handleRadius = round(0.3 * contRect.height())
+			barRect = QRectF(0, 0, contRect.width() - handleRadius, 0.40 * contRect.height())
+			barRect.moveCenter(contRect.center())
+			self._barRectCache = (barRect, barRect.getRect())
+		return self._barRectCache[0]
+
+	def _barGeometry(self):
+		"""Return the x, y, width and height of the bar rect."""
+		self._barRect()
+		return self._barRectCache[1]
+
+	def _loadedWidth(self, width: float, value: int) -> float:
+		fraction = (value - self._minimum) / abs(self._maximum - self._minimum)
+		return self._rounding*2 + (width - self._rounding*2) * fraction
+
+	def _invalidate(self):
+		"""Clear the rendering caches (after a resize or a change of style) and repaint the widget."""
+		self._barRectCache = None
+		self._background = None
+		self._textFont = None
+		self._fontMetrics = None
+		self._textCache.clear()
+		self._layout = (None, [], None)
+		self._textBounds = None
+		self.update()
+
+	def _backgroundPixmap(self) -> QPixmap:
+		"""Return the bar without the loaded part, rendered once in a pixmap until the next `_invalidate`."""
+		if self._background is None:
+			ratio = self.devicePixelRatioF()
+			pixmap = QPixmap(self.size() * ratio)
+			pixmap.setDevicePixelRatio(ratio)
+			pixmap.fill(Qt.transparent)
+			painter = QPainter(pixmap)
+			painter.setRenderHint(QPainter.Antialiasing)
+			pen = QPen(self._penColor)
+			pen.setWidth(self._borderWidth)
+			painter.setPen(pen)
+			self.draw_bar(painter)
+			painter.end()
+			self._background = pixmap
+		return self._background
+
+	def _font(self) -> QFont:
+		if self._textFont is None:
+			size_font = self._barRect().height() // 3
+			self._textFont = QFont(self.font())
+			self._textFont.setPixelSize(int(min(max(size_font, 1), 30)))
+			self._fontMetrics = QFontMetricsF(self._textFont)
+		return self._textFont
+
+	def _textLine(self, text: str):
+		"""Return a line of text to draw and its width, measured with the metrics of the font.
+		A text seen for the first time is drawn with `QPainter.drawText`, a text seen again
+		is laid out once in a QStaticText and reused (the values of a range often come back)."""
+		cached = self._textCache.get(text)
+		if cached is None:
+			if len(self._textCache) >= 256:
+				self._textCache.clear()
+			self._font()
+			width = self._fontMetrics.horizontalAdvance(text)
+			self._textCache[text] = width
+			return text, width
+		if isinstance(cached, float):
+			cached = QStaticText(text)
+			cached.setTextFormat(Qt.PlainText)
+			cached.prepare(font=self._font())
+			self._textCache[text] = cached
+		return cached, cached.size().width()
+
+	def _textLayout(self):
+		"""Return the texts to draw with their top left point, centered in the bar,
+		and their bounds (left, top, right, bottom) in pixels. The layout is computed once by value."""
+		key = (self._value, self._minimum, self._maximum, self._showPercent, self._showValue)
+		if self._layout[0] == key:
+			return self._layout[1], self._layout[2]
+		lines = []
+		if self._showPercent:
+			percent = (self._value - self._minimum) / abs(self._maximum - self._minimum) * 100
+			lines.append(self._textLine(f"{round(percent, 2)} %"))
+		if self._showValue:
+			lines.append(self._textLine(f"{self._value} / {self._maximum}"))
+		x, y, width, height = self._barGeometry()
+		line_height, ascent = self._fontMetrics.height(), self._fontMetrics.ascent()
+		center_x = x + width / 2
+		text_width, top = max(line_width for _, line_width in lines), y + (height - line_height * len(lines)) / 2
+		bounds = (int(center_x - text_width / 2) - 1, int(top) - 1,
+			int(center_x + text_width / 2) + 2, int(top + line_height * len(lines)) + 2)
+		layout = []
+		for line, line_width in lines:
+			# the point of a QStaticText is its top left corner, the point of a text is on its baseline
+			layout.append((QPointF(center_x - line_width / 2, top if isinstance(line, QStaticText) else top + ascent), line))
+			top += line_height
+		self._layout = (key, layout, bounds)
+		return layout, bounds
+
+	def _updateLoaded(self, old_value: int):
+		"""Repaint only the part of the bar between the former and the new loaded width, and the text.
+		The new text is laid out at the paint: its bounds are predicted from the former text
+		(one character wider on each side), `paintEvent` repaints the text again if it's larger."""
+		x, y, width, height = self._barGeometry()
+		old_width, new_width = self._loadedWidth(width, old_value), self._loadedWidth(width, self._value)
+		left, right = int(x + min(old_width, new_width) - self._rounding) - 2, int(x + max(old_width, new_width)) + 3
+		top, bottom = int(y) - 2, int(y + height) + 3
+		if self._showPercent or self._showValue:
+			if self._textBounds is None:
+				self.update()
+				return
+			margin = self._font().pixelSize()
+			text_left, text_top, text_right, text_bottom = self._textBounds
+			left, right = min(left, text_left - margin), max(right, text_right + margin)
+			top, bottom = min(top, text_top), max(bottom, text_bottom)
+		self.update(left, top, right - left, bottom - top)
+
 	def draw_bar(self, painter: QPainter):
 		painter.save()
 
-		contRect = self.contentsRect()
-		handleRadius = round(0.3 * contRect.height())
-		barRect = QRectF(0, 0, contRect.width() - handleRadius, 0.40 * contRect.height())
-		barRect.moveCenter(contRect.center())
-
+		barRect = self._barRect()
 		painter.setBrush(QBrush(self.barColor))
 		painter.drawRoundedRect(barRect, self._rounding, self._rounding)
 
@@ -189,69 +360,72 @@ class ProgressBar(QWidget):
 		return barRect
 
 	def draw_loaded_bar(self, painter: QPainter, barRect: QRectF):
-		painter.save()
-		width_loaded = self._rounding*2 if self.percent/100 == 0 else self._rounding*2 + (barRect.width() - self._rounding*2) * (self.percent/100)
-		loadedRect = QRectF(barRect.x(), barRect.y(), width_loaded, barRect.height())
-
-		painter.setBrush(QBrush(self.loadedColor))
+		loadedRect = QRectF(barRect.x(), barRect.y(), self._loadedWidth(barRect.width(), self._value), barRect.height())
+		painter.setBrush(self._loadedColor)
 		painter.setPen(Qt.NoPen)
 		painter.drawRoundedRect(loadedRect, self._rounding, self._rounding)
-		painter.restore()
 		return loadedRect
 
-	def draw_text(self, painter: QPainter, barRect: QRectF):
+	def draw_text(self, painter: QPainter):
+		"""Draw the text of the bar (its layout is cached, see `_textLayout`) and repaint its bounds if they are
+		larger than the region predicted by `_updateLoaded`."""
+		painter.setPen(self._textColor)
+		painter.setFont(self._font())
+		layout, bounds = self._textLayout()
+		for point, line in layout:
+			if isinstance(line, str):
+				painter.drawText(point, line)
+			else:
+				painter.drawStaticText(point, line)
+		if self._textBounds is not None and self._textBounds != bounds:
+			margin = self._font().pixelSize()
+			predicted = self._textBounds
+			if (bounds[0] < predicted[0] - margin or bounds[2] > predicted[2] + margin
+				or bounds[1] < predicted[1] or bounds[3] > predicted[3]):  # larger than predicted by `_updateLoaded`
+				self.update(bounds[0], bounds[1], bounds[2] - bounds[0], bounds[3] - bounds[1])
+		self._textBounds = bounds
+
+	def paint_to(self, painter: QPainter, rect: QRect, value: int, minimum: int = 0, maximum: int = 100):
+		"""Paint the bar of value (in minimum, maximum) in rect with painter, with the style of this ProgressBar.
+		The value of the widget doesn't change, but it's resized at the size of rect (and its caches with it):
+		use a hidden ProgressBar to paint the cells of an item view (see ProgressBarDelegate)."""
+		if self.size() != rect.size():
+			self.resize(rect.size())
+			if not self.isVisible():  # a hidden widget receives its resize event only when it's shown
+				self._invalidate()
+		state = (self._value, self._minimum, self._maximum, self._textBounds)
+		self._minimum, self._maximum = minimum, max(maximum, minimum + 1)
+		self._value = min(max(value, self._minimum), self._maximum)
 		painter.save()
-
-		font = painter.font()
-		size_font = barRect.height() // 3
-		if size_font < 1:
-			size_font = 1
-		else:
-			size_font = size_font if size_font < 30 else 30
-		font.setPixelSize(int(size_font))
-
-		pen = QPen(self._textColor)
-		pen.setWidth(2)
-		painter.setPen(pen)
-		painter.setFont(font)
-
-
-		percent_rounded = round(self.percent, 2) if self._showPercent else None
-		len_percent = (len(str(percent_rounded)) + 2) * (size_font / 4) if self._showPercent else None
-		len_value = (len(str(self._value)) + len(str(self._maximum)) + 3) * (size_font / 4) if self._showValue else None
-		X, Y = barRect.x() + barRect.width()/2, 1.1*barRect.y() + barRect.height()/2
-		textPoint = QPointF(X, Y)
-
-		if self._showPercent and self._showValue:
-			textPoint.setX(X - len_percent)
-			textPoint.setY(Y - 0.5*size_font)
-			painter.drawText(textPoint, f"{percent_rounded} %")
-			textPoint.setX(X - len_value)
-			textPoint.setY(Y + 0.5*size_font)
-			painter.drawText(textPoint, f"{self._value} / {self._maximum}")
-		elif self._showValue:
-			textPoint.setX(X - len_value)
-			painter.drawText(textPoint, f"{self._value} / {self._maximum}")
-		elif self._showPercent:
-			textPoint.setX(X - len_percent)
-			painter.drawText(textPoint, f"{percent_rounded} %")
+		painter.translate(rect.topLeft())
+		self._paint(painter)
 		painter.restore()
+		self._value, self._minimum, self._maximum, self._textBounds = state
 
-	def paintEvent(self, e: QPaintEvent):
-		painter = QPainter(self)
+	def _paint(self, painter: QPainter):
+		painter.drawPixmap(0, 0, self._backgroundPixmap())
 		painter.setRenderHint(QPainter.Antialiasing)
 
-		pen = QPen(self._penColor)
-		pen.setWidth(self._borderWidth)
-		painter.setPen(pen)
-
-		barRect = self.draw_bar(painter)
+		barRect = self._barRect()
 		self.draw_loaded_bar(painter, barRect)
 
 		if self._showPercent or self._showValue:
-			self.draw_text(painter, barRect)
+			self.draw_text(painter)
+
+	def paintEvent(self, e: QPaintEvent):
+		painter = QPainter(self)
+		self._paint(painter)
 		painter.end()
 
+	def resizeEvent(self, e):
+		super(ProgressBar, self).resizeEvent(e)
+		self._invalidate()
+
+	def changeEvent(self, e: QEvent):
+		super(ProgressBar, self).changeEvent(e)
+		if e.type() == QEvent.FontChange:
+			self._invalidate()
+
 
 if __name__ == '__main__':
 	import sys
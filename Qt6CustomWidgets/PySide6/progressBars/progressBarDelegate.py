@@ -0,0 +1,110 @@
+"""
+A delegate which paints a progress bar in the cells of a QTableView or a QListView, without a widget by cell.
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
+from PySide6.QtCore import Qt, QSize, QModelIndex
+from PySide6.QtGui import QPainter
+
+from .progressBar import ProgressBar
+from .progressModel import ProgressModel
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+	"""A delegate which paints the cells as a ProgressBar, with `ProgressBar.paint_to`:
+	a single hidden ProgressBar is the renderer of all the cells,
+	its caches (the bar without the loaded part, the font, the texts laid out) are kept while the size of the cells doesn't change.
+
+	The value of a cell is its DisplayRole and its maximum is its `ProgressModel.MaximumRole` (100 if it's None),
+	the minimum is 0. With a ProgressModel, the value and the maximum are read directly in its arrays.
+
+	The views call `paint` only for the visible cells: keep fixed row heights
+	(the default of QTableView, `setUniformItemSizes(True)` for a QListView) so that the size hints
+	of all the rows are not requested.
+
+	Public Methods
+	--------------
+	renderer
+		Return the ProgressBar which paints the cells, to change its style
+	paint
+		Paint the progress bar of a cell
+	sizeHint
+		Return the size hint of a cell
+
+	Protected Attributes
+	--------------------
+	_renderer : ProgressBar
+		The hidden ProgressBar which paints the cells
+	"""
+
+	def __init__(self, parent=None, **options):
+		"""Initialize a ProgressBarDelegate
+
+		Parameters
+		---------
+		OPTIONAL[parent] : QObject
+			The parent of the delegate (the view)
+			Default: None
+		OPTIONAL[options] : dict
+			The arguments of ProgressBar to style the bars (bar_color, color_loaded, pen_color, text_color,
+			borderwidth, rounding, showPercent, showValue)
+		"""
+		super(ProgressBarDelegate, self).__init__(parent)
+		options.pop("parent", None)
+		self._renderer = ProgressBar(**options)
+
+	def renderer(self) -> ProgressBar:
+		"""Return the ProgressBar which paints the cells, to change its style (the view must be updated after)."""
+		return self._renderer
+
+	def _progress(self, index: QModelIndex):
+		"""Return the value and the maximum of a cell."""
+		model = index.model()
+		if isinstance(model, ProgressModel):
+			return model.progress(index.row())
+		value, maximum = index.data(Qt.DisplayRole), index.data(ProgressModel.MaximumRole)
+		return int(value or 0), (100 if maximum is None else int(maximum))
+
+	def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+		widget = option.widget
+		style = widget.style() if widget is not None else QApplication.style()
+		style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)  # background and selection
+
+		value, maximum = self._progress(index)
+		self._renderer.paint_to(painter, option.rect, value, 0, maximum)
+
+	def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+		return QSize(120, max(24, option.fontMetrics.height() + 8))
+
+
+if __name__ == '__main__':
+	import sys
+	import numpy as np
+	from PySide6.QtWidgets import QMainWindow, QTableView, QHeaderView
+	from PySide6.QtCore import QTimer
+
+	class Window(QMainWindow):
+		def __init__(self, tasks: int = 10_000):
+			super().__init__()
+			self.model = ProgressModel(tasks, maximum=np.random.randint(100, 10_000, tasks), parent=self)
+			self.view = QTableView(self)
+			self.view.setModel(self.model)
+			self.view.setItemDelegateForColumn(ProgressModel.PROGRESS_COLUMN, ProgressBarDelegate(self.view, showValue=True))
+			self.view.horizontalHeader().setSectionResizeMode(ProgressModel.PROGRESS_COLUMN, QHeaderView.Stretch)
+			self.view.verticalHeader().setDefaultSectionSize(40)
+			self.setCentralWidget(self.view)
+
+			# 2000 random tasks progress 20 times by second, a single batch by tick
+			self.timer = QTimer(self)
+			self.timer.timeout.connect(self.tick)
+			self.timer.start(50)
+
+		def tick(self):
+			rows = np.random.randint(0, self.model.rowCount(), 2000)
+			self.model.add_progress(rows, np.random.randint(1, 50, rows.size))
+
+	app = QApplication(sys.argv)
+	w = Window()
+	w.resize(600, 800)
+	w.show()
+	sys.exit(app.exec())
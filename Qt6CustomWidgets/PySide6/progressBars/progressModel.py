@@ -0,0 +1,270 @@
+"""
+A compact table model of the progress of many tasks, stored in arrays, to display with a ProgressBarDelegate.
+"""
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class ProgressModel(QAbstractTableModel):
+	"""A table model of tasks with two columns: the name of the task and its progress.
+	The values and the maximums of the tasks are int64 arrays (no Python object by task),
+	the names are generated ("Task <row>") if they are not specified.
+
+	The changes are notified by ranges of rows: a batch of updates of scattered rows
+	emits one dataChanged by run of consecutive rows (or a single one over all the rows changed
+	if there are many runs), the views repaint only the visible rows of these ranges.
+
+	Public Attributes
+	-----------------
+	NAME_COLUMN : int
+		The column of the names
+	PROGRESS_COLUMN : int
+		The column of the progress
+	MaximumRole : int
+		The role of the maximum of a task in the progress column (the DisplayRole is the value)
+
+	Public Methods
+	--------------
+	values
+		Return the array of the values
+	maximums
+		Return the array of the maximums
+	progress
+		Return the value and the maximum of a task
+	set_values
+		Write the values of consecutive tasks
+	set_progress
+		Write the values of scattered tasks
+	add_progress
+		Add increments to the values of tasks
+	notify_changed
+		Emit dataChanged for a range of rows
+	append_tasks
+		Add tasks at the end of the model
+	remove_tasks
+		Remove a range of tasks
+	"""
+	NAME_COLUMN = 0
+	PROGRESS_COLUMN = 1
+	MaximumRole = Qt.UserRole + 1
+
+	# above this number of runs of consecutive rows, a single dataChanged is emitted over all the rows
+	MAX_RANGES = 64
+
+	def __init__(self, count: int = 0, maximum: int = 100, names: list = None, parent=None):
+		"""Initialize a ProgressModel
+
+		Parameters
+		---------
+		OPTIONAL[count] : int
+			The number of tasks
+			Default: 0
+		OPTIONAL[maximum] : Union[int, Sequence[int]]
+			The maximum of the tasks, or the maximum of each task
+			Default: 100
+		OPTIONAL[names] : List[str]
+			The names of the tasks
+			Default: None ("Task <row>")
+		OPTIONAL[parent] : QObject
+			The parent of the model
+			Default: None
+		"""
+		super(ProgressModel, self).__init__(parent)
+		self._values = np.zeros(count, dtype=np.int64)
+		self._maximums = np.empty(count, dtype=np.int64)
+		self._maximums[:] = maximum
+		self._names = list(names) if names is not None else None
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else self._values.size
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else 2
+
+	def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+		row = index.row()
+		if index.column() == self.NAME_COLUMN:
+			if role == Qt.DisplayRole:
+				return self._names[row] if self._names is not None else f"Task {row}"
+		elif role == Qt.DisplayRole or role == Qt.EditRole:
+			return int(self._values[row])
+		elif role == self.MaximumRole:
+			return int(self._maximums[row])
+		return None
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+		if role != Qt.DisplayRole:
+			return None
+		if orientation == Qt.Horizontal:
+			return "Task" if section == self.NAME_COLUMN else "Progress"
+		return str(section)
+
+	def values(self):
+		"""Return the array of the values of the tasks (not a copy: call `notify_changed` after a modification)."""
+		return self._values
+
+	def maximums(self):
+		"""Return the array of the maximums of the tasks (not a copy: call `notify_changed` after a modification)."""
+		return self._maximums
+
+	def progress(self, row: int):
+		"""Return the value and the maximum of the task of a row.
+
+		Parameters
+		---------
+		row : int
+			The row of the task
+
+		Returns
+		-------
+		value : int
+			The value of the task
+		maximum : int
+			The maximum of the task
+		"""
+		return int(self._values[row]), int(self._maximums[row])
+
+	def set_values(self, first_row: int, values):
+		"""Write the values of the tasks from the row first_row (clamped between 0 and the maximum of each task),
+		and emit a single dataChanged for these rows.
+
+		Parameters
+		---------
+		first_row : int
+			The first row to write
+		values : Sequence[int]
+			The new values
+
+		Returns
+		-------
+		None
+		"""
+		values = np.asarray(values)
+		rows = np.s_[first_row:first_row + values.size]
+		self._values[rows] = np.clip(values, 0, self._maximums[rows])
+		if values.size > 0:
+			self.notify_changed(first_row, first_row + values.size - 1)
+
+	def set_progress(self, rows, values):
+		"""Write the values of scattered tasks (clamped between 0 and the maximum of each task),
+		and emit dataChanged by run of consecutive rows.
+
+		Parameters
+		---------
+		rows : Sequence[int]
+			The rows of the tasks
+		values : Union[int, Sequence[int]]
+			The new values, one by row
+
+		Returns
+		-------
+		None
+		"""
+		rows = np.asarray(rows, dtype=np.int64)
+		self._values[rows] = np.clip(values, 0, self._maximums[rows])
+		self._notify_rows(rows)
+
+	def add_progress(self, rows, deltas=1):
+		"""Add increments to the values of tasks (a row can be repeated), clamped between 0 and the maximum of each task,
+		and emit dataChanged by run of consecutive rows.
+
+		Parameters
+		---------
+		rows : Sequence[int]
+			The rows of the tasks
+		OPTIONAL[deltas] : Union[int, Sequence[int]]
+			The increments, one by row
+			Default: 1
+
+		Returns
+		-------
+		None
+		"""
+		rows = np.asarray(rows, dtype=np.int64)
+		np.add.at(self._values, rows, deltas)
+		self._values[rows] = np.clip(self._values[rows], 0, self._maximums[rows])
+		self._notify_rows(rows)
+
+	def _notify_rows(self, rows):
+		"""Emit dataChanged for each run of consecutive rows, or once from the first to the last row
+		if there are more than MAX_RANGES runs."""
+		if rows.size == 0:
+			return
+		rows = np.unique(rows)
+		breaks = np.flatnonzero(np.diff(rows) != 1)
+		if breaks.size >= self.MAX_RANGES:
+			self.notify_changed(int(rows[0]), int(rows[-1]))
+			return
+		starts = np.concatenate([rows[:1], rows[breaks + 1]])
+		ends = np.concatenate([rows[breaks], rows[-1:]])
+		for start, end in zip(starts.tolist(), ends.tolist()):
+			self.notify_changed(start, end)
+
+	def notify_changed(self, first_row: int, last_row: int):
+		"""Emit dataChanged for the progress of a range of rows, after a modification in place of the arrays.
+
+		Parameters
+		---------
+		first_row : int
+			The first row changed
+		last_row : int
+			The last row changed (included)
+
+		Returns
+		-------
+		None
+		"""
+		self.dataChanged.emit(self.index(first_row, self.PROGRESS_COLUMN), self.index(last_row, self.PROGRESS_COLUMN),
+			[Qt.DisplayRole, self.MaximumRole])
+
+	def append_tasks(self, count: int, maximum=100, names: list = None):
+		"""Add tasks at the end of the model, with a value of 0.
+
+		Parameters
+		---------
+		count : int
+			The number of tasks
+		OPTIONAL[maximum] : Union[int, Sequence[int]]
+			The maximum of the tasks, or the maximum of each task
+			Default: 100
+		OPTIONAL[names] : List[str]
+			The names of the tasks (required if the model was created with names)
+			Default: None
+
+		Returns
+		-------
+		None
+		"""
+		if count <= 0:
+			return
+		first = self._values.size
+		maximums = np.empty(count, dtype=np.int64)
+		maximums[:] = maximum
+		self.beginInsertRows(QModelIndex(), first, first + count - 1)
+		self._values = np.concatenate([self._values, np.zeros(count, dtype=np.int64)])
+		self._maximums = np.concatenate([self._maximums, maximums])
+		if self._names is not None:
+			self._names.extend(names if names is not None else (f"Task {row}" for row in range(first, first + count)))
+		self.endInsertRows()
+
+	def remove_tasks(self, first_row: int, last_row: int):
+		"""Remove the tasks from first_row to last_row (included).
+
+		Parameters
+		---------
+		first_row : int
+			The first row to remove
+		last_row : int
+			The last row to remove (included)
+
+		Returns
+		-------
+		None
+		"""
+		self.beginRemoveRows(QModelIndex(), first_row, last_row)
+		self._values = np.delete(self._values, np.s_[first_row:last_row + 1])
+		self._maximums = np.delete(self._maximums, np.s_[first_row:last_row + 1])
+		if self._names is not None:
+			del self._names[first_row:last_row + 1]
+		self.endRemoveRows()
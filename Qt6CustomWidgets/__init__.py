@@ -2,3 +2,10 @@ __version__ = '1.1'
 
 
 from . import PySide6
+
+
+def __getattr__(name: str):
+	"""Forward the public names of Qt6CustomWidgets.PySide6, imported at their first access."""
+	if name in PySide6.__all__:
+		return getattr(PySide6, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
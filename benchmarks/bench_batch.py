@@ -0,0 +1,64 @@
+"""
+Benchmark of the build of a GraphicWidget with 50 line series,
+with and without a batch of updates (GraphicWidget.batch).
+
+The events are processed after each call, as in an application where the chart
+is built while the event loop runs (data received from signals, timers, ...).
+
+Usage:
+	QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_batch
+"""
+
+import sys
+import time
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCharts import QChart
+
+from Qt6CustomWidgets.PySide6.dataVisualization.graphicWidget import GraphicWidget
+
+
+N_SERIES = 50
+N_POINTS = 1_000
+
+
+def build(app: QApplication, graphic: GraphicWidget):
+	x = np.arange(N_POINTS, dtype=np.float64)
+	for i in range(N_SERIES):
+		graphic.add_line_series(f"series {i}", x, np.sin(x / 50 + i) + i, x_axis="x", y_axis="y")
+		if i % 10 == 0:
+			graphic.set_theme(QChart.ChartThemeDark if i % 20 else QChart.ChartThemeLight)
+		app.processEvents()
+
+
+def build_batched(app: QApplication, graphic: GraphicWidget):
+	with graphic.batch():
+		build(app, graphic)
+
+
+def timeit(app: QApplication, function) -> float:
+	graphic = GraphicWidget()
+	graphic.resize(800, 600)
+	graphic.show()
+	app.processEvents()
+	start = time.perf_counter()
+	function(app, graphic)
+	app.processEvents()
+	duration = time.perf_counter() - start
+	graphic.close()
+	return duration
+
+
+def main():
+	app = QApplication.instance() or QApplication(sys.argv)
+	timeit(app, build)  # warm up
+	direct = min(timeit(app, build) for _ in range(3))
+	batched = min(timeit(app, build_batched) for _ in range(3))
+	print(f"{N_SERIES} series of {N_POINTS} points")
+	print(f"without batch: {direct:.4f} s")
+	print(f"with batch:    {batched:.4f} s ({(1 - batched / direct) * 100:.0f}% less)")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of the import of the widgets, with `python -X importtime` in a new interpreter by import:
+the total import time and whether PySide6.QtCharts is loaded.
+
+The package imports its subpackages at the first access to a name (module __getattr__),
+so the progress bars, the buttons and the devTools don't load QtCharts.
+
+Usage:
+	python -m benchmarks.bench_import [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTS = (
+	"import Qt6CustomWidgets",
+	"from Qt6CustomWidgets import ProgressBar",
+	"from Qt6CustomWidgets.PySide6 import ProgressBarDelegate",
+	"from Qt6CustomWidgets.PySide6 import ToggleButtonAnimated",
+	"from Qt6CustomWidgets.PySide6 import QtHandlers, DialogLogger, PlainTextEditHandler",
+	"from Qt6CustomWidgets.PySide6 import GraphicWidget",
+)
+
+
+def import_time(statement: str):
+	"""Run statement in a new interpreter with -X importtime.
+
+	Returns
+	-------
+	total : Union[float, None]
+		The import time of all modules in milliseconds (sum of their self time), None if the import failed
+	modules : Set[str]
+		The modules imported
+	"""
+	env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+	process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+		capture_output=True, text=True, env=env)
+	if process.returncode != 0:
+		return None, set()
+	total, modules = 0, set()
+	for line in process.stderr.splitlines():
+		if not line.startswith("import time:") or "|" not in line:
+			continue
+		self_time, _, name = (field.strip() for field in line[len("import time:"):].split("|"))
+		if not self_time.isdigit():  # the header
+			continue
+		total += int(self_time)
+		modules.add(name)
+	return total / 1000, modules
+
+
+def main(argv=None) -> int:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--repeat", type=int, default=5, help="number of runs by import (the best is kept)")
+	args = parser.parse_args(argv)
+
+	print(f"{'import':<85} {'time':>10}  QtCharts")
+	for statement in IMPORTS:
+		runs = [import_time(statement) for _ in range(args.repeat)]
+		if runs[0][0] is None:
+			print(f"{statement:<85} {'failed':>10}")
+			continue
+		total = min(total for total, _ in runs)
+		qtcharts = "PySide6.QtCharts" in runs[0][1]
+		print(f"{statement:<85} {total:>7.1f} ms  {'yes' if qtcharts else 'no'}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Benchmark of the ingest of XY points:
+the former loop of `QXYSeries.append` by point (kept here as the reference),
+GraphicWidget._add_points_data with Python lists (converted to arrays)
+and with float64 numpy arrays.
+
+Usage:
+	QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_ingest
+"""
+
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QDateTime
+from PySide6 import QtCharts
+
+from Qt6CustomWidgets.PySide6.dataVisualization.graphicWidget import GraphicWidget
+
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+
+def timeit(function, *args, repeat: int = 3):
+	"""Return the best time of `repeat` calls of function."""
+	best = None
+	for _ in range(repeat):
+		start = time.perf_counter()
+		function(*args)
+		duration = time.perf_counter() - start
+		best = duration if best is None else min(best, duration)
+	return best
+
+
+def append_loop(graphic: GraphicWidget, x, y):
+	"""The former _add_points_data: a `series.append` by point."""
+	series = QtCharts.QLineSeries()
+	for X, Y in zip(x, y):
+		if isinstance(X, (QDateTime, datetime)):
+			if isinstance(X, datetime):
+				X = QDateTime(X)
+			series.append(X.toMSecsSinceEpoch(), float(Y))
+		elif isinstance(Y, (QDateTime, datetime)):
+			if isinstance(Y, datetime):
+				Y = QDateTime(Y)
+			series.append(float(X), Y.toMSecsSinceEpoch())
+		else:
+			series.append(float(X), float(Y))
+
+
+def ingest(graphic: GraphicWidget, x, y):
+	graphic._add_points_data(QtCharts.QLineSeries(), x, y)
+
+
+def main():
+	app = QApplication.instance() or QApplication(sys.argv)
+	graphic = GraphicWidget()
+
+	print(f"{'points':>10} | {'append loop (s)':>15} | {'lists (s)':>10} | {'numpy (s)':>10} | {'speedup':>8}")
+	for size in SIZES:
+		x = np.arange(size, dtype=np.float64)
+		y = np.sin(x / 100)
+		x_list, y_list = x.tolist(), y.tolist()
+		loop_time = timeit(append_loop, graphic, x_list, y_list, repeat=1 if size >= 1_000_000 else 3)
+		list_time = timeit(ingest, graphic, x_list, y_list)
+		numpy_time = timeit(ingest, graphic, x, y)
+		print(f"{size:>10} | {loop_time:>15.4f} | {list_time:>10.4f} | {numpy_time:>10.4f} | {loop_time / numpy_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+	main()
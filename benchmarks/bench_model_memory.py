@@ -0,0 +1,64 @@
+"""
+Memory comparison of a GraphicWidget line series built from Python lists
+(the data is kept in numpy for analysis and copied in lists for the chart)
+and a series added with add_model_series on an ArrayTableModel over the same numpy arrays
+(the columns are read in one step, without QVXYModelMapper).
+
+The Python allocations are measured with tracemalloc (numpy arrays included).
+In both paths the QLineSeries keeps its own copy of the points (QPointF, on the C++ side),
+which is not measured.
+
+Usage:
+	QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_model_memory
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from Qt6CustomWidgets.PySide6.dataVisualization import GraphicWidget, ArrayTableModel
+
+
+SIZE = 100_000
+
+
+def list_path(graphic: GraphicWidget, x, y):
+	x_list, y_list = x.tolist(), y.tolist()
+	graphic.add_line_series("lists", x_list, y_list)
+	return x_list, y_list  # the lists are kept by the application
+
+
+def model_path(graphic: GraphicWidget, x, y):
+	model = ArrayTableModel([x, y])
+	graphic.add_model_series("model", model)
+	return model
+
+
+def measure(function, x, y):
+	graphic = GraphicWidget()
+	tracemalloc.start()
+	start = time.perf_counter()
+	kept = function(graphic, x, y)
+	duration = time.perf_counter() - start
+	current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del kept
+	return current, peak, duration
+
+
+def main():
+	app = QApplication.instance() or QApplication(sys.argv)
+	x = np.arange(SIZE, dtype=np.float64)
+	y = np.sin(x / 100)
+	print(f"{SIZE} points, numpy arrays: {(x.nbytes + y.nbytes) / 2**20:.2f} MiB (kept by the application)")
+	print(f"{'path':>6} | {'retained (MiB)':>14} | {'peak (MiB)':>10} | {'time (s)':>8}")
+	for name, function in (("lists", list_path), ("model", model_path)):
+		current, peak, duration = measure(function, x, y)
+		print(f"{name:>6} | {current / 2**20:>14.2f} | {peak / 2**20:>10.2f} | {duration:>8.3f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of the repaint of a ProgressBar updated at each frame (60 fps animation of a download):
+the value is set before each frame and the events are processed, so only the dirty region is painted.
+The cost of a frame (setValue and the repaint) and of the paint event alone are measured,
+with a full repaint of the widget at each frame for comparison (update() of the whole widget).
+
+Usage:
+	QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_progress
+"""
+
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from Qt6CustomWidgets.PySide6.progressBars.progressBar import ProgressBar
+from Qt6CustomWidgets.PySide6.dataVisualization.chartMetrics import PaintTimer, new_metrics
+
+
+FRAMES = 3000
+SCENARIOS = (
+	# label, options of ProgressBar, size, value of the frame i
+	("0-100, percent", {}, (600, 60), lambda i: i % 101),
+	("0-100000, percent and value", {"maximum": 100_000, "showValue": True}, (600, 60), lambda i: i),
+	("0-100, percent, rounded, 1200x120", {"rounding": 12.}, (1200, 120), lambda i: i % 101),
+)
+
+
+def run(app: QApplication, options: dict, size: tuple, value, full: bool):
+	"""Return the cost of a frame and of a paint in microseconds, and the mean area repainted by frame (pixels)."""
+	progress = ProgressBar(**options)
+	progress.resize(*size)
+	progress.show()
+	for i in range(100):  # warm up
+		progress.setValue(value(i))
+		app.processEvents()
+	metrics = new_metrics()
+	timer = PaintTimer(metrics)
+	timer.install(progress)
+
+	start = time.perf_counter()
+	for i in range(100, FRAMES + 100):
+		progress.setValue(value(i))
+		if full:
+			progress.update()
+		app.processEvents()
+	duration = time.perf_counter() - start
+	timer.remove()
+	progress.close()
+	paint_ms = metrics["timings"].get("paint", {}).get("total_ms", 0.)
+	return duration / FRAMES * 1e6, paint_ms / max(1, timer.paints) * 1e3, timer.area / FRAMES
+
+
+def main():
+	app = QApplication.instance() or QApplication(sys.argv)
+	print(f"{FRAMES} frames by scenario (budget of a frame at 60 fps: 16667 us)")
+	for label, options, size, value in SCENARIOS:
+		for full in (True, False):
+			frame, paint, area = run(app, options, size, value, full)
+			mode = "full repaint" if full else "dirty region"
+			print(f"{label:<36} {mode:<13} frame {frame:7.1f} us  paint {paint:7.1f} us  {area:8.0f} px/frame")
+
+
+if __name__ == "__main__":
+	main()
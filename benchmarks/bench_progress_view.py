@@ -0,0 +1,117 @@
+"""
+Benchmark of the display of thousands of tasks: a ProgressBar widget by task in a QScrollArea,
+against a QTableView of a ProgressModel painted by a ProgressBarDelegate.
+The creation (until the first paint) and an update of the progress of all the tasks are measured,
+with the number of bars painted by update (the view paints only the visible rows).
+
+Usage:
+	QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_progress_view [--tasks 10000]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+from PySide6.QtWidgets import QApplication, QScrollArea, QWidget, QVBoxLayout, QTableView
+
+from Qt6CustomWidgets.PySide6.progressBars.progressBar import ProgressBar
+from Qt6CustomWidgets.PySide6.progressBars.progressModel import ProgressModel
+from Qt6CustomWidgets.PySide6.progressBars.progressBarDelegate import ProgressBarDelegate
+
+
+SIZE = (600, 800)
+ROW_HEIGHT = 30
+UPDATES = 20
+
+
+class CountingDelegate(ProgressBarDelegate):
+	"""A ProgressBarDelegate which counts the cells painted."""
+
+	def __init__(self, parent=None, **options):
+		super(CountingDelegate, self).__init__(parent, **options)
+		self.paints = 0
+
+	def paint(self, painter, option, index):
+		self.paints += 1
+		super(CountingDelegate, self).paint(painter, option, index)
+
+
+def run_widgets(app: QApplication, tasks: int):
+	"""Return the creation time (s), the time of an update (ms) and the bars painted by update."""
+	start = time.perf_counter()
+	area = QScrollArea()
+	content = QWidget()
+	layout = QVBoxLayout(content)
+	bars = []
+	for _ in range(tasks):
+		bar = ProgressBar(maximum=1000)
+		bar.setFixedHeight(ROW_HEIGHT)
+		layout.addWidget(bar)
+		bars.append(bar)
+	area.setWidget(content)
+	area.setWidgetResizable(True)
+	area.resize(*SIZE)
+	area.show()
+	app.processEvents()
+	creation = time.perf_counter() - start
+
+	painted = [0]
+	count = lambda: painted.__setitem__(0, painted[0] + 1)
+	for bar in bars:
+		bar.paintEvent = lambda e, bar=bar, paint=bar.paintEvent: (count(), paint(e))
+	start = time.perf_counter()
+	for i in range(1, UPDATES + 1):
+		for bar in bars:
+			bar.setValue(i * 10)
+		app.processEvents()
+	update = (time.perf_counter() - start) / UPDATES * 1000
+	area.close()
+	area.deleteLater()
+	app.processEvents()
+	return creation, update, painted[0] / UPDATES
+
+
+def run_view(app: QApplication, tasks: int):
+	"""Return the creation time (s), the time of an update (ms) and the bars painted by update."""
+	start = time.perf_counter()
+	model = ProgressModel(tasks, maximum=1000)
+	view = QTableView()
+	view.setModel(model)
+	delegate = CountingDelegate(view)
+	view.setItemDelegateForColumn(ProgressModel.PROGRESS_COLUMN, delegate)
+	view.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+	view.setColumnWidth(ProgressModel.PROGRESS_COLUMN, SIZE[0] - 150)
+	view.resize(*SIZE)
+	view.show()
+	app.processEvents()
+	creation = time.perf_counter() - start
+
+	rows = np.arange(tasks)
+	delegate.paints = 0
+	start = time.perf_counter()
+	for i in range(1, UPDATES + 1):
+		model.set_progress(rows, i * 10)
+		app.processEvents()
+	update = (time.perf_counter() - start) / UPDATES * 1000
+	view.close()
+	view.deleteLater()
+	app.processEvents()
+	return creation, update, delegate.paints / UPDATES
+
+
+def main(argv=None) -> int:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--tasks", type=int, default=10_000, help="number of tasks")
+	args = parser.parse_args(argv)
+
+	app = QApplication.instance() or QApplication(sys.argv)
+	print(f"{args.tasks} tasks, {UPDATES} updates of all the tasks")
+	for label, run in (("a ProgressBar by task", run_widgets), ("QTableView and delegate", run_view)):
+		creation, update, painted = run(app, args.tasks)
+		print(f"{label:<24} creation {creation:7.3f} s  update {update:8.2f} ms  {painted:7.0f} bars painted/update")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Performance benchmark suite of the widgets, run with the offscreen QPA platform.
+
+Measured:
+ * GraphicWidget: add_line_series, add_scatter_series, add_bar_series and add_pie_series at growing sizes
+ * paintEvent of ProgressBar, ToggleButtonAnimated and CircularProgress over N frames
+ * QtStreamHandler throughput in records per second
+
+The results are written in JSON and compared with a baseline file:
+a benchmark slower than baseline * (1 + threshold) is a regression and the exit code is 1.
+
+Usage:
+	python -m benchmarks.suite [--output results.json] [--baseline benchmarks/baseline.json]
+		[--threshold 0.25] [--save-baseline] [--quick]
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+
+import numpy as np
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
+from PySide6.QtGui import QImage
+
+from Qt6CustomWidgets.PySide6.dataVisualization.graphicWidget import GraphicWidget
+from Qt6CustomWidgets.PySide6.progressBars.progressBar import ProgressBar
+from Qt6CustomWidgets.PySide6.progressBars.circularProgressBar import CircularProgress
+from Qt6CustomWidgets.PySide6.buttons.toggleButtonAnimated import ToggleButtonAnimated
+from Qt6CustomWidgets.PySide6.devTools.QtHandlers import QtStreamHandler
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+XY_SIZES = (1_000, 10_000, 100_000)
+CATEGORY_SIZES = (10, 100, 1_000)
+FRAMES = 500
+RECORDS = 5_000
+
+
+def best_time(function, repeat: int = 3, setup=None) -> float:
+	"""Return the best time of `repeat` calls of function (in seconds).
+	If setup is specified, function is called with the result of setup (not timed)."""
+	best = None
+	for _ in range(repeat):
+		args = () if setup is None else (setup(),)
+		start = time.perf_counter()
+		function(*args)
+		duration = time.perf_counter() - start
+		best = duration if best is None else min(best, duration)
+	return best
+
+
+def bench_graphic(quick: bool = False) -> dict:
+	"""Time the add_*_series methods of GraphicWidget (seconds per call)."""
+	results = {}
+	xy_sizes = XY_SIZES[:2] if quick else XY_SIZES
+	category_sizes = CATEGORY_SIZES[:2] if quick else CATEGORY_SIZES
+
+	for size in xy_sizes:
+		x = np.arange(size, dtype=np.float64)
+		y = np.sin(x / 100)
+		results[f"graphic.add_line_series[{size}]"] = best_time(lambda graphic: graphic.add_line_series("s", x, y), setup=GraphicWidget)
+		results[f"graphic.add_scatter_series[{size}]"] = best_time(lambda graphic: graphic.add_scatter_series("s", x, y), setup=GraphicWidget)
+
+	for size in category_sizes:
+		labels = [f"c{i}" for i in range(size)]
+		sets = {f"set {i}": list(range(i, size + i)) for i in range(3)}
+		pie = {label: i + 1 for i, label in enumerate(labels)}
+		results[f"graphic.add_bar_series[{size}]"] = best_time(lambda graphic: graphic.add_bar_series("s", sets, labels), setup=GraphicWidget)
+		results[f"graphic.add_pie_series[{size}]"] = best_time(lambda graphic: graphic.add_pie_series("s", pie), setup=GraphicWidget)
+	return results
+
+
+def paint_frames(widget, frames: int, step):
+	"""Render `frames` frames of widget in an image, `step(i)` changes the state of widget before each frame."""
+	image = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+	for i in range(frames):
+		step(i)
+		widget.render(image)
+
+
+def bench_paint(quick: bool = False) -> dict:
+	"""Time the paintEvent of the widgets (seconds per frame)."""
+	frames = FRAMES // 5 if quick else FRAMES
+	results = {}
+
+	progress = ProgressBar(showPercent=True, showValue=True)
+	progress.resize(300, 40)
+	results["paint.ProgressBar"] = best_time(
+		lambda: paint_frames(progress, frames, lambda i: progress.setValue(i % 101))) / frames
+
+	toggle = ToggleButtonAnimated()
+	toggle.resize(58, 45)
+	results["paint.ToggleButtonAnimated"] = best_time(
+		lambda: paint_frames(toggle, frames, lambda i: setattr(toggle, "handlePosition", (i % 100) / 100))) / frames
+
+	circular = CircularProgress()
+	circular.resize(200, 200)
+	results["paint.CircularProgress"] = best_time(
+		lambda: paint_frames(circular, frames, lambda i: setattr(circular, "_value", i % 360))) / frames
+	return results
+
+
+def bench_handler(quick: bool = False) -> dict:
+	"""Measure the throughput of QtStreamHandler (records per second)."""
+	records = RECORDS // 5 if quick else RECORDS
+	plain_text = QPlainTextEdit()
+	handler = QtStreamHandler(plain_text)
+	logger = logging.getLogger("benchmarks.QtStreamHandler")
+	logger.propagate = False
+	logger.setLevel(logging.INFO)
+	logger.addHandler(handler)
+
+	def log():
+		plain_text.clear()
+		for i in range(records):
+			logger.info("record %d", i)
+
+	duration = best_time(log)
+	logger.removeHandler(handler)
+	return {"handler.QtStreamHandler": records / duration}
+
+
+def higher_is_better(name: str) -> bool:
+	return name.startswith("handler.")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+	"""Return the regressions: (name, result, baseline value, ratio)."""
+	regressions = []
+	for name, value in results.items():
+		reference = baseline.get(name)
+		if not reference:
+			continue
+		ratio = reference / value if higher_is_better(name) else value / reference
+		if ratio > 1 + threshold:
+			regressions.append((name, value, reference, ratio))
+	return regressions
+
+
+def main(argv=None) -> int:
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--output", default=None, help="JSON file where results are written")
+	parser.add_argument("--baseline", default=BASELINE, help="JSON file of the baseline results")
+	parser.add_argument("--threshold", type=float, default=0.25, help="tolerated slowdown (0.25 = 25%%)")
+	parser.add_argument("--save-baseline", action="store_true", help="write the results in the baseline file")
+	parser.add_argument("--quick", action="store_true", help="smaller sizes, for a fast check")
+	args = parser.parse_args(argv)
+
+	app = QApplication.instance() or QApplication(sys.argv)
+	results = {}
+	for bench in (bench_graphic, bench_paint, bench_handler):
+		results.update(bench(args.quick))
+
+	report = {
+		"python": platform.python_version(),
+		"pyside6": PYSIDE_VERSION,
+		"platform": platform.platform(),
+		"results": results,
+	}
+	for name, value in results.items():
+		unit = "records/s" if higher_is_better(name) else "s"
+		print(f"{name:<40} {value:>14.6g} {unit}")
+
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as file:
+			json.dump(report, file, indent=2)
+	if args.save_baseline:
+		with open(args.baseline, "w", encoding="utf-8") as file:
+			json.dump(report, file, indent=2)
+		return 0
+
+	if not os.path.exists(args.baseline):
+		print(f"No baseline file '{args.baseline}', run with --save-baseline to create it.")
+		return 0
+	with open(args.baseline, "r", encoding="utf-8") as file:
+		baseline = json.load(file)["results"]
+	regressions = compare(results, baseline, args.threshold)
+	for name, value, reference, ratio in regressions:
+		print(f"REGRESSION {name}: {value:.6g} vs baseline {reference:.6g} ({(ratio - 1) * 100:.0f}% worse)")
+	if not regressions:
+		print(f"No regression compared to the baseline (threshold: {args.threshold * 100:.0f}%).")
+	return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
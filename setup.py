@@ -29,5 +29,10 @@ setup(
         "Topic :: Qt6 :: PySide6",
     ],
     license='MIT',
-    packages = find_packages()
+    packages = find_packages(),
+    install_requires=['PySide6', 'numpy'],
+    extras_require={
+        'pandas': ['pandas'],
+        'pyarrow': ['pyarrow'],
+    },
     )
@@ -0,0 +1,97 @@
+"""
+Tests of the decimation of the downsampled series: the isolated spikes must be kept.
+
+Usage:
+	python -m pytest tests
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from Qt6CustomWidgets.PySide6.dataVisualization.decimation import min_max, lttb, decimate, METHODS
+from Qt6CustomWidgets.PySide6.dataVisualization.graphicWidget import GraphicWidget
+
+
+SPIKES = {1234: 15., 500_001: -12., 999_000: 9.}
+
+
+def signal(size: int = 1_000_000):
+	"""Return a slow sine with isolated spikes (one point each)."""
+	x = np.arange(size, dtype=np.float64)
+	y = np.sin(x / 5000)
+	y[list(SPIKES)] = list(SPIKES.values())
+	return x, y
+
+
+class SpikesTestCase(unittest.TestCase):
+
+	def assertSpikesKept(self, x_kept, y_kept):
+		for row, value in SPIKES.items():
+			self.assertIn(row, x_kept)
+			self.assertEqual(y_kept[np.flatnonzero(x_kept == row)[0]], value)
+
+
+class TestDecimation(SpikesTestCase):
+
+	def test_min_max_keeps_spikes(self):
+		x_kept, y_kept = min_max(*signal(), 650)
+		self.assertLessEqual(x_kept.size, 2 * 650 + 2)
+		self.assertSpikesKept(x_kept, y_kept)
+
+	def test_lttb_keeps_spikes(self):
+		x_kept, y_kept = lttb(*signal(), 1300)
+		self.assertEqual(x_kept.size, 1300)
+		self.assertSpikesKept(x_kept, y_kept)
+
+	def test_decimate_keeps_spikes_at_any_width(self):
+		x, y = signal()
+		for method in METHODS:
+			for width in (50, 333, 1920):
+				with self.subTest(method=method, width=width):
+					self.assertSpikesKept(*decimate(x, y, width, method))
+
+	def test_small_series_unchanged(self):
+		x, y = np.arange(10.), np.arange(10.)
+		for method in METHODS:
+			x_kept, y_kept = decimate(x, y, 100, method)
+			np.testing.assert_array_equal(x_kept, x)
+			np.testing.assert_array_equal(y_kept, y)
+
+
+class TestDownsampledSeries(SpikesTestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		cls.app = QApplication.instance() or QApplication([])
+
+	def points(self, graphic: GraphicWidget, name: str):
+		points = graphic._series[name].points()
+		return np.array([point.x() for point in points]), np.array([point.y() for point in points])
+
+	def test_spikes_kept_after_resize(self):
+		for method in METHODS:
+			with self.subTest(method=method):
+				graphic = GraphicWidget()
+				graphic.resize(900, 600)
+				graphic.add_line_series("signal", *signal(), downsample=method)
+				graphic.show()
+				self.app.processEvents()
+				self.assertSpikesKept(*self.points(graphic, "signal"))
+				for width, height in ((400, 300), (1400, 700)):
+					graphic.resize(width, height)
+					self.app.processEvents()
+					x_kept, y_kept = self.points(graphic, "signal")
+					# decimated again for the new width of the plot
+					self.assertLessEqual(x_kept.size, 2 * graphic._plot_width() + 2)
+					self.assertGreater(x_kept.size, graphic._plot_width())
+					self.assertSpikesKept(x_kept, y_kept)
+				graphic.close()
+
+
+if __name__ == "__main__":
+	unittest.main()
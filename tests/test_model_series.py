@@ -0,0 +1,80 @@
+"""
+Tests of the series mapped on a model with `GraphicWidget.add_model_series`.
+
+Usage:
+	python -m pytest tests
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+
+from Qt6CustomWidgets.PySide6.dataVisualization import GraphicWidget, ArrayTableModel
+
+
+class TestModelSeries(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		cls.app = QApplication.instance() or QApplication([])
+
+	def ranges(self, graphic: GraphicWidget, name: str):
+		return {axis.orientation(): (axis.min(), axis.max()) for axis in graphic._series[name].attachedAxes()}
+
+	def test_array_model(self):
+		graphic = GraphicWidget()
+		x = np.arange(100_000, dtype=np.float64)
+		model = ArrayTableModel([x, np.sin(x / 100)])
+		self.assertIsNone(graphic.add_model_series("model", model))
+		self.assertEqual(graphic._series["model"].count(), x.size)
+		self.assertEqual(self.ranges(graphic, "model")[Qt.Horizontal], (0., x[-1]))
+
+		model.set_values(1, 10, [50.])
+		self.assertEqual(graphic._series["model"].at(10).y(), 50.)
+		self.assertEqual(self.ranges(graphic, "model")[Qt.Vertical][1], 50.)
+
+		model.set_columns([x[:10] * 2, np.ones(10)])
+		self.assertEqual(graphic._series["model"].count(), 10)
+		self.assertEqual(self.ranges(graphic, "model")[Qt.Horizontal], (0., 18.))
+
+	def test_array_model_of_lists(self):
+		graphic = GraphicWidget()
+		graphic.add_model_series("lists", ArrayTableModel([[0., 1., 2.], [5., 3., 4.]]))
+		self.assertEqual(graphic._series["lists"].count(), 3)
+		self.assertEqual(self.ranges(graphic, "lists"), {Qt.Horizontal: (0., 2.), Qt.Vertical: (3., 5.)})
+
+	def test_array_model_rows_changed(self):
+		graphic = GraphicWidget()
+		model = ArrayTableModel([[0., 1., 2., 3.], [5., 3., 4., 1.]])
+		graphic.add_model_series("rows", model)
+		model.set_values(1, 2, [9.])  # a single row: only its point is replaced
+		self.assertEqual([point.y() for point in graphic._series["rows"].points()], [5., 3., 9., 1.])
+		self.assertEqual(graphic._points_data["rows"][1].tolist(), [5., 3., 9., 1.])
+		self.assertEqual(self.ranges(graphic, "rows")[Qt.Vertical], (1., 9.))
+		model.set_values(1, 0, [2., 8.])  # several rows: the columns are read again
+		self.assertEqual([point.y() for point in graphic._series["rows"].points()], [2., 8., 9., 1.])
+		self.assertEqual(self.ranges(graphic, "rows")[Qt.Vertical], (1., 9.))
+
+	def test_item_model(self):
+		model = QStandardItemModel()
+		for row in range(5):
+			model.appendRow([QStandardItem(), QStandardItem()])
+			model.setData(model.index(row, 0), float(row))
+			model.setData(model.index(row, 1), float(row * row))
+		graphic = GraphicWidget()
+		self.assertIsNotNone(graphic.add_model_series("items", model))
+		self.assertEqual(self.ranges(graphic, "items"), {Qt.Horizontal: (0., 4.), Qt.Vertical: (0., 16.)})
+
+		model.setData(model.index(2, 1), 100.)
+		self.assertEqual(graphic._series["items"].at(2).y(), 100.)
+		self.assertEqual(self.ranges(graphic, "items")[Qt.Vertical], (0., 100.))
+
+
+if __name__ == "__main__":
+	unittest.main()